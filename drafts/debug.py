@@ -52,14 +52,14 @@ def point_and_shoot():
     cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_NORMAL)  # Create the window outside the loop
     cv2.setMouseCallback(WINDOW_NAME, click_event)  # Set mouse callback once
 
-    finder = LaserFinder()
+    DEBUG = True
+    finder = LaserFinder(debug=DEBUG)
     tracker = TrackerControl("192.168.2.11", 10, 5)
 
     coeffs = (20.0, 5.0)
     calibrator = Calibrator(camera, finder, tracker)
     # if calibrator.calibrate():
     #    coeffs = (calibrator.px_per_angle_h, calibrator.px_per_angle_v)
-    DEBUG = True
 
     while True:
         cpt += 1
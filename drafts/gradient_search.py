@@ -1,56 +1,189 @@
+import math
 import cv2
 import numpy as np
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from scipy.spatial import cKDTree
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 # Generato da https://www.mdpi.com/1424-8220/14/11/20112 con ChatGPT
 
+__all__ = [
+    "compute_gradients",
+    "accumulate_candidates_vectorized",
+    "candidates_to_dicts",
+    "group_candidates",
+    "detect_laser_spots",
+    "draw_candidates",
+    "test_gradient",
+]
+
+# Output buffers of compute_gradients, keyed by image shape and reused across frames.
+_gradient_buffers: dict = {}
+
+
+class _Scratch:
+    """Frame-sized work buffers of detect_laser_spots, reused across frames of the same shape."""
+
+    def __init__(self, shape: tuple):
+        self.gray = np.empty(shape, np.float32)
+        self.gray_dil = np.empty(shape, np.uint8)
+        self.acc = np.empty(shape, np.uint16)
+        self.acc_dil = np.empty(shape, np.uint16)
+        # Border-padded accumulator and its integral image, sized for the last R used.
+        self.acc_pad = None
+        self.acc_sat = None
+
+    def integral_buffers(self, pad: int) -> tuple:
+        height, width = self.acc.shape
+        padded_shape = (height + 2 * pad, width + 2 * pad)
+        if self.acc_pad is None or self.acc_pad.shape != padded_shape:
+            self.acc_pad = np.empty(padded_shape, np.uint16)
+            self.acc_sat = np.empty((padded_shape[0] + 1, padded_shape[1] + 1), np.float64)
+        return self.acc_pad, self.acc_sat
+
+
+_scratch_buffers: dict = {}
+
+
+def _get_scratch(shape: tuple) -> _Scratch:
+    scratch = _scratch_buffers.get(shape)
+    if scratch is None:
+        scratch = _Scratch(shape)
+        _scratch_buffers[shape] = scratch
+    return scratch
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sobel(gray, gx, gy):
+        """
+        Fused 3x3 Sobel in x and y: reads the stencil once per pixel.
+        The border is reflected (BORDER_REFLECT_101) as cv2.Sobel does by default.
+        """
+        height, width = gray.shape
+        for y in prange(height):
+            ym = y - 1 if y > 0 else min(1, height - 1)
+            yp = y + 1 if y < height - 1 else max(height - 2, 0)
+            for x in range(width):
+                xm = x - 1 if x > 0 else min(1, width - 1)
+                xp = x + 1 if x < width - 1 else max(width - 2, 0)
+                tl = gray[ym, xm]
+                tm = gray[ym, x]
+                tr = gray[ym, xp]
+                ml = gray[y, xm]
+                mr = gray[y, xp]
+                bl = gray[yp, xm]
+                bm = gray[yp, x]
+                br = gray[yp, xp]
+                gx[y, x] = -tl + tr - 2.0 * ml + 2.0 * mr - bl + br
+                gy[y, x] = -tl - 2.0 * tm - tr + bl + 2.0 * bm + br
+
+    @njit(cache=True)
+    def _vote(gx, gy, R, Th, acc):
+        """
+        Native vote scatter: each pixel above Th votes along its gradient direction for radii 1..R.
+        Runs serially so that every vote is counted exactly once.
+        """
+        height, width = gx.shape
+        th2 = Th * Th
+        for y in range(height):
+            for x in range(width):
+                mag2 = gx[y, x] * gx[y, x] + gy[y, x] * gy[y, x]
+                if mag2 > th2:
+                    inv = 1.0 / math.sqrt(mag2)
+                    ux = gx[y, x] * inv
+                    uy = gy[y, x] * inv
+                    for r in range(1, R + 1):
+                        cx = x + int(round(r * ux))
+                        cy = y + int(round(r * uy))
+                        if 0 <= cx < width and 0 <= cy < height:
+                            acc[cy, cx] += 1
+
 
 def compute_gradients(image: cv2.UMat) -> tuple:
     """
     Compute the gradients of the input image using Sobel operators.
+    Uses a single fused Numba pass when available; the returned arrays are
+    then reused by the next call with the same image shape.
     Returns:
-      - mag: gradient magnitude (float32)
-      - angle: gradient orientation in radians (float32)
+      - gx: gradient along x (float32)
+      - gy: gradient along y (float32)
     """
-    # Compute gradients in x and y directions.
-    grad_x = cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize=3)
-    grad_y = cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize=3)
+    if NUMBA_AVAILABLE:
+        buffers = _gradient_buffers.get(image.shape)
+        if buffers is None:
+            buffers = (np.empty(image.shape, np.float32), np.empty(image.shape, np.float32))
+            _gradient_buffers[image.shape] = buffers
+        gx, gy = buffers
+        _sobel(np.ascontiguousarray(image, dtype=np.float32), gx, gy)
+        return gx, gy
 
-    # Compute magnitude and angle (in radians)q
-    mag, angle = cv2.cartToPolar(grad_x, grad_y, angleInDegrees=False)
-    return mag, angle
+    # Compute gradients in x and y directions.
+    gx = cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize=3)
+    gy = cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize=3)
+    return gx, gy
 
 
-def accumulate_candidates_vectorized(mag: cv2.UMat, angle: np.nparray, R: int, Th: float) -> cv2.UMat:
+def accumulate_candidates_vectorized(
+    gx: np.ndarray, gy: np.ndarray, R: int, Th: float, acc: np.ndarray = None
+) -> np.ndarray:
     """
     Create an accumulator image using vectorized operations.
     For every pixel (x,y) with gradient magnitude > Th, a vote is added
     to each candidate center computed along the gradient direction for radii 1...R.
+    The magnitude is compared squared, and the direction is normalized only for
+    the pixels above threshold.
 
     Args:
-      mag: gradient magnitude (2D numpy array)
-      angle: gradient orientation (2D numpy array, in radians)
+      gx: gradient along x (2D numpy array)
+      gy: gradient along y (2D numpy array)
       R: maximum expected radius (integer)
       Th: magnitude threshold (float)
+      acc: optional uint16 buffer to accumulate into, it is zeroed first
 
     Returns:
-      acc: accumulator array (same shape as input image, dtype=uint32)
+      acc: accumulator array (same shape as input image, dtype=uint16)
     """
-    height, width = mag.shape
-    acc = np.zeros((height, width), dtype=np.uint32)
+    # Only pixels within R of a cell can vote for it, each at most R times: far below 65535
+    # for laser-sized radii, so uint16 halves the memory traffic of the accumulator passes.
+    height, width = gx.shape
+    if acc is None:
+        acc = np.zeros((height, width), dtype=np.uint16)
+    else:
+        acc.fill(0)
+
+    if NUMBA_AVAILABLE:
+        _vote(gx, gy, R, Th, acc)
+        return acc
 
     # Find indices of pixels where the gradient magnitude exceeds the threshold.
-    ys, xs = np.where(mag > Th)
+    mag2 = gx * gx + gy * gy
+    ys, xs = np.where(mag2 > Th * Th)
     if len(xs) == 0:
         return acc  # No votes if no pixel passes threshold.
 
-    # Get corresponding gradient angles.
-    valid_angles = angle[ys, xs]
+    # Unit gradient direction, computed once for all radii.
+    inv = 1.0 / np.sqrt(mag2[ys, xs])
+    ux = gx[ys, xs] * inv
+    uy = gy[ys, xs] * inv
 
     # For each radius from 1 to R, compute candidate positions and vote.
     for r in range(1, R + 1):
         # Compute offset for each valid pixel
-        offset_x = np.round(r * np.cos(valid_angles)).astype(np.int32)
-        offset_y = np.round(r * np.sin(valid_angles)).astype(np.int32)
+        offset_x = np.rint(r * ux).astype(np.int32)
+        offset_y = np.rint(r * uy).astype(np.int32)
 
         candidate_x = xs + offset_x
         candidate_y = ys + offset_y
@@ -66,45 +199,92 @@ def accumulate_candidates_vectorized(mag: cv2.UMat, angle: np.nparray, R: int, T
     return acc
 
 
-def group_candidates(candidates, group_radius=5) -> list[dict]:
+def _grid_neighbours(positions: np.ndarray, group_radius: float) -> list[list[int]]:
+    """
+    For each position, the indices of the positions within group_radius (itself included).
+    Spatial hash: only positions in the 3x3 neighbouring cells are compared.
+    """
+    cell_size = max(group_radius, 1)
+    radius2 = group_radius * group_radius
+    cells: dict = {}
+    keys = [(int(x // cell_size), int(y // cell_size)) for x, y in positions]
+    for idx, key in enumerate(keys):
+        cells.setdefault(key, []).append(idx)
+
+    neighbours = []
+    for (bx, by), (cell_x, cell_y) in zip(positions, keys):
+        close = []
+        for nx in (cell_x - 1, cell_x, cell_x + 1):
+            for ny in (cell_y - 1, cell_y, cell_y + 1):
+                for idx in cells.get((nx, ny), ()):
+                    dx, dy = positions[idx][0] - bx, positions[idx][1] - by
+                    if dx * dx + dy * dy <= radius2:
+                        close.append(idx)
+        neighbours.append(close)
+    return neighbours
+
+
+def candidates_to_dicts(xs: np.ndarray, ys: np.ndarray, weights: np.ndarray) -> list[dict]:
+    """
+    Converts candidate arrays to the list of dicts {'position': (x,y), 'weight': weight}
+    expected by callers of the former API.
+    """
+    return [{"position": (int(x), int(y)), "weight": int(w)} for x, y, w in zip(xs, ys, weights)]
+
+
+def group_candidates(xs: np.ndarray, ys: np.ndarray, weights: np.ndarray, group_radius=5) -> tuple:
     """
     Group nearby candidates that are within group_radius pixels.
     Merges candidates by computing the weighted average of their positions and
     summing their weights.
 
     Args:
-      candidates: list of candidate dicts {'position': (x,y), 'weight': weight}
+      xs, ys: candidate coordinates (1D arrays)
+      weights: candidate weights (1D array)
       group_radius: maximum distance for candidates to be considered overlapping.
 
     Returns:
-      grouped: list of grouped candidate dicts.
+      (xs, ys, weights): grouped candidates as int32 arrays, sorted by descending weight.
     """
-    grouped = []
-    candidates = candidates.copy()  # shallow copy of list
-    while candidates:
-        # Pop the first candidate.
-        base = candidates.pop(0)
-        bx, by = base["position"]
-        cluster = [base]
-        remain = []
-        for cand in candidates:
-            cx, cy = cand["position"]
-            if np.hypot(cx - bx, cy - by) <= group_radius:
-                cluster.append(cand)
-            else:
-                remain.append(cand)
-        candidates = remain
-
-        total_weight = sum(c["weight"] for c in cluster)
-        if total_weight == 0:
-            avg_x, avg_y = bx, by
-        else:
-            avg_x = sum(c["position"][0] * c["weight"] for c in cluster) / total_weight
-            avg_y = sum(c["position"][1] * c["weight"] for c in cluster) / total_weight
-        grouped.append({"position": (int(round(avg_x)), int(round(avg_y))), "weight": total_weight})
-    # Optionally, sort the grouped candidates by weight.
-    grouped = sorted(grouped, key=lambda c: c["weight"], reverse=True)
-    return grouped
+    if len(xs) == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty.copy(), empty.copy()
+
+    positions = np.column_stack((xs, ys)).astype(np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    # All neighbour lists at once: in C with a KD-tree, else with the spatial hash grid.
+    if SCIPY_AVAILABLE:
+        neighbours = cKDTree(positions).query_ball_point(positions, r=group_radius)
+    else:
+        neighbours = _grid_neighbours(positions, group_radius)
+
+    # Strongest candidates are used as cluster bases first.
+    labels = np.full(len(xs), -1, dtype=np.int32)
+    bases = []
+    for base_idx in np.argsort(-weights, kind="stable"):
+        if labels[base_idx] >= 0:
+            continue
+        members = [idx for idx in neighbours[base_idx] if labels[idx] < 0]
+        labels[members] = len(bases)
+        bases.append(base_idx)
+
+    # Weighted average position and total weight of each cluster.
+    total_weight = np.bincount(labels, weights=weights)
+    sum_x = np.bincount(labels, weights=weights * positions[:, 0])
+    sum_y = np.bincount(labels, weights=weights * positions[:, 1])
+    base_pos = positions[bases]
+    nonzero = total_weight != 0
+    avg_x = np.where(nonzero, sum_x / np.where(nonzero, total_weight, 1), base_pos[:, 0])
+    avg_y = np.where(nonzero, sum_y / np.where(nonzero, total_weight, 1), base_pos[:, 1])
+
+    # Sort the grouped candidates by weight.
+    order = np.argsort(-total_weight, kind="stable")
+    return (
+        np.rint(avg_x[order]).astype(np.int32),
+        np.rint(avg_y[order]).astype(np.int32),
+        total_weight[order].astype(np.int32),
+    )
 
 
 def detect_laser_spots(image, R=10, Th=20) -> tuple:
@@ -117,56 +297,70 @@ def detect_laser_spots(image, R=10, Th=20) -> tuple:
       Th: threshold on gradient magnitude
 
     Returns:
-      candidates: a list of dictionaries with keys:
-           'position': (x,y) tuple,
-           'weight': candidate weight.
-      The list is sorted in descending order of weight.
-      acc: the accumulator image.
+      xs, ys: candidate coordinates (int32 arrays)
+      weights: candidate weights (int32 array)
+      The arrays are sorted in descending order of weight.
+      acc: the accumulator image (a work buffer, overwritten by the next call with the same image shape).
     """
     # Ensure the image is grayscale and float32.
     if image.ndim == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-    gray = np.float32(gray)
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    image = np.asarray(image)
+    scratch = _get_scratch(image.shape)
+    gray = scratch.gray
+    np.copyto(gray, image, casting="unsafe")
 
     # Step 1: Compute gradients.
-    mag, angle = compute_gradients(gray)
+    gx, gy = compute_gradients(gray)
 
     # Step 2: Create accumulator space using vectorized accumulation.
-    acc = accumulate_candidates_vectorized(mag, angle, R, Th)
+    acc = accumulate_candidates_vectorized(gx, gy, R, Th, acc=scratch.acc)
 
     # Step 3: Use non-maximum suppression (via dilation) to find peaks in the accumulator.
     kernel_size = 2 * R + 1
     kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
 
-    # Convert accumulator to float32 for dilation
-    acc_float = acc.astype(np.float32)
-    acc_dilated = cv2.dilate(acc_float, kernel)
-    acc_peaks = (acc_float == acc_dilated) & (acc > 0)
+    # The uint16 accumulator is dilated and compared directly, without a float copy.
+    acc_dilated = cv2.dilate(acc, kernel, dst=scratch.acc_dil)
+    acc_peaks = cv2.compare(acc, acc_dilated, cv2.CMP_EQ)
+    acc_peaks = cv2.bitwise_and(acc_peaks, cv2.compare(acc, 0, cv2.CMP_GT))
 
-    # For image peaks (laser spots are expected to be bright).
-    gray_dilated = cv2.dilate(gray, kernel)
-    image_peaks = gray == gray_dilated
+    # For image peaks (laser spots are expected to be bright), on the 8-bit image when available.
+    if image.dtype == np.uint8:
+        image_peaks = cv2.compare(image, cv2.dilate(image, kernel, dst=scratch.gray_dil), cv2.CMP_EQ)
+    else:
+        image_peaks = cv2.compare(gray, cv2.dilate(gray, kernel), cv2.CMP_EQ)
 
     # Combine conditions: candidate must be a local maximum in both the accumulator and the image.
-    candidates_mask = acc_peaks & image_peaks
-
-    # Get candidate coordinates.
-    cand_y, cand_x = np.where(candidates_mask)
-
-    # Compute the candidate weight by summing the accumulator values in a window (using a box filter).
-    acc_sum = cv2.boxFilter(acc_float, ddepth=-1, ksize=(kernel_size, kernel_size))
-    weights = acc_sum[cand_y, cand_x].astype(np.int32)
-
-    # Build candidate list and sort by descending weight.
-    candidates = [{"position": (int(x), int(y)), "weight": int(w)} for x, y, w in zip(cand_x, cand_y, weights)]
-    candidates = sorted(candidates, key=lambda c: c["weight"], reverse=True)
-
-    return candidates, acc
-
-
-def draw_candidates(image, candidates):
+    candidates_mask = cv2.bitwise_and(acc_peaks, image_peaks)
+
+    # Get candidate coordinates (row-major order, as np.where).
+    points = cv2.findNonZero(candidates_mask)
+    if points is None:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty.copy(), empty.copy(), acc
+    # (N, 1, 2) or (N, 2) depending on the OpenCV version
+    points = points.reshape(-1, 2)
+    cand_x = points[:, 0]
+    cand_y = points[:, 1]
+
+    # Compute the candidate weight as the mean accumulator value in a window around it, read from
+    # an integral image at the candidates only. The border is reflected as cv2.boxFilter would.
+    acc_pad, sat = scratch.integral_buffers(R)
+    cv2.copyMakeBorder(acc, R, R, R, R, cv2.BORDER_REFLECT_101, dst=acc_pad)
+    cv2.integral(acc_pad, sum=sat, sdepth=cv2.CV_64F)
+    # In padded coordinates the window of (x, y) spans x..x+2R and y..y+2R.
+    x0, y0 = cand_x, cand_y
+    x1, y1 = cand_x + kernel_size, cand_y + kernel_size
+    window_sum = sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0]
+    weights = (window_sum // (kernel_size * kernel_size)).astype(np.int32)
+
+    # Sort candidates by descending weight.
+    order = np.argsort(-weights, kind="stable")
+    return cand_x[order].astype(np.int32), cand_y[order].astype(np.int32), weights[order], acc
+
+
+def draw_candidates(image, xs, ys, weights):
     """
     Draw circles and candidate weights on the image.
     """
@@ -175,9 +369,7 @@ def draw_candidates(image, candidates):
     else:
         output = image.copy()
 
-    for candidate in candidates:
-        x, y = candidate["position"]
-        weight = candidate["weight"]
+    for x, y, weight in zip(xs.tolist(), ys.tolist(), weights.tolist()):
         cv2.circle(output, (x, y), 5, (0, 0, 255), 2)
         cv2.putText(
             output,
@@ -191,73 +383,34 @@ def draw_candidates(image, candidates):
     return output
 
 
+def print_candidates(title: str, xs, ys, weights) -> None:
+    print("{} {} candidates.".format(title, len(xs)))
+    for idx, (x, y, weight) in enumerate(zip(xs.tolist(), ys.tolist(), weights.tolist()), start=1):
+        print("Candidate {}: position={}, weight={}".format(idx, (x, y), weight))
+
+
 def test_gradient(image: cv2.UMat) -> list:
     # Parameters (adjust these as needed)
     R = 10  # Maximum expected radius of the laser spot.
     Th = 15  # Gradient magnitude threshold.
 
     # Detect laser spot candidates.
-    candidates, acc = detect_laser_spots(image, R, Th)
-    print("Detected {} candidates.".format(len(candidates)))
-    for idx, candidate in enumerate(candidates):
-        print("Candidate {}: position={}, weight={}".format(idx + 1, candidate["position"], candidate["weight"]))
+    xs, ys, weights, acc = detect_laser_spots(image, R, Th)
+    print_candidates("Detected", xs, ys, weights)
 
     # Group nearby candidates.
-    grouped_candidates = group_candidates(candidates, group_radius=R / 2)
-    print("\nAfter grouping, {} candidates:".format(len(grouped_candidates)))
-    for idx, candidate in enumerate(grouped_candidates, start=1):
-        print("Grouped Candidate {}: position={}, weight={}".format(idx, candidate["position"], candidate["weight"]))
+    xs, ys, weights = group_candidates(xs, ys, weights, group_radius=R / 2)
+    print_candidates("\nAfter grouping,", xs, ys, weights)
 
     # Draw candidates on the image.
-    output = draw_candidates(image, grouped_candidates)
+    output = draw_candidates(image, xs, ys, weights)
     cv2.imshow("Laser Spot Candidates", output)
 
     # Normalize accumulator for visualization.
     acc_norm = cv2.normalize(acc.astype(np.float32), None, 0, 255, cv2.NORM_MINMAX)
     cv2.imshow("Accumulator", acc_norm.astype(np.uint8))
 
-    return grouped_candidates
-
-
-def group_candidates(candidates, group_radius=5):
-    """
-    Group nearby candidates that are within group_radius pixels.
-    Merges candidates by computing the weighted average of their positions and
-    summing their weights.
-
-    Args:
-      candidates: list of candidate dicts {'position': (x,y), 'weight': weight}
-      group_radius: maximum distance for candidates to be considered overlapping.
-
-    Returns:
-      grouped: list of grouped candidate dicts.
-    """
-    grouped = []
-    candidates = candidates.copy()  # shallow copy of list
-    while candidates:
-        # Pop the first candidate.
-        base = candidates.pop(0)
-        bx, by = base["position"]
-        cluster = [base]
-        remain = []
-        for cand in candidates:
-            cx, cy = cand["position"]
-            if np.hypot(cx - bx, cy - by) <= group_radius:
-                cluster.append(cand)
-            else:
-                remain.append(cand)
-        candidates = remain
-
-        total_weight = sum(c["weight"] for c in cluster)
-        if total_weight == 0:
-            avg_x, avg_y = bx, by
-        else:
-            avg_x = sum(c["position"][0] * c["weight"] for c in cluster) / total_weight
-            avg_y = sum(c["position"][1] * c["weight"] for c in cluster) / total_weight
-        grouped.append({"position": (int(round(avg_x)), int(round(avg_y))), "weight": total_weight})
-    # Optionally, sort the grouped candidates by weight.
-    grouped = sorted(grouped, key=lambda c: c["weight"], reverse=True)
-    return grouped
+    return candidates_to_dicts(xs, ys, weights)
 
 
 def main():
@@ -273,13 +426,11 @@ def main():
     Th = 25  # Gradient magnitude threshold.
 
     # Detect laser spot candidates.
-    candidates, acc = detect_laser_spots(image, R, Th)
-    print("Detected {} candidates.".format(len(candidates)))
-    for idx, candidate in enumerate(candidates):
-        print("Candidate {}: position={}, weight={}".format(idx + 1, candidate["position"], candidate["weight"]))
+    xs, ys, weights, acc = detect_laser_spots(image, R, Th)
+    print_candidates("Detected", xs, ys, weights)
 
     # Draw candidates on the image.
-    output = draw_candidates(image, candidates)
+    output = draw_candidates(image, xs, ys, weights)
     cv2.imshow("Laser Spot Candidates", output)
 
     # Normalize accumulator for visualization.
@@ -8,6 +8,8 @@ import numpy as np
 from numpy.linalg import norm
 
 FILE_NAME = "pictures\\frame-10.jpg"
+# One 9x9 dilation is equivalent to four 3x3 iterations
+DILATE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9))
 last_render = 0
 #This variable we use to store the pixel location
 target = ()
@@ -101,7 +103,7 @@ def draw_target_at_coord(img: cv2.UMat, coord: list) -> cv2.UMat:
     cv2.line(img, (coord[0], coord[1] + 1), (coord[0], coord[1] + 5), (0, 0, 255), 1)
     return img
   
-def find_laser(img: cv2.UMat, strategy_hint: str, threshold_hint: int) -> (tuple, cv2.UMat, str, int):
+def find_laser(img: cv2.UMat, strategy_hint: str, threshold_hint: int, debug: bool = True) -> (tuple, cv2.UMat, str, int):
     strategies = [find_laser_by_red_color, find_laser_by_grayscale, find_laser_by_green_color]
     
     if strategy_hint is not None:
@@ -110,9 +112,11 @@ def find_laser(img: cv2.UMat, strategy_hint: str, threshold_hint: int) -> (tuple
 
     for strategy in strategies:
         print(f"Trying strategy {strategy.__name__}")   
-        (coord, output, threshold) = strategy(img.copy(), threshold_hint)
+        (coord, output, threshold) = strategy(img, threshold_hint, debug)
         if coord is not None:
             print(f"Found laser at {coord}")
+            if output is None:
+                return (coord, None, strategy.__name__, threshold)
             cv2.putText(output, 
                 text = strategy.__name__, 
                 org=(10, 40),
@@ -128,7 +132,7 @@ def find_laser(img: cv2.UMat, strategy_hint: str, threshold_hint: int) -> (tuple
             return (coord, output, strategy.__name__, threshold)
     return (None, None, None, None)
 
-def find_laser_by_threshold(channel: cv2.UMat, threshold_hint:int) -> (tuple, cv2.UMat, int):
+def find_laser_by_threshold(channel: cv2.UMat, threshold_hint:int, debug: bool = True) -> (tuple, cv2.UMat, int):
     MAX_TRIES = 7
     MIN_THRESHOLD = 100
     MAX_THRESHOLD = 255
@@ -142,7 +146,7 @@ def find_laser_by_threshold(channel: cv2.UMat, threshold_hint:int) -> (tuple, cv
         _, diff_thr = cv2.threshold(channel, threshold, 255, cv2.THRESH_TOZERO)
         #cv2.imshow("Threshold", cv2.cvtColor(diff_thr, cv2.COLOR_GRAY2BGR))
         
-        masked_channel = cv2.dilate(diff_thr, None, iterations=4)
+        masked_channel = cv2.dilate(diff_thr, DILATE_KERNEL)
         #cv2.imshow("Dilate", cv2.cvtColor(masked_channel, cv2.COLOR_GRAY2BGR))
 
         circles = cv2.HoughCircles(masked_channel, cv2.HOUGH_GRADIENT, 1, minDist=50,
@@ -177,35 +181,36 @@ def find_laser_by_threshold(channel: cv2.UMat, threshold_hint:int) -> (tuple, cv
         
         print(f"Found 1 circle, threshold={threshold}")
 
-        # draw circles found
+        center = (int(circles[0,0][0]), int(circles[0,0][1]))
+        if not debug:
+            return (center, None, threshold)
+
+        # draw the thresholded channel over the original one
         output = cv2.cvtColor(masked_channel, cv2.COLOR_GRAY2BGR)
         background = cv2.cvtColor(channel, cv2.COLOR_GRAY2BGR)
-
-        for circle in circles[0,:]:
-            center = (int(circle[0]), int(circle[1]))
-            output = cv2.addWeighted(background, 0.2, output, 0.5, 0)
-            cv2.putText(output, 
-                        text = "THR="+ str(threshold), 
-                        org=(10, 20),
-                        fontFace=cv2.FONT_HERSHEY_COMPLEX,
-                        fontScale=0.5,
-                        color=(0, 255, 0))
-            return (center, output, threshold)
+        output = cv2.addWeighted(background, 0.2, output, 0.5, 0)
+        cv2.putText(output, 
+                    text = "THR="+ str(threshold), 
+                    org=(10, 20),
+                    fontFace=cv2.FONT_HERSHEY_COMPLEX,
+                    fontScale=0.5,
+                    color=(0, 255, 0))
+        return (center, output, threshold)
         
     return (None, None, None)
 
-def find_laser_by_grayscale(img: cv2.UMat, hint:int) -> (tuple, cv2.UMat, int):
+def find_laser_by_grayscale(img: cv2.UMat, hint:int, debug: bool = True) -> (tuple, cv2.UMat, int):
     gray_image = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
     normalized_gray_image = cv2.normalize(gray_image, None, alpha=0, beta=255, norm_type=cv2.NORM_MINMAX)
-    return find_laser_by_threshold(normalized_gray_image, hint)
+    return find_laser_by_threshold(normalized_gray_image, hint, debug)
 
-def find_laser_by_red_color(img: cv2.UMat, hint:int) -> (tuple, cv2.UMat, int):
-    (_, _, R) = cv2.split(img)
-    return find_laser_by_threshold(R, hint)
+def find_laser_by_red_color(img: cv2.UMat, hint:int, debug: bool = True) -> (tuple, cv2.UMat, int):
+    R = cv2.extractChannel(img, 2)
+    return find_laser_by_threshold(R, hint, debug)
    
-def find_laser_by_green_color(img: cv2.UMat, hint:int) -> (tuple, cv2.UMat, int):
-    (_, G, _) = cv2.split(img)
-    return find_laser_by_threshold(G, hint)
+def find_laser_by_green_color(img: cv2.UMat, hint:int, debug: bool = True) -> (tuple, cv2.UMat, int):
+    G = cv2.extractChannel(img, 1)
+    return find_laser_by_threshold(G, hint, debug)
 
 
 def set_exposure(cap: cv2.VideoCapture, exposure: int):
@@ -351,7 +356,7 @@ def point_and_shoot():
         if not ret:
             print("Failed to capture frame")
             break
-        (coord, _, str_hint, thr_hint) = find_laser(frame, str_hint, thr_hint)
+        (coord, _, str_hint, thr_hint) = find_laser(frame, str_hint, thr_hint, debug=False)
         
         if coord is not None:
             draw_visor_at_coord(frame, coord)
@@ -1,17 +1,210 @@
 # motion_analysis.py
+import math
+from dataclasses import dataclass
 import cv2
 import numpy as np
 
+try:
+    from numba import njit
 
-def detect_global_motion(Iprev, I, max_corners=200, quality_level=0.01, min_distance=10):
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from scipy.spatial import cKDTree
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+
+# motion_pattern_analysis alternates the cheap FAST detector and Shi-Tomasi between frames (see frame_index)
+ALTERNATE_FAST_FEATURES = True
+FAST_THRESHOLD = 20
+_fast_detector = None
+
+# Shared, read-only displacement of the untracked candidates in fixed-object applications
+_ZERO_MOTION = np.zeros(2, dtype=np.float32)
+_ZERO_MOTION.flags.writeable = False
+
+
+@dataclass
+class CandidateSet:
+    """
+    Laser spot candidates of one frame as parallel arrays:
+      positions: (N, 2) float32 array of (x, y)
+      weights: (N,) float32 array
+    """
+
+    positions: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, xs, ys, weights) -> "CandidateSet":
+        """Builds the set from coordinate and weight arrays, e.g. the output of gradient_search.detect_laser_spots."""
+        positions = np.column_stack((xs, ys)).astype(np.float32)
+        return cls(positions, np.asarray(weights, dtype=np.float32))
+
+    @classmethod
+    def from_dicts(cls, candidates: list) -> "CandidateSet":
+        """Builds the set from a list of dicts with keys 'position' and 'weight'."""
+        n = len(candidates)
+        positions = np.fromiter(
+            (v for cand in candidates for v in cand["position"]), dtype=np.float32, count=2 * n
+        ).reshape(n, 2)
+        weights = np.fromiter((cand["weight"] for cand in candidates), dtype=np.float32, count=n)
+        return cls(positions, weights)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+
+# GPU state: (frame id, GpuMat) of the last two uploaded frames, LK flow and feature detectors.
+_gpu_frames: list = []
+_gpu_flow = None
+_gpu_detectors: dict = {}
+
+
+def _upload(img, frame_id=None):
+    """
+    Returns img as a GpuMat. Without frame_id, img is uploaded on every call. With a frame_id, the upload
+    of the last two frames is reused when the same id is passed again: the id must change whenever the
+    image data does (frame buffers are reused and modified in place, so the array identity does not tell).
+    """
+    if frame_id is not None:
+        for cached_id, gpu_img in _gpu_frames:
+            if cached_id == frame_id:
+                return gpu_img
+    gpu_img = cv2.cuda_GpuMat()
+    gpu_img.upload(img)
+    if frame_id is not None:
+        _gpu_frames.append((frame_id, gpu_img))
+        del _gpu_frames[:-2]
+    return gpu_img
+
+
+def _sparse_flow(Iprev, I, pts, frame_ids=(None, None)):
+    """
+    Pyramidal Lucas–Kanade flow of pts (float32, shape (n, 2)) from Iprev to I,
+    on the GPU when OpenCV has CUDA. Returns (new points (n, 2), status (n,)).
+    frame_ids: upload ids of (Iprev, I), see _upload.
+    """
+    global _gpu_flow
+    if CUDA_AVAILABLE:
+        if _gpu_flow is None:
+            _gpu_flow = cv2.cuda.SparsePyrLKOpticalFlow_create(winSize=(21, 21), maxLevel=3)
+        gpu_pts = cv2.cuda_GpuMat()
+        gpu_pts.upload(pts.reshape(1, -1, 2))
+        gpu_new, gpu_st, _ = _gpu_flow.calc(_upload(Iprev, frame_ids[0]), _upload(I, frame_ids[1]), gpu_pts, None)
+        return gpu_new.download().reshape(-1, 2), gpu_st.download().reshape(-1)
+
+    p1, st, err = cv2.calcOpticalFlowPyrLK(Iprev, I, pts.reshape(-1, 1, 2), None)
+    if p1 is None or st is None:
+        return None, None
+    return p1.reshape(-1, 2), st.reshape(-1)
+
+
+def _good_features(Iprev, max_corners, quality_level, min_distance, mask=None, frame_id=None):
+    """
+    Shi-Tomasi corners of Iprev as a float32 (n, 2) array (None if none), on the GPU when available.
+    frame_id: upload id of Iprev, see _upload.
+    """
+    if CUDA_AVAILABLE:
+        key = (max_corners, quality_level, min_distance)
+        detector = _gpu_detectors.get(key)
+        if detector is None:
+            detector = cv2.cuda.createGoodFeaturesToTrackDetector(cv2.CV_8UC1, max_corners, quality_level, min_distance)
+            _gpu_detectors[key] = detector
+        if mask is None:
+            gpu_features = detector.detect(_upload(Iprev, frame_id))
+        else:
+            gpu_mask = cv2.cuda_GpuMat()
+            gpu_mask.upload(mask)
+            gpu_features = detector.detect(_upload(Iprev, frame_id), mask=gpu_mask)
+        if gpu_features.empty():
+            return None
+        return gpu_features.download().reshape(-1, 2)
+
+    features = cv2.goodFeaturesToTrack(
+        Iprev,
+        maxCorners=max_corners,
+        qualityLevel=quality_level,
+        minDistance=min_distance,
+        mask=mask,
+    )
+    if features is None:
+        return None
+    return np.float32(features).reshape(-1, 2)
+
+
+def _fast_features(Iprev, max_corners, mask=None):
+    """The max_corners strongest FAST corners of Iprev as a float32 (n, 2) array (None if none)."""
+    global _fast_detector
+    if _fast_detector is None:
+        _fast_detector = cv2.FastFeatureDetector_create(threshold=FAST_THRESHOLD)
+    keypoints = _fast_detector.detect(Iprev, mask)
+    if not keypoints:
+        return None
+    keypoints = sorted(keypoints, key=lambda kp: kp.response, reverse=True)[:max_corners]
+    return cv2.KeyPoint_convert(keypoints).reshape(-1, 2)
+
+
+def background_mask(shape, boxes):
+    """
+    Feature detection mask for detect_global_motion: 255 on the background, 0 inside the
+    given (x1, y1, x2, y2) boxes (e.g. the players detected by YOLO), which do not follow the camera motion.
+    """
+    mask = np.full(shape[:2], 255, dtype=np.uint8)
+    for x1, y1, x2, y2 in boxes:
+        mask[max(int(y1), 0) : max(int(y2), 0), max(int(x1), 0) : max(int(x2), 0)] = 0
+    return mask
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(fastmath=True, cache=True)
+    def _motion_kernel(L_pos, prev_pos, trk_pos, default_vec, g, assoc_thresh, motion_vectors, diffs):
+        """
+        Associates each candidate with its closest tracked candidate and writes its displacement
+        vector and aberration || c - g ||. Distances are compared squared, without sqrt.
+        Serial: candidate counts are small, so starting threads would cost more than the loop.
+        """
+        thresh2 = assoc_thresh * assoc_thresh
+        for i in range(L_pos.shape[0]):
+            x = L_pos[i, 0]
+            y = L_pos[i, 1]
+            best_j = -1
+            best_d2 = np.inf
+            for j in range(trk_pos.shape[0]):
+                dx = x - trk_pos[j, 0]
+                dy = y - trk_pos[j, 1]
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best_j = j
+            if best_j >= 0 and best_d2 < thresh2:
+                cx = x - prev_pos[best_j, 0]
+                cy = y - prev_pos[best_j, 1]
+            else:
+                cx = default_vec[0]
+                cy = default_vec[1]
+            motion_vectors[i, 0] = cx
+            motion_vectors[i, 1] = cy
+            diffs[i] = math.sqrt((cx - g[0]) ** 2 + (cy - g[1]) ** 2)
+
+
+def detect_global_motion(Iprev, I, max_corners=200, quality_level=0.01, min_distance=10, mask=None, use_fast=False):
     """
     Estimate the global motion vector between two consecutive frames.
 
     Steps:
-      1. Detect good features to track in Iprev using Shi-Tomasi.
+      1. Detect good features to track in Iprev using Shi-Tomasi (or FAST), outside the masked-out areas.
       2. Track these features into I using pyramidal Lucas–Kanade optical flow.
+         Both run on the GPU when OpenCV is built with CUDA, with the frames uploaded once.
       3. For all successfully tracked points, compute the displacement vectors.
-      4. Sort the displacement vectors by their orientation, then select the middle third,
+      4. Order the displacement vectors by their orientation, then select the middle third,
          and finally choose the median (by distance) of that subset as the global motion vector.
 
     If no features are found or tracked, returns (0, 0).
@@ -22,31 +215,39 @@ def detect_global_motion(Iprev, I, max_corners=200, quality_level=0.01, min_dist
       max_corners: maximum number of features to track.
       quality_level: quality level for feature detection.
       min_distance: minimum distance between features.
+      mask: optional 8-bit mask, features are only detected where it is nonzero (see background_mask).
+      use_fast: detect the features with the FAST detector instead of Shi-Tomasi (cheaper, CPU only).
 
     Returns:
       global_motion: tuple (dx, dy) representing the estimated global motion.
     """
-    features = cv2.goodFeaturesToTrack(
-        Iprev,
-        maxCorners=max_corners,
-        qualityLevel=quality_level,
-        minDistance=min_distance,
-    )
+    # Iprev is uploaded once for the feature detection and the optical flow
+    frame_ids = (object(), object())
+    features = _detect_features(Iprev, max_corners, quality_level, min_distance, mask, use_fast, frame_ids[0])
     if features is None:
         return (0.0, 0.0)
 
-    features = np.float32(features)
-    p1, st, err = cv2.calcOpticalFlowPyrLK(Iprev, I, features, None)
+    p1, st = _sparse_flow(Iprev, I, features, frame_ids)
+    return _global_motion_from_flow(features, p1, st)
+
+
+def _detect_features(
+    Iprev, max_corners=200, quality_level=0.01, min_distance=10, mask=None, use_fast=False, frame_id=None
+):
+    """Features of Iprev for the global motion estimation, float32 (n, 2) array or None."""
+    if use_fast:
+        return _fast_features(Iprev, max_corners, mask)
+    return _good_features(Iprev, max_corners, quality_level, min_distance, mask, frame_id)
+
 
+def _global_motion_from_flow(features, p1, st):
+    """Steps 3-4 of detect_global_motion, from the features and their optical flow (p1, st)."""
     # Check for valid optical flow output.
     if p1 is None or st is None:
         return (0.0, 0.0)
 
-    st = st.flatten()
-    # Reshape features to have shape (-1,2)
-    features = features.reshape(-1, 2)
     good_old = features[st == 1]
-    good_new = p1[st == 1].reshape(-1, 2)
+    good_new = p1[st == 1]
 
     if len(good_old) == 0 or len(good_new) == 0:
         return (0.0, 0.0)
@@ -56,21 +257,22 @@ def detect_global_motion(Iprev, I, max_corners=200, quality_level=0.01, min_dist
     if displacements.size == 0 or displacements.shape[1] < 2:
         return (0.0, 0.0)
 
-    # Compute angles from the displacements.
-    angles = np.arctan2(displacements[:, 1], displacements[:, 0])
+    # Pseudo-angles of the displacements: same ordering as np.arctan2(dy, dx), without the arctangent
+    dx, dy = displacements[:, 0], displacements[:, 1]
+    l1 = np.abs(dx) + np.abs(dy)
+    p = np.divide(dx, l1, out=np.ones_like(l1), where=l1 > 0)
+    angles = np.copysign(1.0 - p, dy)
 
-    # Sort displacement vectors by angle.
-    sort_idx = np.argsort(angles)
-    displacements_sorted = displacements[sort_idx]
-
-    m = len(displacements_sorted)
+    m = len(displacements)
     m_third = m // 3
     if m_third == 0:
         global_disp = np.median(displacements, axis=0)
     else:
-        mid_section = displacements_sorted[m_third : 2 * m_third]
+        # Middle third by angle: only the two boundaries need to be in sorted position
+        sort_idx = np.argpartition(angles, [m_third, 2 * m_third])
+        mid_section = displacements[sort_idx[m_third : 2 * m_third]]
         mags_mid = np.linalg.norm(mid_section, axis=1)
-        median_idx = np.argsort(mags_mid)[len(mags_mid) // 2]
+        median_idx = np.argpartition(mags_mid, len(mags_mid) // 2)[len(mags_mid) // 2]
         global_disp = mid_section[median_idx]
 
     return (float(global_disp[0]), float(global_disp[1]))
@@ -83,34 +285,56 @@ def track_candidates(Lprev, Iprev, I):
     Uses pyramidal Lucas–Kanade optical flow.
 
     Args:
-      Lprev: list of candidate dictionaries from the previous frame.
-             Each candidate must have a 'position' key with a tuple (x, y).
+      Lprev: candidates of the previous frame (CandidateSet).
       Iprev: previous frame (grayscale image)
       I: current frame (grayscale image)
 
     Returns:
-      tracked_positions: list of positions (as (x, y) tuples) corresponding to candidates
-                         in Lprev. If a candidate is not successfully tracked, the corresponding
-                         entry is None.
+      tracked_positions: (N, 2) float32 array of the positions of the candidates of Lprev in I.
+      tracked: (N,) boolean array, False where a candidate was not successfully tracked.
     """
-    if not Lprev:
-        return []
+    if len(Lprev) == 0:
+        return np.empty((0, 2), dtype=np.float32), np.zeros(0, dtype=bool)
 
-    pts_prev = np.array([cand["position"] for cand in Lprev], dtype=np.float32)
-    pts_prev = pts_prev.reshape(-1, 1, 2)
+    pts_cur, st = _sparse_flow(Iprev, I, Lprev.positions)
+    return _tracked_from_flow(Lprev, pts_cur, st)
 
-    pts_cur, st, err = cv2.calcOpticalFlowPyrLK(Iprev, I, pts_prev, None)
 
-    tracked_positions = []
-    for status, pt in zip(st, pts_cur):
-        if status[0] == 1:
-            tracked_positions.append((float(pt[0][0]), float(pt[0][1])))
-        else:
-            tracked_positions.append(None)
-    return tracked_positions
+def _tracked_from_flow(Lprev, pts_cur, st):
+    """Result of track_candidates from the optical flow (pts_cur, st) of the positions of Lprev."""
+    if pts_cur is None or st is None:
+        return np.zeros_like(Lprev.positions), np.zeros(len(Lprev), dtype=bool)
+    return pts_cur.astype(np.float32), st == 1
 
 
-def motion_pattern_analysis(L, Lprev, I, Iprev, C1=2.0, C2=0.2, assoc_thresh=10.0, fixed_object=False):
+def _motion_vectors(L_pos, prev_pos, trk_pos, default_vec, global_motion, assoc_thresh):
+    """
+    NumPy version of _motion_kernel: returns the displacement vectors (N, 2) of the candidates
+    and their aberrations || c_i - g || (N,).
+    """
+    motion_vectors = np.broadcast_to(default_vec, L_pos.shape).copy()
+    if len(L_pos) > 0 and len(trk_pos) > 0:
+        # The closest tracked candidate is associated if near enough.
+        if SCIPY_AVAILABLE:
+            # One batched KD-tree query; candidates farther than assoc_thresh get an infinite distance.
+            best_dist, best_idx = cKDTree(trk_pos).query(L_pos, k=1, distance_upper_bound=assoc_thresh)
+        else:
+            # Pairwise distances to the tracked candidates.
+            dists = np.linalg.norm(L_pos[:, None, :] - trk_pos[None, :, :], axis=2)
+            best_idx = dists.argmin(axis=1)
+            best_dist = dists[np.arange(len(L_pos)), best_idx]
+        associated = best_dist < assoc_thresh
+        # Associated candidates: displacement vector is current - previous.
+        motion_vectors[associated] = L_pos[associated] - prev_pos[best_idx[associated]]
+
+    # Aberrations: d_i = || c_i - g || for each candidate.
+    diffs = np.linalg.norm(motion_vectors - global_motion, axis=1)
+    return motion_vectors, diffs
+
+
+def motion_pattern_analysis(
+    L, Lprev, I, Iprev, C1=2.0, C2=0.2, assoc_thresh=10.0, fixed_object=False, mask=None, frame_index=None
+):
     """
     Analyze the motion pattern of detected candidates to compute temporal weights.
 
@@ -135,95 +359,89 @@ def motion_pattern_analysis(L, Lprev, I, Iprev, C1=2.0, C2=0.2, assoc_thresh=10.
     candidates that match the global motion (or remain static) are favored.
 
     Args:
-      L: current frame candidate list (list of dicts with keys 'position' and 'weight')
-      Lprev: previous frame candidate list (same format as L)
+      L: current frame candidates (CandidateSet, or a list of dicts with keys 'position' and 'weight')
+      Lprev: previous frame candidates (same format as L)
       I: current frame (grayscale image)
       Iprev: previous frame (grayscale image)
       C1: constant factor for candidates with nonzero aberration (typical range [2,4])
       C2: constant factor for candidates with zero aberration (typical range [0.1,0.3])
       assoc_thresh: maximum distance (in pixels) to associate a candidate in L with a tracked candidate from Lprev.
       fixed_object: if True, untracked candidates are assumed to mark a fixed object and can be set to zero displacement.
+      mask: optional background mask for the global motion features (see background_mask).
+      frame_index: optional index of I in its video stream, incremented by one per call. When given, the
+        global motion features alternate between FAST (even frames) and Shi-Tomasi, and on the GPU the
+        upload of I is reused as the next Iprev. Different video streams must not use the same indices.
 
     Returns:
-      temporal_weights: list of temporal weight values for candidates in L.
-      best_candidate: the candidate (dict) with the highest temporal weight.
+      temporal_weights: (N,) float32 array of temporal weight values for candidates in L.
+      best_index: index in L of the candidate with the highest temporal weight (None if L is empty).
     """
-    # 1. Estimate global motion vector g.
-    g_dx, g_dy = detect_global_motion(Iprev, I)
+    if not isinstance(L, CandidateSet):
+        L = CandidateSet.from_dicts(L)
+    if not isinstance(Lprev, CandidateSet):
+        Lprev = CandidateSet.from_dicts(Lprev)
+
+    # 1-2. Estimate global motion vector g and track previous candidates.
+    # As detect_global_motion + track_candidates, but with a single optical flow call on the
+    # features and the candidates, so the LK pyramids of Iprev and I are only built once.
+    use_fast = ALTERNATE_FAST_FEATURES and frame_index is not None and frame_index % 2 == 0
+    # Upload ids of (Iprev, I): Iprev is uploaded once for the features and the flow, and with a frame_index
+    # the upload of I is still there as Iprev of the next call
+    frame_ids = (object(), object()) if frame_index is None else (frame_index - 1, frame_index)
+    features = _detect_features(Iprev, mask=mask, use_fast=use_fast, frame_id=frame_ids[0])
+    n_features = 0 if features is None else len(features)
+    points = Lprev.positions if features is None else np.vstack((features, Lprev.positions))
+    if len(points) > 0:
+        p1, st = _sparse_flow(Iprev, I, points, frame_ids)
+    else:
+        p1, st = None, None
+
+    if n_features > 0:
+        g_dx, g_dy = _global_motion_from_flow(
+            features, None if p1 is None else p1[:n_features], None if st is None else st[:n_features]
+        )
+    else:
+        g_dx, g_dy = 0.0, 0.0
     global_motion = np.array([g_dx, g_dy], dtype=np.float32)
 
-    # 2. Track previous candidates.
-    tracked_positions = track_candidates(Lprev, Iprev, I)
+    tracked_positions, tracked = _tracked_from_flow(
+        Lprev, None if p1 is None else p1[n_features:], None if st is None else st[n_features:]
+    )
 
-    # Build list of (prev_position, tracked_position) for successfully tracked candidates.
-    tracked_candidates = []
-    for cand, tracked in zip(Lprev, tracked_positions):
-        if tracked is not None:
-            tracked_candidates.append(
-                (
-                    np.array(cand["position"], dtype=np.float32),
-                    np.array(tracked, dtype=np.float32),
-                )
-            )
+    # Positions of the successfully tracked candidates, before and after tracking: (M, 2) arrays.
+    prev_pos = np.ascontiguousarray(Lprev.positions[tracked])
+    trk_pos = np.ascontiguousarray(tracked_positions[tracked])
 
-    # 3. For each candidate in L, compute the displacement vector c.
-    motion_vectors = []
-    for cand in L:
-        pos_current = np.array(cand["position"], dtype=np.float32)
-        best_dist = float("inf")
-        best_prev = None
-        # Find the best matching tracked candidate.
-        for prev_pos, tracked_pos in tracked_candidates:
-            dist = np.linalg.norm(pos_current - tracked_pos)
-            if dist < best_dist:
-                best_dist = dist
-                best_prev = prev_pos
-        if best_dist < assoc_thresh and best_prev is not None:
-            # Candidate is associated; displacement vector is current - previous.
-            c_vec = pos_current - best_prev
-        else:
-            # Candidate not associated.
-            if fixed_object:
-                # For fixed-object applications, you might set the displacement to zero.
-                c_vec = np.array([0.0, 0.0], dtype=np.float32)
-            else:
-                # Otherwise, use the global motion vector.
-                c_vec = global_motion.copy()
-        motion_vectors.append(c_vec)
+    # Current candidate positions and weights: (N, 2) and (N,) arrays.
+    L_pos = L.positions
+    weights = L.weights
 
-    # 4. Compute aberrations: d_i = || c_i - g || for each candidate.
-    diffs = [np.linalg.norm(c_vec - global_motion) for c_vec in motion_vectors]
+    # 3. For each candidate in L, compute the displacement vector c.
+    if fixed_object:
+        # For fixed-object applications, unassociated candidates get a zero displacement.
+        default_vec = _ZERO_MOTION
+    else:
+        # Otherwise, unassociated candidates move with the global motion vector.
+        default_vec = global_motion
+    if NUMBA_AVAILABLE:
+        # 3-4. Association, displacement vectors and aberrations d_i = || c_i - g || in one compiled loop.
+        motion_vectors = np.empty_like(L_pos)
+        diffs = np.empty(len(L_pos), dtype=np.float32)
+        _motion_kernel(L_pos, prev_pos, trk_pos, default_vec, global_motion, assoc_thresh, motion_vectors, diffs)
+    else:
+        motion_vectors, diffs = _motion_vectors(L_pos, prev_pos, trk_pos, default_vec, global_motion, assoc_thresh)
 
     # Determine d_max over all candidates (if all zero, d_max remains 0).
-    if diffs:
-        d_max = max(diffs)
-    else:
-        d_max = 1.0  # to avoid division by zero in degenerate cases
+    d_max = diffs.max() if len(diffs) > 0 else 1.0
 
     # 5. Compute normalized aberration and temporal weight.
-    temporal_weights = []
-    for cand, d in zip(L, diffs):
-        w_i = cand["weight"]
-        # Normalize the aberration.
-        if d_max > 0:
-            d_norm = d / d_max
-        else:
-            d_norm = 0.0
-        if d_norm > 0:
-            t_i = C1 * d_norm * w_i
-        else:
-            t_i = C2 * w_i
-        temporal_weights.append(t_i)
-
-    # 6. (Optional) Sort candidates based on temporal weight and select best candidate.
-    if temporal_weights:
-        best_index = np.argmax(temporal_weights)
-        best_candidate = L[best_index].copy()
-        best_candidate["temporal_weight"] = temporal_weights[best_index]
-    else:
-        best_candidate = None
+    d_norm = diffs / d_max if d_max > 0 else np.zeros_like(diffs)
+    temporal_weights = np.where(d_norm > 0, C1 * d_norm * weights, C2 * weights).astype(np.float32)
+
+    # 6. (Optional) Select the candidate with the highest temporal weight.
+    best_index = int(np.argmax(temporal_weights)) if len(temporal_weights) > 0 else None
 
-    return temporal_weights, best_candidate
+    return temporal_weights, best_index
 
 
 # ---------------------
@@ -239,28 +457,32 @@ if __name__ == "__main__":
 
     # Example candidate lists.
     # In practice, these come from your detection module.
-    Lprev = [
-        {"position": (100, 150), "weight": 5},
-        {"position": (200, 250), "weight": 4},
-    ]
-    L = [
-        {"position": (105, 155), "weight": 6},
-        {"position": (210, 260), "weight": 3},
-        {"position": (400, 300), "weight": 2},
-    ]
+    Lprev = CandidateSet.from_dicts(
+        [
+            {"position": (100, 150), "weight": 5},
+            {"position": (200, 250), "weight": 4},
+        ]
+    )
+    L = CandidateSet.from_dicts(
+        [
+            {"position": (105, 155), "weight": 6},
+            {"position": (210, 260), "weight": 3},
+            {"position": (400, 300), "weight": 2},
+        ]
+    )
 
     # Set parameters.
     C1 = 3.0  # e.g., between 2 and 4
     C2 = 0.2  # e.g., between 0.1 and 0.3
     assoc_thresh = 10.0  # pixels
 
-    temporal_weights, best_candidate = motion_pattern_analysis(L, Lprev, I, Iprev, C1, C2, assoc_thresh)
+    temporal_weights, best_index = motion_pattern_analysis(L, Lprev, I, Iprev, C1, C2, assoc_thresh, frame_index=1)
     print("Temporal weights for current candidates:")
     for i, t in enumerate(temporal_weights):
         print(f"Candidate {i+1}: temporal weight = {t}")
 
-    if best_candidate is not None:
+    if best_index is not None:
         print("\nBest candidate (detected laser spot):")
-        print(best_candidate)
+        print(f"position={tuple(L.positions[best_index])}, temporal weight={temporal_weights[best_index]}")
     else:
         print("No valid candidate detected.")
@@ -0,0 +1,18 @@
+import struct
+
+# UDP angles datagram: (h, v) target angles as two little-endian float32
+ANGLES_DATAGRAM_FORMAT = "<ff"
+ANGLES_DATAGRAM_SIZE = struct.calcsize(ANGLES_DATAGRAM_FORMAT)
+
+
+def parse_angles(request):
+    """Parses an "(h, v)" request as two floats, the request is never evaluated as code."""
+    h, v = request.strip().strip("()").split(",")
+    return (float(h), float(v))
+
+
+def parse_angles_datagram(data):
+    """Unpacks an (h, v) UDP angles datagram, raises ValueError if it is not exactly two float32."""
+    if len(data) != ANGLES_DATAGRAM_SIZE:
+        raise ValueError(f"expected {ANGLES_DATAGRAM_SIZE} bytes, got {len(data)}")
+    return struct.unpack(ANGLES_DATAGRAM_FORMAT, data)
@@ -4,6 +4,7 @@ import asyncio, socket
 import random
 import neopixel
 from Servo import Servo
+from angles import parse_angles, parse_angles_datagram
 
 H_SERVO_PIN = 6
 V_SERVO_PIN = 8
@@ -42,6 +43,16 @@ laser.value(1)
 eyes_pwm = PWM(Pin(EYES_PIN), freq=512)
 
 
+async def sleep_until_next_ms(deadline, period_ms):
+    """
+    Sleeps until deadline + period_ms (time.ticks_ms() units) and returns that new deadline.
+    Unlike sleeping period_ms after each step, the time spent in the steps does not accumulate.
+    """
+    deadline = time.ticks_add(deadline, period_ms)
+    await asyncio.sleep_ms(max(0, time.ticks_diff(deadline, time.ticks_ms())))
+    return deadline
+
+
 def set_brightness(duty):
     global eyes_pwm
     """Set the brightness of the LEDs using PWM duty cycle (0-1023)."""
@@ -170,7 +181,7 @@ async def handle_client(reader, writer):
 
             if request.startswith("("):
                 try:
-                    target_coord = eval(request)
+                    target_coord = parse_angles(request)
                     response = "1"
                 except Exception as e:
                     print(f"Error updating target coordinates: {e}")
@@ -247,6 +258,30 @@ async def run_server():
         await asyncio.sleep(2)  # ### CHANGED: Add a delay before restarting server
 
 
+async def run_udp_angles():
+    """
+    Receives the target angles sent by the game as UDP datagrams on the server port: the (h, v)
+    angles packed as two little-endian float32 (8 bytes, no text to parse).
+    A lost or late update is simply superseded by the next one, no reply is sent.
+    """
+    global target_coord
+    print("Running UDP angles listener...")
+    udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    udp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    udp.bind(socket.getaddrinfo("0.0.0.0", 15555)[0][-1])
+    udp.setblocking(False)
+    while True:
+        try:
+            data = udp.recv(64)
+        except OSError:
+            await asyncio.sleep_ms(5)  # Nothing received yet
+            continue
+        try:
+            target_coord = parse_angles_datagram(data)
+        except Exception as e:
+            print(f"Invalid angles datagram {data}: {e}")
+
+
 async def stop_servo():
     global motor_h, motor_v
     motor_h.move(zero[0])
@@ -267,7 +302,7 @@ async def test_movement():
     motor_v.move(v)
 
     await asyncio.sleep(2)
-    delay = 0.05
+    delay_ms = 50
 
     range_h = range(H_MIN, H_MAX + 1)
     range_v = range(V_MIN, V_MAX + 1)
@@ -276,21 +311,23 @@ async def test_movement():
             await asyncio.sleep_ms(100)
             continue
 
+        # Steps are paced on absolute deadlines, so the prints do not stretch the sweep
+        deadline = time.ticks_ms()
         for h in range_h:
             motor_h.move(h)
-            await asyncio.sleep(delay)
+            deadline = await sleep_until_next_ms(deadline, delay_ms)
             print(f"(H,V)={h},{v}")
         for v in range_v:
             motor_v.move(v)
-            await asyncio.sleep(delay)
+            deadline = await sleep_until_next_ms(deadline, delay_ms)
             print(f"(H,V)={h},{v}")
         for h in reversed(range_h):
             motor_h.move(h)
-            await asyncio.sleep(delay)
+            deadline = await sleep_until_next_ms(deadline, delay_ms)
             print(f"(H,V)={h},{v}")
         for v in reversed(range_v):
             motor_v.move(v)
-            await asyncio.sleep(delay)
+            deadline = await sleep_until_next_ms(deadline, delay_ms)
             print(f"(H,V)={h},{v}")
 
 
@@ -358,19 +395,20 @@ async def check_limits():
     motor_v.move(V_MIN)
     motor_h.move(H_MIN)
     DELAY_MS = 20
+    deadline = time.ticks_ms()
     while True:
         for i in range(H_MIN, H_MAX + 1):
             motor_h.move(i)
-            await asyncio.sleep_ms(DELAY_MS)
+            deadline = await sleep_until_next_ms(deadline, DELAY_MS)
         for i in range(V_MIN, V_MAX + 1):
             motor_v.move(i)
-            await asyncio.sleep_ms(DELAY_MS)
+            deadline = await sleep_until_next_ms(deadline, DELAY_MS)
         for i in range(H_MAX, H_MIN, -1):
             motor_h.move(i)
-            await asyncio.sleep_ms(DELAY_MS)
+            deadline = await sleep_until_next_ms(deadline, DELAY_MS)
         for i in range(V_MAX, V_MIN, -1):
             motor_v.move(i)
-            await asyncio.sleep_ms(DELAY_MS)
+            deadline = await sleep_until_next_ms(deadline, DELAY_MS)
 
 
 async def main():
@@ -383,6 +421,7 @@ async def main():
     # asyncio.create_task(head_positionning())
     # asyncio.create_task(pulse_eyes())
     asyncio.create_task(rotate_head())
+    asyncio.create_task(run_udp_angles())
     await test(motor_h)
     await test(motor_v)
     await asyncio.gather(run_server())  # , run_tracking())
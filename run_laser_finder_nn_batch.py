@@ -215,7 +215,7 @@ def main():
     # Initialize LaserFinderNN
     print("Initializing LaserFinderNN...")
     try:
-        laser_finder = LaserFinderNN()
+        laser_finder = LaserFinderNN(debug=True)
         print("✅ LaserFinderNN initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize LaserFinderNN: {e}")
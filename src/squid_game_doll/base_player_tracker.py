@@ -22,7 +22,7 @@ class BasePlayerTracker:
         Converts YOLO results into a supervision Detections object with proper scaling.
         Optimized to minimize GPU→CPU transfers.
         """
-        detections = []
+        xyxy_parts, confidence_parts, tracker_id_parts = [], [], []
         for result in yolo_results:
             if result.boxes is None:
                 continue
@@ -32,32 +32,40 @@ class BasePlayerTracker:
             if len(boxes) == 0:
                 continue
                 
-            # Single GPU→CPU transfer for all boxes
-            confidences = boxes.conf.cpu().numpy()
-            class_ids = boxes.cls.cpu().numpy() 
-            xyxy_coords = boxes.xyxy.cpu().numpy()
-            track_ids = boxes.id.cpu().numpy() if boxes.id is not None else None
+            # Single GPU→CPU transfer for all boxes: data rows are (x1, y1, x2, y2, [track id,] conf, cls)
+            data = boxes.data.cpu().numpy()
+            xyxy_coords = data[:, :4]
+            confidences = data[:, -2]
+            class_ids = data[:, -1]
+            track_ids = data[:, 4] if data.shape[1] == 7 else None
 
-            # Process each detection using CPU arrays (no more GPU transfers)
-            for i in range(len(boxes)):
-                conf = float(confidences[i])
-                class_id = int(class_ids[i])
-                
-                if conf > self.confidence and class_id == 0:
-                    x1, y1, x2, y2 = xyxy_coords[i]
-                    x1 = int(x1 * self.frame_rect.width / self.nn_rect.width + self.nn_rect.x)
-                    y1 = int(y1 * self.frame_rect.height / self.nn_rect.height + self.nn_rect.y)
-                    x2 = int(x2 * self.frame_rect.width / self.nn_rect.width + self.nn_rect.x)
-                    y2 = int(y2 * self.frame_rect.height / self.nn_rect.height + self.nn_rect.y)
-                    
-                    track_id = int(track_ids[i]) if track_ids is not None else None
-                    detections.append([x1, y1, x2, y2, conf, track_id])
+            # Filter and scale all detections at once using CPU arrays (no more GPU transfers)
+            keep = np.flatnonzero((confidences > self.confidence) & (class_ids.astype(np.int64) == 0))
+            if len(keep) == 0:
+                continue
+            xyxy = np.empty((len(keep), 4), dtype=np.float64)
+            xyxy[:, [0, 2]] = (
+                xyxy_coords[keep][:, [0, 2]] * self.frame_rect.width / self.nn_rect.width + self.nn_rect.x
+            ).astype(np.int64)
+            xyxy[:, [1, 3]] = (
+                xyxy_coords[keep][:, [1, 3]] * self.frame_rect.height / self.nn_rect.height + self.nn_rect.y
+            ).astype(np.int64)
+
+            xyxy_parts.append(xyxy)
+            confidence_parts.append(confidences[keep].astype(np.float64))
+            if track_ids is not None:
+                tracker_id_parts.append(track_ids[keep].astype(np.int64))
+            else:
+                tracker_id_parts.append(np.full(len(keep), None, dtype=object))
 
-        if not detections:
+        if not xyxy_parts:
             return sv.Detections.empty()
 
-        detections = np.array(detections)
-        return sv.Detections(xyxy=detections[:, :4], confidence=detections[:, 4], tracker_id=detections[:, 5])
+        return sv.Detections(
+            xyxy=np.concatenate(xyxy_parts),
+            confidence=np.concatenate(confidence_parts),
+            tracker_id=np.concatenate(tracker_id_parts),
+        )
 
     def supervision_to_players(self, detections: sv.Detections) -> list[Player]:
         """
@@ -538,36 +538,37 @@ class GameConfigPhase:
         cached_player_details = []
         cached_face_boxes = []
         
-        # Extract faces from detected players using FaceExtractor (same as main game)
-        for player in detected_players:
-            if player is not None:
-                # Get player coordinates (same method as main game)
-                player_coords = player.get_coords()
-                player_id = player.get_id()
-                
-                # Store player bounding box for overlay
-                x1, y1, x2, y2 = player_coords
-                cached_player_boxes.append((x1, y1, x2 - x1, y2 - y1))
-                
-                # Store player details for overlay display
-                cached_player_details.append({
-                    'id': player_id,
-                    'confidence': player.get_confidence()
-                })
+        # Extract faces from detected players using FaceExtractor (same as main game), in one batched detection
+        players_with_bbox = [player for player in detected_players if player is not None]
+        face_results = self.face_extractor.extract_faces(
+            webcam_frame, [(player.get_coords(), player.get_id()) for player in players_with_bbox], return_bbox=True
+        )
+        for player, result in zip(players_with_bbox, face_results):
+            # Get player coordinates (same method as main game)
+            player_coords = player.get_coords()
+            player_id = player.get_id()
+            
+            # Store player bounding box for overlay
+            x1, y1, x2, y2 = player_coords
+            cached_player_boxes.append((x1, y1, x2 - x1, y2 - y1))
+            
+            # Store player details for overlay display
+            cached_player_details.append({
+                'id': player_id,
+                'confidence': player.get_confidence()
+            })
+            
+            # FaceExtractor.extract_faces() result with bounding box return - no duplication!
+            if result is not None and result[0] is not None:  # face_crop is not None
+                face_crop, face_bbox = result
                 
-                # Use FaceExtractor.extract_face() with bounding box return - no duplication!
-                result = self.face_extractor.extract_face(webcam_frame, player_coords, player_id, return_bbox=True)
+                # Store face for display
+                self.current_faces.append(face_crop)
                 
-                if result[0] is not None:  # face_crop is not None
-                    face_crop, face_bbox = result
-                    
-                    # Store face for display
-                    self.current_faces.append(face_crop)
-                    
-                    # Store face bounding box if we got coordinates
-                    if face_bbox is not None:
-                        face_x1, face_y1, fw, fh = face_bbox
-                        cached_face_boxes.append((face_x1, face_y1, fw, fh))
+                # Store face bounding box if we got coordinates
+                if face_bbox is not None:
+                    face_x1, face_y1, fw, fh = face_bbox
+                    cached_face_boxes.append((face_x1, face_y1, fw, fh))
         
         # Cache both player and face boxes for overlay drawing
         self.cached_player_boxes = cached_player_boxes
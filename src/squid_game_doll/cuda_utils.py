@@ -16,6 +16,16 @@ class CudaProcessor:
             print("✅ CUDA OpenCV available - enabling GPU acceleration")
         else:
             print("ℹ️ CUDA OpenCV not available - using CPU processing")
+        # src_id of the last uploaded threshold_dilate source, reused while the caller retries thresholds on it
+        self._last_src_id = None
+        self._gpu_src = None
+        self._dilate_filters = {}
+        # CLAHE and lookup table objects of nn_preprocess, created once per parameter set
+        self._clahes = {}
+        self._luts = {}
+        # nn_preprocess runs on its own stream with device buffers kept across frames (created on first use)
+        self._nn_stream = None
+        self._nn_buffers = None
     
     def is_cuda_available(self) -> bool:
         """Check if CUDA is available"""
@@ -63,6 +73,101 @@ class CudaProcessor:
         # CPU fallback
         return cv2.GaussianBlur(src, ksize, sigmaX, sigmaY)
 
+    def threshold_dilate(
+        self, src: cv2.UMat, thresh: int, kernel: np.ndarray, src_id: Optional[int] = None
+    ) -> cv2.UMat:
+        """GPU-accelerated THRESH_TOZERO threshold followed by a dilation, with CPU fallback.
+
+        The source is uploaded on every call, unless src_id is the same as in the previous call: the caller
+        then guarantees the data is unchanged (frame buffers are reused in place, so the array identity does
+        not tell), and a threshold search over one channel only downloads the masked results.
+        """
+        if self.cuda_available and isinstance(src, np.ndarray):
+            try:
+                if src_id is None or src_id != self._last_src_id:
+                    self._gpu_src = cv2.cuda_GpuMat()
+                    self._gpu_src.upload(src)
+                    self._last_src_id = src_id
+                key = (src.dtype.str, kernel.shape, kernel.tobytes())
+                dilate_filter = self._dilate_filters.get(key)
+                if dilate_filter is None:
+                    dilate_filter = cv2.cuda.createMorphologyFilter(cv2.MORPH_DILATE, self._gpu_src.type(), kernel)
+                    self._dilate_filters[key] = dilate_filter
+                _, gpu_thr = cv2.cuda.threshold(self._gpu_src, thresh, 255, cv2.THRESH_TOZERO)
+                return dilate_filter.apply(gpu_thr).download()
+            except Exception:
+                self._last_src_id = None  # Fall back to CPU
+
+        # CPU fallback
+        _, thr = cv2.threshold(src, thresh, 255, cv2.THRESH_TOZERO)
+        return cv2.dilate(thr, kernel)
+
+    def nn_preprocess(
+        self,
+        src: cv2.UMat,
+        mask: cv2.UMat,
+        dsize: Tuple[int, int],
+        clahe_params: Optional[Tuple[float, Tuple[int, int]]] = None,
+        lut: Optional[np.ndarray] = None,
+    ) -> Optional[cv2.UMat]:
+        """GPU preprocessing of a NN input frame: mask, optional CLAHE on the YCrCb luma
+        with clahe_params (clip limit, tile grid), INTER_AREA resize, optional lookup table.
+
+        The frame is uploaded once and only the resized result is downloaded. All the steps are queued
+        on a dedicated stream, into device buffers reused from frame to frame (no per-frame GPU allocation),
+        and the host only waits once for the download.
+        Returns None if CUDA is not available or fails, the caller then runs its CPU path.
+        """
+        if not (self.cuda_available and isinstance(src, np.ndarray)):
+            return None
+        try:
+            if self._nn_stream is None:
+                self._nn_stream = cv2.cuda_Stream()
+                self._nn_buffers = {
+                    name: cv2.cuda_GpuMat() for name in ("src", "mask", "frame", "ycrcb", "resized", "lut")
+                }
+            stream = self._nn_stream
+            buffers = self._nn_buffers
+
+            buffers["src"].upload(src, stream)
+            buffers["mask"].upload(mask, stream)
+            # A masked operation leaves the pixels outside the mask untouched: clear the reused buffer first
+            buffers["frame"].create(src.shape[0], src.shape[1], buffers["src"].type())
+            buffers["frame"].setTo((0, 0, 0, 0), stream)
+            gpu_frame = cv2.cuda.bitwise_and(
+                buffers["src"], buffers["src"], dst=buffers["frame"], mask=buffers["mask"], stream=stream
+            )
+
+            if clahe_params is not None:
+                clahe = self._clahes.get(clahe_params)
+                if clahe is None:
+                    clahe = cv2.cuda.createCLAHE(clipLimit=clahe_params[0], tileGridSize=clahe_params[1])
+                    self._clahes[clahe_params] = clahe
+                ycrcb = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGR2YCrCb, dst=buffers["ycrcb"], stream=stream)
+                channels = list(cv2.cuda.split(ycrcb, stream=stream))
+                channels[0] = clahe.apply(channels[0], stream)
+                cv2.cuda.merge(channels, dst=ycrcb, stream=stream)
+                gpu_frame = cv2.cuda.cvtColor(ycrcb, cv2.COLOR_YCrCb2BGR, dst=buffers["frame"], stream=stream)
+
+            gpu_frame = cv2.cuda.resize(
+                gpu_frame, dsize, dst=buffers["resized"], interpolation=cv2.INTER_AREA, stream=stream
+            )
+
+            if lut is not None:
+                # Point operation, applied on the resized frame like the CPU path
+                key = lut.tobytes()
+                lookup_table = self._luts.get(key)
+                if lookup_table is None:
+                    lookup_table = cv2.cuda.createLookUpTable(lut.reshape(1, 256))
+                    self._luts[key] = lookup_table
+                gpu_frame = lookup_table.transform(gpu_frame, dst=buffers["lut"], stream=stream)
+
+            result = gpu_frame.download(stream)
+            stream.waitForCompletion()
+            return result
+        except Exception:
+            return None
+
 
 # Global instance for easy access
 cuda_processor = CudaProcessor()
@@ -84,6 +189,22 @@ def cuda_gaussian_blur(src: cv2.UMat, ksize: Tuple[int, int], sigmaX: float, sig
     return cuda_processor.gaussian_blur(src, ksize, sigmaX, sigmaY)
 
 
+def cuda_threshold_dilate(src: cv2.UMat, thresh: int, kernel: np.ndarray, src_id: Optional[int] = None) -> cv2.UMat:
+    """GPU-accelerated threshold (THRESH_TOZERO) and dilation"""
+    return cuda_processor.threshold_dilate(src, thresh, kernel, src_id)
+
+
+def cuda_nn_preprocess(
+    src: cv2.UMat,
+    mask: cv2.UMat,
+    dsize: Tuple[int, int],
+    clahe_params: Optional[Tuple[float, Tuple[int, int]]] = None,
+    lut: Optional[np.ndarray] = None,
+) -> Optional[cv2.UMat]:
+    """GPU mask, CLAHE, lookup table and resize of a NN input frame (None if CUDA cannot be used)"""
+    return cuda_processor.nn_preprocess(src, mask, dsize, clahe_params, lut)
+
+
 def is_cuda_opencv_available() -> bool:
     """Check if CUDA OpenCV is available"""
     return cuda_processor.is_cuda_available()
\ No newline at end of file
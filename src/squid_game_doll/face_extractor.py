@@ -1,9 +1,16 @@
+import bisect
+from collections import OrderedDict
 import cv2
 import numpy as np
 import mediapipe as mp
 from .constants import PLAYER_SIZE
 from .cuda_utils import cuda_cvt_color, cuda_resize, is_cuda_opencv_available
 
+# Larger person crops are downscaled to this size (longest side) before the face detection in extract_face
+DETECTION_SIZE = 192
+# Number of player faces kept in memory, the least recently used ones are evicted first
+FACE_MEMORY_SIZE = 64
+
 
 class FaceExtractor:
     def __init__(self):
@@ -14,10 +21,17 @@ class FaceExtractor:
             min_detection_confidence=0.5
         )
         print("✅ Using MediaPipe face detector (Google)")
-        self._memory = {}
+        self._memory = OrderedDict()
 
     def reset_memory(self):
-        self._memory = {}
+        self._memory = OrderedDict()
+
+    def _remember(self, id: int, face_crop: cv2.UMat) -> None:
+        """Stores the last face of a player, evicting the least recently used faces beyond FACE_MEMORY_SIZE"""
+        self._memory[id] = face_crop
+        self._memory.move_to_end(id)
+        while len(self._memory) > FACE_MEMORY_SIZE:
+            self._memory.popitem(last=False)
 
     def extract_face(self, frame: cv2.UMat, bbox: tuple, id: int, return_bbox: bool = False):
         """
@@ -39,14 +53,27 @@ class FaceExtractor:
         if person_crop.size == 0:
             return None
 
+        faces = self._detect_faces(person_crop)
+        return self._select_face(person_crop, (x1, y1), faces, id, return_bbox)
+
+    def _detect_faces(self, person_crop: cv2.UMat) -> list:
+        """Runs the detector on a single person crop, returns the faces (x, y, w, h) in crop coordinates"""
+        # Detect on a downscaled copy, the detector cost grows with the input size
+        h, w = person_crop.shape[:2]
+        detection_crop = person_crop
+        if max(h, w) > DETECTION_SIZE:
+            scale = DETECTION_SIZE / max(h, w)
+            small_size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            detection_crop = cv2.resize(person_crop, small_size, interpolation=cv2.INTER_AREA)
+
         # MediaPipe detection (Google's ultra-fast)
-        rgb_image = cv2.cvtColor(person_crop, cv2.COLOR_BGR2RGB)
+        rgb_image = cv2.cvtColor(detection_crop, cv2.COLOR_BGR2RGB)
         results = self.face_detector.process(rgb_image)
         
         # Convert MediaPipe format to (x, y, w, h) for compatibility
+        # Relative coordinates map the detection back to the full resolution crop
         faces = []
         if results.detections:
-            h, w = person_crop.shape[:2]
             for detection in results.detections:
                 bbox = detection.location_data.relative_bounding_box
                 # Convert relative coordinates to absolute pixels
@@ -55,7 +82,89 @@ class FaceExtractor:
                 width = int(bbox.width * w)
                 height = int(bbox.height * h)
                 faces.append([x, y, width, height])
+        return faces
+
+    def extract_faces(self, frame: cv2.UMat, players: list, return_bbox: bool = False) -> list:
+        """
+        Batched version of extract_face: the player crops are scaled to DETECTION_SIZE height and packed
+        side by side into strips no wider than high, MediaPipe runs once per strip. The detector letterboxes
+        its input to a square, so each player is seen at the same resolution as by extract_face.
+        Args:
+            frame (numpy.ndarray): The input frame.
+            players (list): (bbox, id) tuples, bbox being (x1, y1, x2, y2) in frame coordinates.
+            return_bbox (bool): As in extract_face.
+        Returns:
+            list: The extract_face result of each player, in the same order.
+        """
+        crops = []
+        for idx, (bbox, id) in enumerate(players):
+            x1, y1, x2, y2 = bbox
+            person_crop = frame[y1:y2, x1:x2]
+            if person_crop.size > 0:
+                crops.append((idx, bbox, id, person_crop))
+
+        # Group consecutive crops while the strip stays square at most
+        strips = []
+        strip_width = 0
+        for _, _, _, person_crop in crops:
+            h, w = person_crop.shape[:2]
+            width = max(1, int(w * DETECTION_SIZE / h))
+            if not strips or strip_width + width > DETECTION_SIZE:
+                strips.append([])
+                strip_width = 0
+            strips[-1].append(person_crop)
+            strip_width += width
 
+        faces = []
+        for strip in strips:
+            if len(strip) == 1:
+                faces.append(self._detect_faces(strip[0]))
+            else:
+                faces.extend(self._detect_faces_strip(strip))
+
+        extracted = [None] * len(players)
+        for k, (idx, bbox, id, person_crop) in enumerate(crops):
+            extracted[idx] = self._select_face(person_crop, bbox[:2], faces[k], id, return_bbox)
+        return extracted
+
+    def _detect_faces_strip(self, person_crops: list) -> list:
+        """Runs the detector once on the person crops side by side, returns the faces (x, y, w, h) of each crop"""
+        scaled = []
+        offsets = []  # x offset of each crop in the strip
+        strip_width = 0
+        for person_crop in person_crops:
+            h, w = person_crop.shape[:2]
+            width = max(1, int(w * DETECTION_SIZE / h))
+            scaled.append(cv2.resize(person_crop, (width, DETECTION_SIZE), interpolation=cv2.INTER_AREA))
+            offsets.append(strip_width)
+            strip_width += width
+        strip = np.concatenate(scaled, axis=1)
+
+        rgb_image = cv2.cvtColor(strip, cv2.COLOR_BGR2RGB)
+        results = self.face_detector.process(rgb_image)
+
+        # Map each detection back to the crop holding its center
+        faces = [[] for _ in person_crops]
+        if results.detections:
+            for detection in results.detections:
+                bbox = detection.location_data.relative_bounding_box
+                x, y = bbox.xmin * strip_width, bbox.ymin * DETECTION_SIZE
+                width, height = bbox.width * strip_width, bbox.height * DETECTION_SIZE
+                center = x + width / 2
+                if not 0 <= center < strip_width:
+                    continue
+                k = bisect.bisect_right(offsets, center) - 1
+                scale = DETECTION_SIZE / person_crops[k].shape[0]
+                x -= offsets[k]
+                faces[k].append([int(x / scale), int(y / scale), int(width / scale), int(height / scale)])
+        return faces
+
+    def _select_face(self, person_crop: cv2.UMat, origin: tuple, faces: list, id: int, return_bbox: bool):
+        """
+        Crops the largest of the faces (x, y, w, h) detected in person_crop, or falls back to the face in memory.
+        origin (x1, y1) is the position of person_crop in the full frame.
+        """
+        x1, y1 = origin
         if len(faces) > 0:
             # Get the largest face (most confident detection)
             face = max(faces, key=lambda x: x[2] * x[3])  # Sort by area (w * h)
@@ -81,7 +190,7 @@ class FaceExtractor:
 
             face_crop = cuda_resize(face_crop, (PLAYER_SIZE, PLAYER_SIZE), interpolation=cv2.INTER_AREA)  # GPU-accelerated resize
             
-            self._memory[id] = face_crop
+            self._remember(id, face_crop)
             
             if return_bbox:
                 # Return both face crop and bounding box coordinates in full frame
@@ -92,6 +201,7 @@ class FaceExtractor:
                 return face_crop
 
         if id in self._memory:
+            self._memory.move_to_end(id)
             if return_bbox:
                 return self._memory[id], None  # Return cached face with no bbox info
             else:
@@ -1,6 +1,7 @@
 import cv2
 import numpy as np
 import platform
+import queue
 import threading
 import sys
 from time import sleep
@@ -9,6 +10,15 @@ from pygame import Rect
 from loguru import logger
 
 from .game_settings import GameSettings
+from .cuda_utils import cuda_nn_preprocess, is_cuda_opencv_available
+
+# Brightness & contrast fine-tuning of the NN frame: saturate(alpha * x + beta) as a lookup table
+BRIGHTNESS_ALPHA = 1.2  # Contrast control (1.0-3.0)
+BRIGHTNESS_BETA = 20  # Brightness control (0-100)
+BRIGHTNESS_LUT = np.clip(np.rint(np.arange(256) * BRIGHTNESS_ALPHA + BRIGHTNESS_BETA), 0, 255).astype(np.uint8)
+# Contrast limited adaptive histogram equalization of the NN frame luma
+CLAHE_CLIP_LIMIT = 2.0
+CLAHE_TILE_GRID = (8, 8)
 
 
 class GameCamera:
@@ -56,17 +66,73 @@ class GameCamera:
 
         self.exposure = -1
         self.index = index
+        self._clahe = cv2.createCLAHE(clipLimit=CLAHE_CLIP_LIMIT, tileGridSize=CLAHE_TILE_GRID)
     
         
         self.lock = threading.Lock()
 
+        # Background capture (see start_capture): freshest frame only, older ones are dropped
+        self._frames = queue.Queue(maxsize=1)
+        self._capture_thread = None
+        self._stop_capture = threading.Event()
+
     def __del__(self):
         """
         Releases the video capture object.
         """
-        if self.cap is not None and self.cap.isOpened():
+        self.release()
+
+    def release(self) -> None:
+        """
+        Stops the background capture and releases the video capture object.
+        """
+        self.stop_capture()
+        if getattr(self, "cap", None) is not None and self.cap.isOpened():
             self.cap.release()
 
+    def start_capture(self) -> None:
+        """
+        Starts reading the webcam in a background thread, so that the capture cadence
+        does not depend on the processing time of each frame. read() then returns the
+        most recent frame captured.
+        """
+        if self.fixed_image is not None or self._capture_thread is not None:
+            return
+        self._stop_capture.clear()
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+        logger.debug("Webcam capture thread started")
+
+    def stop_capture(self) -> None:
+        """
+        Stops the background capture thread, read() reads again from the webcam directly.
+        """
+        thread = getattr(self, "_capture_thread", None)
+        if thread is None:
+            return
+        self._stop_capture.set()
+        thread.join(timeout=2.0)
+        self._capture_thread = None
+        # Drop the last captured frame
+        try:
+            self._frames.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _capture_loop(self) -> None:
+        """Background thread loop that keeps only the latest webcam frame in the queue."""
+        while not self._stop_capture.is_set():
+            with self.lock:
+                ret, frame = self.cap.read() if self.cap is not None else (False, None)
+            if not ret:
+                sleep(0.01)
+                continue
+            try:
+                self._frames.get_nowait()  # Drop the frame nobody consumed
+            except queue.Empty:
+                pass
+            self._frames.put(frame)
+
     def getVideoCapture(self) -> cv2.VideoCapture:
         """
         Returns the video capture object.
@@ -150,6 +216,8 @@ class GameCamera:
 
     @staticmethod
     def get_cv2_cap() -> int:
+        # Neither backend hands out GPU (write-combined) surfaces: MJPG is decoded by OpenCV into
+        # ordinary system memory and MSMF hardware transforms are disabled, so frames need no special readback
         cap = cv2.CAP_V4L2
         if platform.system() != "Linux":
             cap = cv2.CAP_DSHOW
@@ -197,6 +265,12 @@ class GameCamera:
             self.lock.release()
 
     def read(self) -> tuple[bool, cv2.UMat]:
+        if self._capture_thread is not None:
+            try:
+                return (True, self._frames.get(timeout=1.0))
+            except queue.Empty:
+                return (False, None)
+
         self.lock.acquire()
         try:
             if self.fixed_image is not None:
@@ -247,10 +321,11 @@ class GameCamera:
         """
 
         ret, nn_frame = self.read()
-        original_frame = nn_frame.copy()
         if not ret:
             logger.error("Error: Unable to capture frame.")
             return (None, None, Rect(0, 0, 0, 0))
+        # The steps below never write into the captured frame, so it is returned as is (no full frame copy)
+        original_frame = nn_frame
 
         # Get the bounding rectangle of the vision area (use gameplay coordinates)
         gameplay_areas = settings.get_gameplay_areas()
@@ -266,8 +341,7 @@ class GameCamera:
 
         # We need to zero frame areas outside the list of rectangles in vision_area
         # Let's create a mask for the vision area
-        mask = cv2.cvtColor(nn_frame, cv2.COLOR_BGR2GRAY)
-        mask[:] = 0  # Initialize mask to zero
+        mask = np.zeros(nn_frame.shape[:2], dtype=np.uint8)
         for rect in rectangles:
             # Skip invalid rectangles to prevent division by zero
             if reference_surface.w == 0 or reference_surface.h == 0 or rect.width == 0 or rect.height == 0:
@@ -290,9 +364,6 @@ class GameCamera:
                 # Note: coordinates are already transformed by get_gameplay_areas()
                 cv2.rectangle(mask, (x, y), (x + w, y + h), 255, -1)
 
-        # Apply the mask to the frame
-        nn_frame = cv2.bitwise_and(nn_frame, nn_frame, mask=mask)
-
         # Compute proportions relative to the webcam Sruf, and then apply to the raw CV2 frame
         x_ratio = bounding_rect.x / reference_surface.w
         y_ratio = bounding_rect.y / reference_surface.h
@@ -304,28 +375,15 @@ class GameCamera:
         w = int(w_ratio * nn_frame.shape[1])
         h = int(h_ratio * nn_frame.shape[0])
 
-        # Crop the frame to the bounding rectangle
+        # Crop the frame to the bounding rectangle, then apply the mask only to the cropped area
         # Note: coordinates are already transformed by get_gameplay_areas()
         nn_frame = nn_frame[y : y + h, x : x + w]
-
-        if settings.get_param("img_normalization", False):
-            # Normalize brightness and contrast using histogram equalization
-            lab = cv2.cvtColor(nn_frame, cv2.COLOR_BGR2LAB)  # Convert to LAB color space
-            l, a, b = cv2.split(lab)
-            l = cv2.equalizeHist(l)  # Apply histogram equalization to the L channel
-            lab = cv2.merge((l, a, b))
-            nn_frame = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)  # Convert back to BGR
-
-        if settings.get_param("img_brightness", False):
-            # Adjust brightness & contrast (fine-tuning)
-            alpha = 1.2  # Contrast control (1.0-3.0)
-            beta = 20  # Brightness control (0-100)
-            nn_frame = cv2.convertScaleAbs(nn_frame, alpha=alpha, beta=beta)
+        crop_mask = mask[y : y + h, x : x + w]
+        # Get cropped frame dimensions
+        video_h, video_w = nn_frame.shape[:2]
 
         # Resize the frame to match NN expected input size
         # but keep the aspect ratio
-        # Get original frame dimensions
-        video_h, video_w = nn_frame.shape[:2]
         # Calculate the aspect ratio
         aspect_ratio = video_w / video_h
         # Calculate the new dimensions while maintaining the aspect ratio
@@ -336,8 +394,45 @@ class GameCamera:
             new_h = max_size
             new_w = int(max_size * aspect_ratio)
 
+        normalize = settings.get_param("img_normalization", False)
+        brightness = settings.get_param("img_brightness", False)
+
+        if is_cuda_opencv_available():
+            # CUDA: single upload of the crop, the steps below and the resize run on the GPU
+            gpu_frame = cuda_nn_preprocess(
+                nn_frame,
+                crop_mask,
+                (new_w, new_h),
+                (CLAHE_CLIP_LIMIT, CLAHE_TILE_GRID) if normalize else None,
+                BRIGHTNESS_LUT if brightness else None,
+            )
+            if gpu_frame is not None:
+                return (gpu_frame, original_frame, Rect(x, y, w, h))
+
+        if cv2.ocl.useOpenCL():
+            # Transparent API: the processing below up to the resize runs on the OpenCL device
+            nn_frame, crop_mask = cv2.UMat(nn_frame), cv2.UMat(crop_mask)
+
+        nn_frame = cv2.bitwise_and(nn_frame, nn_frame, mask=crop_mask)
+
+        if normalize:
+            # Normalize brightness and contrast with CLAHE on the luma (YCrCb is cheaper to convert than LAB)
+            ycrcb = cv2.cvtColor(nn_frame, cv2.COLOR_BGR2YCrCb, dst=nn_frame)
+            # Equalize only the Y channel in place, Cr and Cb are not split/merged
+            y_channel = cv2.extractChannel(ycrcb, 0)
+            self._clahe.apply(y_channel, dst=y_channel)
+            cv2.insertChannel(y_channel, ycrcb, 0)
+            nn_frame = cv2.cvtColor(ycrcb, cv2.COLOR_YCrCb2BGR, dst=ycrcb)  # Convert back to BGR in the same buffer
+
         nn_frame = cv2.resize(nn_frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
 
+        if brightness:
+            # Adjust brightness & contrast (fine-tuning). The lookup is a per-pixel affine map, so it is applied
+            # in place on the resized frame instead of the full crop (only saturated edges differ slightly)
+            nn_frame = cv2.LUT(nn_frame, BRIGHTNESS_LUT, dst=nn_frame)
+        if isinstance(nn_frame, cv2.UMat):
+            nn_frame = nn_frame.get()  # Single download of the (small) NN input
+
         return (nn_frame, original_frame, Rect(x, y, w, h))
 
     @staticmethod
@@ -1,5 +1,6 @@
 import pygame
 import cv2
+import numpy as np
 from collections.abc import Callable
 from PIL import Image
 
@@ -33,9 +34,16 @@ BUTTON_HOVER_COLOR: tuple[int, int, int] = (200, 0, 0)
 BUTTON_TEXT_COLOR: tuple[int, int, int] = (0, 0, 0)  # Black text
 # Font Color
 FONT_COLOR: tuple[int, int, int] = RED
+# Light contrast and brightness boost of the player faces: saturate(alpha * x + beta) as a lookup table
+FACE_CONTRAST_ALPHA = 1.1  # Light contrast multiplier
+FACE_CONTRAST_BETA = 5  # Small brightness offset
+FACE_CONTRAST_LUT = cv2.convertScaleAbs(np.arange(256, dtype=np.uint8), alpha=FACE_CONTRAST_ALPHA, beta=FACE_CONTRAST_BETA).ravel()
 
 
 class GameScreen:
+    # Bounding box color indexed by (eliminated << 1) | has_moved
+    COLOR_LUT: tuple[tuple[int, int, int], ...] = (GREEN, YELLOW, RED, RED)
+
     def __init__(self, desktop_size: tuple[int, int], display_idx: int):
         self._font_lcd: pygame.font.FontType = pygame.font.Font(ROOT + "/media/font_lcd.ttf", 48)
         self._font_small: pygame.font.FontType = pygame.font.Font(ROOT + "/media/SpaceGrotesk-Regular.ttf", 36)
@@ -48,6 +56,11 @@ class GameScreen:
         self._background_image = pygame.image.load(ROOT + "/media/background-2.png")
         self._background_image = pygame.transform.scale(self._background_image, desktop_size)
 
+        # Media images loaded once, see _get_asset
+        self._assets: dict[str, pygame.Surface] = {}
+        # Persistent webcam surface, see _get_video_surface
+        self._video_surface: pygame.Surface = None
+
         # Position and size of reinit button
         self._reset_button: pygame.Rect = pygame.Rect(desktop_size[0] - 210, desktop_size[1] - 60, 200, 50)
         self._config_button: pygame.Rect = pygame.Rect(desktop_size[0] - 210, desktop_size[1] - 60 - 50 - 10, 200, 50)
@@ -64,6 +77,34 @@ class GameScreen:
         self._victory_animation = None
         self._victory_started = False
 
+    def convert_assets(self) -> None:
+        """Converts cached images to the display pixel format.
+
+        Must be called once the display mode is set, so that blits do not
+        need a per-frame pixel format conversion.
+        """
+        self._background_image = self._background_image.convert()
+        for name, img in self._assets.items():
+            self._assets[name] = img.convert_alpha()
+
+    def _get_asset(self, name: str) -> pygame.Surface:
+        """Returns the image from the media folder, loading it on first use."""
+        img = self._assets.get(name)
+        if img is None:
+            img = pygame.image.load(ROOT + "/media/" + name)
+            if pygame.display.get_surface() is not None:
+                img = img.convert_alpha()
+            self._assets[name] = img
+        return img
+
+    def _get_video_surface(self, frame: cv2.UMat, view_port: tuple[int, int]) -> pygame.Surface:
+        """Copies the frame into a surface reused across frames as long as the view port does not change."""
+        if self._video_surface is None or self._video_surface.get_size() != view_port:
+            self._video_surface = pygame.Surface(view_port)
+            if pygame.display.get_surface() is not None:
+                self._video_surface = self._video_surface.convert()
+        return opencv_to_pygame(frame, view_port, self._video_surface)
+
     def reset_active_buttons(self):
         self._active_buttons = {}
         self._click_callback = None
@@ -155,15 +196,15 @@ class GameScreen:
         (w, h), (x_web, y_web) = self.compute_webcam_feed(webcam_frame)
 
         # Convert OpenCV BGR to RGB for PyGame
-        video_surface: pygame.Surface = opencv_to_pygame(webcam_frame, (w, h))
+        video_surface: pygame.Surface = self._get_video_surface(webcam_frame, (w, h))
 
         fullscreen.blit(video_surface, (x_web, y_web))
 
         self.draw_reset_button(fullscreen)
 
-        img: pygame.Surface = pygame.image.load(ROOT + "/media/shooter_off.png")
+        img: pygame.Surface = self._get_asset("shooter_off.png")
         if shooter is not None and shooter.isOnline():
-            img = pygame.image.load(ROOT + "/media/shooter.png")
+            img = self._get_asset("shooter.png")
 
         # Add shooter icon depending on ESP32 status
         fullscreen.blit(img, (self.get_desktop_width() - img.get_width(), 0))
@@ -185,7 +226,7 @@ class GameScreen:
         (w, h), (x_web, y_web) = self.compute_webcam_feed(nn_frame)
 
         # Convert OpenCV BGR to RGB for PyGame
-        video_surface: pygame.Surface = opencv_to_pygame(nn_frame, (w, h))
+        video_surface: pygame.Surface = self._get_video_surface(nn_frame, (w, h))
 
         if game_state in [INIT, GREEN_LIGHT, RED_LIGHT]:
             self.draw_finish_area(video_surface, settings)
@@ -243,9 +284,9 @@ class GameScreen:
                 ),
             )
 
-        img: pygame.Surface = pygame.image.load(ROOT + "/media/shooter_off.png")
+        img: pygame.Surface = self._get_asset("shooter_off.png")
         if shooter is not None and shooter.isOnline():
-            img = pygame.image.load(ROOT + "/media/shooter.png")
+            img = self._get_asset("shooter.png")
 
         # Add shooter icon depending on ESP32 status
         fullscreen.blit(img, (self.get_desktop_width() - img.get_width() - 20, 20))
@@ -273,10 +314,9 @@ class GameScreen:
         settings: GameSettings,
         add_previous_pos: bool = False,
     ) -> None:
-        for player in players:
-            color: tuple[int, int, int] = (
-                RED if player.is_eliminated() else (GREEN if not player.has_moved(settings) else YELLOW)
-            )
+        moved = Player.moved_mask(players, settings)
+        for player, has_moved in zip(players, moved):
+            color: tuple[int, int, int] = GameScreen.COLOR_LUT[(player.is_eliminated() << 1) | bool(has_moved)]
             x, y, w, h = player.get_bbox()
             # transforms the coordinates from the webcam frame to the pygame frame using the ratios
             x, y, w, h = x / self._ratio, y / self._ratio, w / self._ratio, h / self._ratio
@@ -374,10 +414,15 @@ class GameScreen:
         text_rect: pygame.Rect = text.get_rect(center=self._config_button.center)
         screen.blit(text, text_rect)
 
-    # Load player images (without blur)
+    # Load player images (without blur), decoded once per path
     def load_player_image(self, image_path: str) -> pygame.image:
-        img = Image.open(image_path).convert("RGBA").resize((PLAYER_SIZE, PLAYER_SIZE))
-        pygame_img = pygame.image.fromstring(img.tobytes(), img.size, "RGBA")
+        pygame_img = self._assets.get(image_path)
+        if pygame_img is None:
+            img = Image.open(image_path).convert("RGBA").resize((PLAYER_SIZE, PLAYER_SIZE))
+            pygame_img = pygame.image.fromstring(img.tobytes(), img.size, "RGBA")
+            if pygame.display.get_surface() is not None:
+                pygame_img = pygame_img.convert_alpha()
+            self._assets[image_path] = pygame_img
         return pygame_img
 
     # Arrange players in a triangle
@@ -442,7 +487,7 @@ class GameScreen:
         surface.blit(diamond, (x, y), special_flags=pygame.BLEND_RGBA_ADD)
 
     def display_won(self, surface: pygame.Surface, amount: int, font: pygame.font.FontType) -> None:
-        pig_img = pygame.image.load(ROOT + "/media/pig.png")
+        pig_img = self._get_asset("pig.png")
         amount = f"₩ {amount:,}"
         text = font.render(amount, True, (255, 215, 0))
         pos = (surface.get_width() // 3, 0)
@@ -530,20 +575,10 @@ class GameScreen:
         """
         Apply basic face enhancement: light contrast boost and normalization
         """
-        # Convert pygame surface to opencv array
+        # Apply light contrast and brightness boost: the same curve on every channel,
+        # so the pixels are mapped directly, without orientation or color order changes
         face_array = pygame.surfarray.array3d(face_surface)
-        face_array = face_array.swapaxes(0, 1)  # Fix orientation
-        face_cv = cv2.cvtColor(face_array, cv2.COLOR_RGB2BGR)
-        
-        # Apply light contrast and brightness boost
-        alpha = 1.1  # Light contrast multiplier
-        beta = 5     # Small brightness offset
-        enhanced = cv2.convertScaleAbs(face_cv, alpha=alpha, beta=beta)
-        
-        # Convert back to pygame surface
-        result_rgb = cv2.cvtColor(enhanced, cv2.COLOR_BGR2RGB)
-        result_rgb = result_rgb.swapaxes(0, 1)  # Fix orientation back
-        enhanced_surface = pygame.surfarray.make_surface(result_rgb)
+        enhanced_surface = pygame.surfarray.make_surface(FACE_CONTRAST_LUT[face_array])
         
         # Apply color tint only for game end state (winners/losers)
         if is_winner:  # Winners
@@ -1,9 +1,18 @@
+from functools import lru_cache
 import cv2
-from numpy.linalg import norm
 import numpy as np
 import pygame
 
 
+@lru_cache(maxsize=32)
+def _gamma_table(gamma: float) -> np.ndarray:
+    """Returns the 256-entry lookup table for the given gamma value (shared between calls, read-only)."""
+    values = np.arange(256, dtype=np.float64)
+    table = (((values / 255.0) ** (1.0 / gamma)) * 255).astype(np.uint8)
+    table.flags.writeable = False
+    return table
+
+
 def gamma(img: cv2.UMat, gamma: float) -> cv2.UMat:
     """
     Adjusts the gamma of the given image.
@@ -15,9 +24,7 @@ def gamma(img: cv2.UMat, gamma: float) -> cv2.UMat:
     Returns:
     cv2.UMat: The gamma-adjusted image.
     """
-    invGamma = 1.0 / gamma
-    table = np.array([((i / 255.0) ** invGamma) * 255 for i in np.arange(0, 256)]).astype("uint8")
-    return cv2.LUT(img, table)
+    return cv2.LUT(img, _gamma_table(gamma))
 
 
 def brightness(img: cv2.UMat) -> cv2.UMat:
@@ -32,14 +39,17 @@ def brightness(img: cv2.UMat) -> cv2.UMat:
     """
     if len(img.shape) == 3:
         # Colored RGB or BGR (*Do Not* use HSV images with this function)
-        # create brightness with euclidean norm
-        return np.average(norm(img, axis=2)) / np.sqrt(3)
+        # create brightness with euclidean norm, in float32 without the linalg.norm dispatch
+        pixels = img.astype(np.float32, copy=False)
+        return float(np.sqrt(np.einsum("ijk,ijk->ij", pixels, pixels)).mean()) / np.sqrt(3)
     else:
         # Grayscale
         return np.average(img)
 
 
-def opencv_to_pygame(frame: np.ndarray, view_port: tuple[int, int]) -> pygame.Surface:
+def opencv_to_pygame(
+    frame: np.ndarray, view_port: tuple[int, int], surface: pygame.Surface = None
+) -> pygame.Surface:
     """Converts an OpenCV frame to a PyGame surface using optimized numpy operations.
     
     COORDINATE SYSTEM FOR GAMEPLAY:
@@ -52,12 +62,20 @@ def opencv_to_pygame(frame: np.ndarray, view_port: tuple[int, int]) -> pygame.Su
     Parameters:
     frame (np.ndarray): The OpenCV frame to convert.
     view_port (tuple): The view port for the webcam (width, height).
+    surface (pygame.Surface): Optional persistent surface of view_port size, updated in place.
     Returns:
     pygame.Surface: The PyGame surface.
     """
     # Step 1: Resize using cv2.resize (optimized for images, much faster than scipy zoom)
     resized = cv2.resize(frame, view_port)
-    
+
+    if surface is not None and surface.get_size() == tuple(view_port):
+        # Write into the surface pixels: (w, h) indexing is a transpose of the frame, BGR to RGB
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[...] = resized.swapaxes(0, 1)[:, :, ::-1]
+        del pixels  # unlock the surface
+        return surface
+
     # Step 2: Horizontal flip using numpy (faster than cv2.flip)
     flipped = resized[:, ::-1]
     
@@ -1,14 +1,56 @@
+import itertools
 from typing import Callable, Tuple, Optional
 import cv2
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # from drafts.gradient_search import test_gradient
 # from drafts.motion_pattern import motion_pattern_analysis
+from .cuda_utils import cuda_threshold_dilate
 from .display import add_exclusion_rectangles
 from .img_processing import brightness
 from .laser_coordinate_filter import LaserCoordinateFilter
 
 DEBUG_LASER_FIND = False
 
+# Thresholds tried by the circle search, in the full sweep and when retrying the previous frame's strategy
+MAX_TRIES = 7
+FAST_PATH_TRIES = 2
+
+# One id per threshold search, unique across finders sharing the GPU: the searched channel stays uploaded for its tries
+_search_ids = itertools.count()
+
+# One 9x9 dilation is equivalent to four 3x3 iterations, with a single pass over the image
+DILATE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9))
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _bright_pixels_bbox(channel, threshold, max_count):
+        """
+        Counts the pixels above threshold and returns (count, min_x, min_y, max_x, max_y).
+        Stops as soon as the count exceeds max_count.
+        """
+        height, width = channel.shape
+        count = 0
+        min_x, min_y, max_x, max_y = width, height, -1, -1
+        for y in range(height):
+            for x in range(width):
+                if channel[y, x] > threshold:
+                    count += 1
+                    if count > max_count:
+                        return count, 0, 0, -1, -1
+                    min_x = min(min_x, x)
+                    max_x = max(max_x, x)
+                    min_y = min(min_y, y)
+                    max_y = max(max_y, y)
+        return count, min_x, min_y, max_x, max_y
+
 
 # source tbc https://stackoverflow.com/questions/9860667/writing-robust-color-and-size-invariant-circle-detection-with-opencv-based-on
 # source tbc https://www.pyimagesearch.com/2014/07/21/detecting-circles-images-using-opencv-hough-circles/
@@ -16,11 +58,11 @@ DEBUG_LASER_FIND = False
 class LaserFinder:
     """
     Traditional computer vision-based laser detection system.
-    
+
     This class implements multiple laser detection strategies using classical
-    computer vision techniques including color filtering, thresholding, 
+    computer vision techniques including color filtering, thresholding,
     morphological operations, and Hough circle detection.
-    
+
     The LaserFinder provides:
     - Multiple detection strategies with automatic fallback
     - Red laser dot detection using color space analysis
@@ -28,13 +70,13 @@ class LaserFinder:
     - Adaptive thresholding for different lighting conditions
     - Coordinate smoothing and filtering
     - Strategy performance tracking and selection
-    
+
     Detection strategies (in priority order):
     1. Circle detection with threshold adaptation
     2. Color-based red laser detection
     3. Grayscale intensity-based detection
     4. Secondary threshold-based detection
-    
+
     Example:
         finder = LaserFinder()
         laser_coord, output_img = finder.find_laser(camera_frame)
@@ -42,31 +84,41 @@ class LaserFinder:
             print(f"Laser detected at: {laser_coord}")
             print(f"Detection method: {finder.get_winning_strategy()}")
     """
-    
-    def __init__(self):
+
+    def __init__(self, debug: bool = False):
         """
         Initialize the LaserFinder with default detection strategies.
-        
+
         Sets up coordinate filtering and registers multiple detection
         strategies for robust laser detection under various conditions.
+
+        Args:
+            debug: If True, find_laser also returns an annotated output image
+                   (otherwise the output image is None) and the search strategies
+                   show their intermediate images in OpenCV windows.
         """
+        self.debug = debug
         self.prev_strategy = None
         self.prev_threshold = None
         self.laser_coord = None
         self.prev_img = None
         self.prev_candidates = []
-        
+
         # Initialize coordinate smoothing filter
         self.coordinate_filter = LaserCoordinateFilter(
             smoothing_factor=0.7,  # Moderate smoothing
             max_history_size=10,
             outlier_threshold=100.0,  # Increased threshold to reduce rejections
-            min_confidence_for_update=0.05  # Lower threshold
+            min_confidence_for_update=0.05,  # Lower threshold
         )
 
+    def set_debug(self, debug: bool) -> None:
+        """Enables or disables the debug output images and windows"""
+        self.debug = debug
+
     def laser_found(self) -> bool:
         """Check if laser was detected in the last detection attempt.
-        
+
         Returns:
             bool: True if laser was found, False otherwise
         """
@@ -99,7 +151,7 @@ class LaserFinder:
         nn_frame (cv2.UMat): Optional preprocessed NN frame (ignored in traditional method).
 
         Returns:
-        tuple: The coordinates of the laser in full frame space, the output image.
+        tuple: The coordinates of the laser in full frame space, the output image (None unless debug is set).
         """
         # Note: nn_frame parameter is ignored in traditional LaserFinder - always uses full frame
         add_exclusion_rectangles(img, rects, (0, 0, 0))
@@ -107,32 +159,38 @@ class LaserFinder:
             self.find_laser_by_red_color,
             self.find_laser_by_grayscale,
         ]  # , self.find_laser_by_green_color, self.find_laser_by_gray_centroids]
+        attempts = [(strategy, MAX_TRIES) for strategy in strategies]
 
-        for strategy in strategies:
+        if self.laser_found() and self.prev_strategy is not None and self.prev_threshold is not None:
+            # Fast path: the laser moves little between frames, retry last frame's strategy around its threshold.
+            # On a miss the other strategies run their full sweep, the previous one is not run a second time.
+            attempts = [(getattr(self, self.prev_strategy), FAST_PATH_TRIES)] + [
+                (strategy, max_tries) for strategy, max_tries in attempts if strategy.__name__ != self.prev_strategy
+            ]
+
+        for strategy, max_tries in attempts:
             if DEBUG_LASER_FIND:
-                print(f"Trying strategy {strategy.__name__}")
-
-            # Handle both cv2.UMat and numpy arrays
-            if isinstance(img, cv2.UMat):
-                # Convert to numpy, copy, then back to UMat
-                img_np = cv2.UMat.get(img)
-                img_copy = cv2.UMat(img_np.copy())
-            else:
-                img_copy = img.copy()
-            (coord, output) = strategy(img_copy)
+                print(f"Trying strategy {strategy.__name__} ({max_tries} tries)")
+
+            # Strategies only read the image (split / cvtColor allocate their own buffers), no copy needed
+            coord, output = strategy(img, max_tries=max_tries)
             if coord is not None:
                 print(f"Found laser at {coord}")
-                
+
                 # Update the coordinate filter with raw detection
                 # Traditional laser finder doesn't have confidence, so use 1.0
                 self.coordinate_filter.update(coord, confidence=1.0)
-                
+
                 # Store raw coordinate for compatibility
                 self.laser_coord = coord
-                
+
+                self.prev_strategy = strategy.__name__
+                if output is None:
+                    return (coord, None)
+
                 # Get smoothed coordinate for display
                 smoothed_coord = self.coordinate_filter.get_smoothed_coordinate()
-                
+
                 cv2.putText(
                     output,
                     text=strategy.__name__,
@@ -149,7 +207,7 @@ class LaserFinder:
                     fontScale=0.5,
                     color=(0, 255, 0),
                 )
-                
+
                 # Show both raw and smoothed coordinates
                 cv2.putText(
                     output,
@@ -168,8 +226,7 @@ class LaserFinder:
                         fontScale=0.4,
                         color=(255, 255, 0),  # Yellow for smoothed
                     )
-                
-                self.prev_strategy = strategy.__name__
+
                 return (coord, output)
 
         # No laser found - update filter with None
@@ -182,20 +239,26 @@ class LaserFinder:
         return (None, None)
 
     def find_laser_by_threshold(
-        self, channel: cv2.UMat, searchfunction: Callable[[cv2.UMat], list]
+        self, channel: cv2.UMat, searchfunction: Callable[[cv2.UMat], list], max_tries: int = MAX_TRIES
     ) -> (tuple, cv2.UMat):
         """
         Finds the laser in the given channel using a thresholding strategy.
 
         Parameters:
         channel (cv2.UMat): The input channel.
+        max_tries (int): Maximum number of thresholds tried by the circle search.
 
         Returns:
         tuple: The coordinates of the laser, the output image, and the threshold value.
         """
-        MAX_TRIES = 7
         MIN_THRESHOLD = 100
         MAX_THRESHOLD = 255
+
+        # Fast path: a laser dot is the single brightest blob of the channel
+        center, output = self.find_laser_by_peak(channel, MIN_THRESHOLD)
+        if center is not None:
+            return (center, output)
+
         threshold = (MIN_THRESHOLD + MAX_THRESHOLD) // 2
 
         if (
@@ -205,15 +268,14 @@ class LaserFinder:
         ):
             threshold = self.prev_threshold
 
+        search_id = next(_search_ids)
         tries = 0
-        while tries < MAX_TRIES:
+        while tries < max_tries:
             if DEBUG_LASER_FIND:
-                print(f"Try: {tries}/{MAX_TRIES}")
+                print(f"Try: {tries}/{max_tries}")
 
-            _, diff_thr = cv2.threshold(channel, threshold, 255, cv2.THRESH_TOZERO)
-            # cv2.imshow("Threshold", cv2.cvtColor(diff_thr, cv2.COLOR_GRAY2BGR))
-
-            masked_channel = cv2.dilate(diff_thr, None, iterations=4)
+            # Threshold and dilate on the GPU when available, the channel stays uploaded across tries
+            masked_channel = cuda_threshold_dilate(channel, threshold, DILATE_KERNEL, src_id=search_id)
             # cv2.imshow("Dilate", cv2.cvtColor(masked_channel, cv2.COLOR_GRAY2BGR))
 
             circles = searchfunction(masked_channel)
@@ -252,25 +314,13 @@ class LaserFinder:
                 tries += 1
                 continue
 
-            # draw circles found
-            output = cv2.cvtColor(masked_channel, cv2.COLOR_GRAY2BGR)
-            background = cv2.cvtColor(channel, cv2.COLOR_GRAY2BGR)
-
             if self.laser_coord and circles_cpt > 1:
                 if DEBUG_LASER_FIND:
                     print(f"Selected closest circle to previous position")
                 circles.sort(key=lambda c: (c[0] - self.laser_coord[0]) ** 2 + (c[1] - self.laser_coord[1]) ** 2)
 
             center = (int(circles[0][0]), int(circles[0][1]))
-            output = cv2.addWeighted(background, 0.2, output, 0.5, 0)
-            cv2.putText(
-                output,
-                text="THR=" + str(threshold),
-                org=(10, 20),
-                fontFace=cv2.FONT_HERSHEY_COMPLEX,
-                fontScale=0.5,
-                color=(0, 255, 0),
-            )
+            output = self.draw_threshold_output(channel, masked_channel, threshold) if self.debug else None
             self.prev_threshold = threshold
             self.laser_coord = center
             return (center, output)
@@ -278,6 +328,76 @@ class LaserFinder:
         self.laser_coord = None
         return (None, None)
 
+    def find_laser_by_peak(self, channel: cv2.UMat, min_threshold: int) -> (tuple, cv2.UMat):
+        """
+        Finds the laser as the single blob around the channel maximum, without any circle search.
+
+        Parameters:
+        channel (cv2.UMat): The input channel.
+        min_threshold (int): Minimum brightness of the laser dot.
+
+        Returns:
+        tuple: The coordinates of the laser and the output image (None unless debug is set), or (None, None) if the
+        brightest pixels do not form exactly one small blob.
+        """
+        PEAK_MARGIN = 20
+        MAX_SPOT_AREA = 400
+
+        if isinstance(channel, cv2.UMat):
+            channel = channel.get()
+
+        _, max_val, _, _ = cv2.minMaxLoc(channel)
+        if max_val <= min_threshold:
+            return (None, None)
+
+        threshold = max(int(max_val) - PEAK_MARGIN, min_threshold)
+        roi, x0, y0 = channel, 0, 0
+        if NUMBA_AVAILABLE:
+            # One compiled pass: more bright pixels than a dot can hold rejects the frame right away,
+            # otherwise the blobs are labelled only inside the bounding box of the bright pixels.
+            count, x0, y0, x1, y1 = _bright_pixels_bbox(channel, threshold, MAX_SPOT_AREA)
+            if count > MAX_SPOT_AREA:
+                if DEBUG_LASER_FIND:
+                    print(
+                        f"Peak search: more than {MAX_SPOT_AREA} pixels above {threshold}, falling back to circle search"
+                    )
+                return (None, None)
+            roi = channel[y0 : y1 + 1, x0 : x1 + 1]
+
+        _, mask = cv2.threshold(roi, threshold, 255, cv2.THRESH_BINARY)
+        blobs, _, stats, centroids = cv2.connectedComponentsWithStats(mask, connectivity=8)
+
+        # Label 0 is the background: exactly one bright, dot-sized blob is expected
+        if blobs != 2 or stats[1, cv2.CC_STAT_AREA] > MAX_SPOT_AREA:
+            if DEBUG_LASER_FIND:
+                print(f"Peak search: {blobs - 1} blobs above {threshold}, falling back to circle search")
+            return (None, None)
+
+        center = (int(round(centroids[1][0])) + x0, int(round(centroids[1][1])) + y0)
+        output = None
+        if self.debug:
+            if roi is not channel:
+                _, mask = cv2.threshold(channel, threshold, 255, cv2.THRESH_BINARY)
+            output = self.draw_threshold_output(channel, mask, threshold)
+        self.prev_threshold = threshold
+        self.laser_coord = center
+        return (center, output)
+
+    def draw_threshold_output(self, channel: cv2.UMat, masked_channel: cv2.UMat, threshold: int) -> cv2.UMat:
+        """Blends the thresholded channel over the original one and prints the threshold used."""
+        output = cv2.cvtColor(masked_channel, cv2.COLOR_GRAY2BGR)
+        background = cv2.cvtColor(channel, cv2.COLOR_GRAY2BGR)
+        output = cv2.addWeighted(background, 0.2, output, 0.5, 0)
+        cv2.putText(
+            output,
+            text="THR=" + str(threshold),
+            org=(10, 20),
+            fontFace=cv2.FONT_HERSHEY_COMPLEX,
+            fontScale=0.5,
+            color=(0, 255, 0),
+        )
+        return output
+
     def search_by_hough_circles(self, channel: cv2.UMat) -> list:
 
         if DEBUG_LASER_FIND:
@@ -319,7 +439,7 @@ class LaserFinder:
 
         candidates = test_gradient(channel)
 
-        _, best_candidate = motion_pattern_analysis(
+        _, best_index = motion_pattern_analysis(
             candidates,
             self.prev_candidates,
             channel,
@@ -332,10 +452,10 @@ class LaserFinder:
         self.prev_img = channel
         self.prev_candidates = candidates
 
-        if best_candidate is None:
+        if best_index is None:
             return []
 
-        return best_candidate["position"]
+        return candidates[best_index]["position"]
     """
 
     def search_by_contours(self, channel: cv2.UMat) -> list:
@@ -344,7 +464,7 @@ class LaserFinder:
         contours, _ = cv2.findContours(channel, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
         # Convert grayscale image to BGR for visualization
-        result = cv2.cvtColor(channel, cv2.COLOR_GRAY2BGR)
+        result = cv2.cvtColor(channel, cv2.COLOR_GRAY2BGR) if self.debug else None
 
         detected_centroids = []
 
@@ -361,20 +481,22 @@ class LaserFinder:
                     cy = int(M["m01"] / M["m00"])
                     detected_centroids.append((cx, cy))
 
-                    # Draw contour and centroid for visualization
-                    cv2.drawContours(result, [contour], -1, (0, 255, 0), 2)
-                    cv2.circle(result, (cx, cy), 5, (0, 0, 255), -1)
-                    cv2.putText(
-                        result,
-                        f"({cx},{cy})",
-                        (cx + 10, cy - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (255, 0, 0),
-                        1,
-                    )
-
-        cv2.imshow("Contours", result)
+                    if self.debug:
+                        # Draw contour and centroid for visualization
+                        cv2.drawContours(result, [contour], -1, (0, 255, 0), 2)
+                        cv2.circle(result, (cx, cy), 5, (0, 0, 255), -1)
+                        cv2.putText(
+                            result,
+                            f"({cx},{cy})",
+                            (cx + 10, cy - 10),
+                            cv2.FONT_HERSHEY_SIMPLEX,
+                            0.5,
+                            (255, 0, 0),
+                            1,
+                        )
+
+        if self.debug:
+            cv2.imshow("Contours", result)
         return detected_centroids
 
     def find_laser_by_threshold_2(self, channel: cv2.UMat) -> Tuple[Tuple, cv2.UMat]:
@@ -458,79 +580,85 @@ class LaserFinder:
                         1,
                     )
 
-            cv2.imshow("Contours", img_conv)
+            if self.debug:
+                cv2.imshow("Contours", img_conv)
             return ((1, 1), img_conv)
 
         self.laser_coord = (1, 1)
         return ((1, 1), None)
 
-    def find_laser_by_grayscale(self, img: cv2.UMat) -> Tuple[Tuple, cv2.UMat]:
+    def find_laser_by_grayscale(self, img: cv2.UMat, max_tries: int = MAX_TRIES) -> Tuple[Tuple, cv2.UMat]:
         """
         Finds the laser in the given image using a grayscale strategy.
 
         Parameters:
         img (cv2.UMat): The input image.
+        max_tries (int): Maximum number of thresholds tried.
 
         Returns:
         tuple: The coordinates of the laser, the output image, and the threshold value.
         """
         gray_image = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         normalized_gray_image = cv2.normalize(gray_image, None, alpha=0, beta=255, norm_type=cv2.NORM_MINMAX)
-        return self.find_laser_by_threshold(normalized_gray_image, searchfunction=self.search_by_hough_circles)
+        return self.find_laser_by_threshold(
+            normalized_gray_image, searchfunction=self.search_by_hough_circles, max_tries=max_tries
+        )
 
-    def find_laser_by_red_color(self, img: cv2.UMat) -> Tuple[Tuple, cv2.UMat]:
+    def find_laser_by_red_color(self, img: cv2.UMat, max_tries: int = MAX_TRIES) -> Tuple[Tuple, cv2.UMat]:
         """
         Finds the laser in the given image using the red color channel.
 
         Parameters:
         img (cv2.UMat): The input image.
-        hint (int): The threshold hint to use for the strategy.
+        max_tries (int): Maximum number of thresholds tried.
 
         Returns:
         tuple: The coordinates of the laser, the output image, and the threshold value.
         """
-        (_, _, R) = cv2.split(img)
-        return self.find_laser_by_threshold(R, searchfunction=self.search_by_hough_circles)
+        R = cv2.extractChannel(img, 2)
+        return self.find_laser_by_threshold(R, searchfunction=self.search_by_hough_circles, max_tries=max_tries)
 
-    def find_laser_by_green_color(self, img: cv2.UMat) -> (tuple, cv2.UMat):
+    def find_laser_by_green_color(self, img: cv2.UMat, max_tries: int = MAX_TRIES) -> (tuple, cv2.UMat):
         """
         Finds the laser in the given image using the green color channel.
 
         Parameters:
         img (cv2.UMat): The input image.
-        hint (int): The threshold hint to use for the strategy.
+        max_tries (int): Maximum number of thresholds tried.
 
         Returns:
         tuple: The coordinates of the laser, the output image, and the threshold value.
         """
-        (_, G, _) = cv2.split(img)
-        return self.find_laser_by_threshold(G, searchfunction=self.search_by_hough_circles)
+        G = cv2.extractChannel(img, 1)
+        return self.find_laser_by_threshold(G, searchfunction=self.search_by_hough_circles, max_tries=max_tries)
 
-    def find_laser_by_red_color_motion(self, img: cv2.UMat) -> (tuple, cv2.UMat):
+    def find_laser_by_red_color_motion(self, img: cv2.UMat, max_tries: int = MAX_TRIES) -> (tuple, cv2.UMat):
         """
         Finds the laser in the given image using the red color channel.
 
         Parameters:
         img (cv2.UMat): The input image.
-        hint (int): The threshold hint to use for the strategy.
+        max_tries (int): Maximum number of thresholds tried.
 
         Returns:
         tuple: The coordinates of the laser, the output image, and the threshold value.
         """
-        (_, _, R) = cv2.split(img)
-        return self.find_laser_by_threshold(R, searchfunction=self.search_by_motion_analysis)
+        R = cv2.extractChannel(img, 2)
+        return self.find_laser_by_threshold(R, searchfunction=self.search_by_motion_analysis, max_tries=max_tries)
 
-    def find_laser_by_gray_centroids(self, img: cv2.UMat) -> (tuple, cv2.UMat):
+    def find_laser_by_gray_centroids(self, img: cv2.UMat, max_tries: int = MAX_TRIES) -> (tuple, cv2.UMat):
         """
         Finds the laser in the given image using the red color channel.
 
         Parameters:
         img (cv2.UMat): The input image.
-        hint (int): The threshold hint to use for the strategy.
+        max_tries (int): Maximum number of thresholds tried.
 
         Returns:
         tuple: The coordinates of the laser, the output image, and the threshold value.
         """
         gray_image = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         normalized_gray_image = cv2.normalize(gray_image, None, alpha=0, beta=255, norm_type=cv2.NORM_MINMAX)
-        return self.find_laser_by_threshold(normalized_gray_image, searchfunction=self.search_by_contours)
+        return self.find_laser_by_threshold(
+            normalized_gray_image, searchfunction=self.search_by_contours, max_tries=max_tries
+        )
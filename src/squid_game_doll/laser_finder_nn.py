@@ -42,13 +42,16 @@ class LaserFinderNN:
     Provides similar interface to the original LaserFinder class.
     """
     
-    def __init__(self, model_path: str = "yolov5l6_e200_b8_tvt302010_laser_v5.pt"):
+    def __init__(self, model_path: str = "yolov5l6_e200_b8_tvt302010_laser_v5.pt", debug: bool = False):
         """
         Initializes the LaserFinderNN object.
         
         Args:
             model_path: Path to the YOLOv5 model file
+            debug: If True, find_laser also returns an annotated copy of the inference
+                   image (otherwise the output image is None)
         """
+        self.debug = debug
         self.base_model_path = model_path
         self.model = None
         self.laser_coord = None
@@ -162,6 +165,10 @@ class LaserFinderNN:
         except Exception as e:
             logger.warning(f"Unexpected error during Jetson optimization: {e}")
 
+    def set_debug(self, debug: bool) -> None:
+        """Enables or disables the annotated output image"""
+        self.debug = debug
+
     def laser_found(self) -> bool:
         """Check if laser was found in the last detection."""
         return self.laser_coord is not None
@@ -242,7 +249,8 @@ class LaserFinderNN:
 
             # Process results
             detections = []
-            output_image = img_np.copy()
+            # The annotated copy is only built in debug mode, it costs a full frame copy
+            output_image = img_np.copy() if self.debug else None
             
             if results.xyxy[0] is not None and len(results.xyxy[0]) > 0:
                 predictions = results.xyxy[0].cpu().numpy()  # xyxy format
@@ -273,17 +281,18 @@ class LaserFinderNN:
                         'class_name': class_name
                     }
                     detections.append(detection)
-                    
-                    # Draw bounding box on inference image (not scaled)
-                    cv2.rectangle(output_image, (int(x1), int(y1)), (int(x2), int(y2)), (0, 255, 0), 2)
-                    
-                    # Draw center point on inference image (not scaled)
-                    cv2.circle(output_image, (int((x1 + x2) / 2), int((y1 + y2) / 2)), 5, (0, 0, 255), -1)
-                    
-                    # Draw label on inference image
-                    label = f"{class_name}: {conf:.2f}"
-                    cv2.putText(output_image, label, (int(x1), int(y1) - 5), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+
+                    if output_image is not None:
+                        # Draw bounding box on inference image (not scaled)
+                        cv2.rectangle(output_image, (int(x1), int(y1)), (int(x2), int(y2)), (0, 255, 0), 2)
+                        
+                        # Draw center point on inference image (not scaled)
+                        cv2.circle(output_image, (int((x1 + x2) / 2), int((y1 + y2) / 2)), 5, (0, 0, 255), -1)
+                        
+                        # Draw label on inference image
+                        label = f"{class_name}: {conf:.2f}"
+                        cv2.putText(output_image, label, (int(x1), int(y1) - 5), 
+                                  cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
                     
                     if DEBUG_LASER_FIND_NN:
                         coord_info = f"(scaled to full frame)" if use_nn_frame else "(original coordinates)"
@@ -302,20 +311,21 @@ class LaserFinderNN:
                 self.laser_coord = raw_coord
                 self.prev_detections = detections
                 
-                # Add strategy info to output image
-                frame_info = "NN frame" if use_nn_frame else "full frame"
-                cv2.putText(output_image, f"YOLOv5 Neural Network ({frame_info})", (10, 30), 
-                          cv2.FONT_HERSHEY_COMPLEX, 0.6, (0, 255, 0), 2)
-                cv2.putText(output_image, f"Best conf: {confidence:.3f}", (10, 60), 
-                          cv2.FONT_HERSHEY_COMPLEX, 0.5, (0, 255, 0), 1)
-                
-                # Show both raw and smoothed coordinates
-                smoothed_coord = self.coordinate_filter.get_smoothed_coordinate()
-                cv2.putText(output_image, f"Raw: {raw_coord}", (10, 90), 
-                          cv2.FONT_HERSHEY_COMPLEX, 0.4, (0, 255, 255), 1)  # Cyan for raw
-                if smoothed_coord:
-                    cv2.putText(output_image, f"Smooth: {smoothed_coord}", (10, 110), 
-                              cv2.FONT_HERSHEY_COMPLEX, 0.4, (255, 255, 0), 1)  # Yellow for smoothed
+                if output_image is not None:
+                    # Add strategy info to output image
+                    frame_info = "NN frame" if use_nn_frame else "full frame"
+                    cv2.putText(output_image, f"YOLOv5 Neural Network ({frame_info})", (10, 30), 
+                              cv2.FONT_HERSHEY_COMPLEX, 0.6, (0, 255, 0), 2)
+                    cv2.putText(output_image, f"Best conf: {confidence:.3f}", (10, 60), 
+                              cv2.FONT_HERSHEY_COMPLEX, 0.5, (0, 255, 0), 1)
+                    
+                    # Show both raw and smoothed coordinates
+                    smoothed_coord = self.coordinate_filter.get_smoothed_coordinate()
+                    cv2.putText(output_image, f"Raw: {raw_coord}", (10, 90), 
+                              cv2.FONT_HERSHEY_COMPLEX, 0.4, (0, 255, 255), 1)  # Cyan for raw
+                    if smoothed_coord:
+                        cv2.putText(output_image, f"Smooth: {smoothed_coord}", (10, 110), 
+                                  cv2.FONT_HERSHEY_COMPLEX, 0.4, (255, 255, 0), 1)  # Yellow for smoothed
                 
                 if DEBUG_LASER_FIND_NN:
                     logger.debug(f"Selected best detection at {self.laser_coord} with confidence {best_detection['confidence']:.3f}")
@@ -1,12 +1,22 @@
-import numpy as np
+import queue
 import socket
+import struct
+import threading
 from typing import Tuple
-from numpy.linalg import norm
-from time import time, sleep
-from simple_pid import PID
+from math import hypot
+from time import monotonic, monotonic_ns
 import ast
+import functools
+import numpy as np
 from loguru import logger
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configuration constants
 DEFAULT_ESP32_PORT = 15555
 DEFAULT_DEADBAND_PX = 10
@@ -22,23 +32,149 @@ RATE_LIMIT_MAX_CHANGE = 100
 SOCKET_RECV_BUFFER_SIZE = 128
 SOCKET_RECV_BUFFER_SIZE_SMALL = 64
 MAX_CONNECTION_ATTEMPTS = 3
+SOCKET_TIMEOUT_S = 0.5
+RECONNECT_BACKOFF_S = 2.0
+# UDP angles datagram: (H, V) target angles as two little-endian float32
+ANGLES_DATAGRAM = struct.Struct("<ff")
+# Repeated angles are sent again after this delay, in case the datagram with them was lost
+ANGLES_RESEND_S = 0.5
+
+# Per-frame tracking logs (formatting them costs more than the tracking arithmetic)
+DEBUG_LASER_SHOOTER = False
+
+
+def _parse_angle_pair(text: str) -> Tuple[float, float]:
+    """Parses an '(h, v)' reply of the ESP32, raises ValueError if malformed."""
+    h, v = text.strip().strip("()").split(",")
+    return (float(h), float(v))
+
+
+class _AxisPID:
+    """
+    PID controller of one servo axis, with a setpoint of 0: proportional on error, derivative on
+    measurement, integral and output clamped to the servo limits, new output every sample_time seconds
+    (the subset of simple_pid.PID used here, without its generic options on the per-frame path).
+    """
+
+    __slots__ = (
+        "kp",
+        "ki",
+        "kd",
+        "lower",
+        "upper",
+        "sample_time",
+        "_integral",
+        "_last_time",
+        "_last_input",
+        "_last_output",
+    )
+
+    def __init__(
+        self,
+        kp: float,
+        ki: float,
+        kd: float,
+        output_limits: Tuple[float, float],
+        sample_time: float,
+        starting_output: float,
+    ):
+        self.kp, self.ki, self.kd = kp, ki, kd
+        self.lower, self.upper = output_limits
+        self.sample_time = sample_time
+        self._integral = min(max(starting_output, self.lower), self.upper)
+        self._last_time = monotonic()
+        self._last_input = None
+        self._last_output = None
+
+    def reset(self) -> None:
+        """Clears the integral, the last input and the last output, as simple_pid.PID.reset does."""
+        self._integral = min(max(0.0, self.lower), self.upper)
+        self._last_time = monotonic()
+        self._last_input = None
+        self._last_output = None
+
+    def __call__(self, input_: float) -> float:
+        now = monotonic()
+        dt = (now - self._last_time) or 1e-16
+        if dt < self.sample_time and self._last_output is not None:
+            return self._last_output
+
+        lower, upper = self.lower, self.upper
+        error = -input_
+        d_input = input_ - self._last_input if self._last_input is not None else 0.0
+        integral = self._integral + self.ki * error * dt
+        integral = upper if integral > upper else (lower if integral < lower else integral)
+        output = self.kp * error + integral - self.kd * d_input / dt
+        output = upper if output > upper else (lower if output < lower else output)
+
+        self._integral = integral
+        self._last_output = output
+        self._last_input = input_
+        self._last_time = now
+        return output
+
+
+def _pid_update(state, params, h_input, v_input, now):
+    """
+    Update of both axes, with the same arithmetic as _AxisPID.__call__, compiled with numba when
+    available so the PID costs a single call per frame. Updates state in place and returns the (h, v) outputs.
+
+    state rows (h, v): integral, last time, last input, last output (NaN while there is none).
+    params rows (h, v): kp, ki, kd, lower, upper, sample time.
+    """
+    for axis in range(2):
+        input_ = h_input if axis == 0 else v_input
+        kp, ki, kd, lower, upper, sample_time = params[axis]
+        dt = now - state[axis, 1]
+        if dt == 0.0:
+            dt = 1e-16
+        if dt < sample_time and not np.isnan(state[axis, 3]):
+            continue
+
+        error = -input_
+        d_input = 0.0 if np.isnan(state[axis, 2]) else input_ - state[axis, 2]
+        integral = state[axis, 0] + ki * error * dt
+        integral = upper if integral > upper else (lower if integral < lower else integral)
+        output = kp * error + integral - kd * d_input / dt
+        output = upper if output > upper else (lower if output < lower else output)
+
+        state[axis, 0] = integral
+        state[axis, 1] = now
+        state[axis, 2] = input_
+        state[axis, 3] = output
+    return state[0, 3], state[1, 3]
+
+
+if NUMBA_AVAILABLE:
+    _pid_update = njit(cache=True)(_pid_update)
+
+
+def _with_socket_lock(method):
+    """Runs the method holding the socket lock, so that ESP32 request/response exchanges never interleave."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._socket_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class LaserShooter:
     """
     ESP32-based laser targeting system controller.
-    
+
     This class handles communication with an ESP32 microcontroller that controls
     servo motors for laser positioning. It provides PID-controlled targeting,
     rate limiting, and network communication with the ESP32 device.
-    
+
     The LaserShooter can:
     - Control servo positions for horizontal and vertical laser aiming
     - Apply PID control for smooth and accurate targeting
     - Rate limit movement to prevent jerky motion
     - Handle network communication failures gracefully
     - Configure movement parameters and targeting coefficients
-    
+
     Example:
         shooter = LaserShooter("192.168.1.100", deadband_px=15)
         shooter.set_coeffs((55.0, 18.0))  # Set pixel-to-degree conversion
@@ -46,7 +182,13 @@ class LaserShooter:
             shooter.aim_at_target((320, 240))  # Aim at center of 640x480 image
     """
 
-    def __init__(self, ipaddress: str, deadband_px: int = DEFAULT_DEADBAND_PX, max_frequency_hz: int = DEFAULT_MAX_FREQUENCY_HZ, enable_laser: bool = True):
+    def __init__(
+        self,
+        ipaddress: str,
+        deadband_px: int = DEFAULT_DEADBAND_PX,
+        max_frequency_hz: int = DEFAULT_MAX_FREQUENCY_HZ,
+        enable_laser: bool = True,
+    ):
         """
         Initialize the LaserShooter with network and control parameters.
 
@@ -55,7 +197,7 @@ class LaserShooter:
             deadband_px: Minimum pixel movement required to trigger servo update
             max_frequency_hz: Maximum servo update frequency to prevent overload
             enable_laser: Whether laser functionality is enabled (safety feature)
-            
+
         Note:
             The ESP32 must be running the laser controller firmware and be
             accessible on the specified IP address at port 15555.
@@ -64,9 +206,24 @@ class LaserShooter:
         self.ip_address = ipaddress
         self.port = DEFAULT_ESP32_PORT
         self.aliensocket: socket = None
+        # After failed connection attempts, exchanges are dropped until this monotonic() time instead of blocking
+        self._next_connect_time: float = 0.0
+        # Serializes the request/response exchanges on aliensocket (see __post_command)
+        self._socket_lock = threading.RLock()
+        # Latest (method, args) command waiting for the background sender, older ones are dropped
+        self._commands_queue = queue.Queue(maxsize=1)
+        self._sender_thread = None
+        # Connected UDP socket of send_angles, created on first use, the datagram buffer packed in place
+        # for every update and a copy of the last datagram sent (None when the ESP32 target is unknown)
+        self._angles_socket: socket = None
+        self._angles_data = bytearray(ANGLES_DATAGRAM.size)
+        self._last_angles_data: bytearray = None
+        self._last_angles_time: float = 0.0
+        # monotonic_ns() time of the last send_instructions exchange (immune to wall-clock adjustments)
         self.last_sent: int = 0
         self.deadband: int = deadband_px
         self.min_period_S: float = 1.0 / max_frequency_hz
+        self._min_period_ns: int = round(self.min_period_S * 1e9)
         self.limits: Tuple[float, float] = self.get_limits()
         self.pid_ok: bool = self.init_PID()
         self.coeffs: Tuple[float, float] = (DEFAULT_PX_PER_DEGREE_H, DEFAULT_PX_PER_DEGREE_V)
@@ -74,7 +231,7 @@ class LaserShooter:
 
     def is_laser_enabled(self) -> bool:
         """Check if laser functionality is enabled.
-        
+
         Returns:
             bool: True if laser is enabled, False otherwise
         """
@@ -82,7 +239,7 @@ class LaserShooter:
 
     def set_coeffs(self, px_per_degree: Tuple[float, float]):
         """Set the pixel per degree conversion coefficients.
-        
+
         Args:
             px_per_degree: Tuple of (horizontal_coeff, vertical_coeff) for pixel to degree conversion
         """
@@ -99,24 +256,29 @@ class LaserShooter:
         if self.limits is not None:
             zero = self.__getzeropos()
             k = DEFAULT_PID_KP
-            self.pid_v = PID(
+            self.pid_v = _AxisPID(
                 k,
                 k * PID_KI_FACTOR,
                 k * PID_KD_FACTOR,
-                setpoint=0,
                 output_limits=(self.limits[1][0], self.limits[1][1]),
+                sample_time=self.min_period_S,
                 starting_output=zero[1],
             )
-            self.pid_h = PID(
+            self.pid_h = _AxisPID(
                 k,
                 k * PID_KI_FACTOR,
                 k * PID_KD_FACTOR,
-                setpoint=0,
                 output_limits=(self.limits[0][0], self.limits[0][1]),
+                sample_time=self.min_period_S,
                 starting_output=zero[0],
             )
-            self.pid_h.sample_time = self.min_period_S
-            self.pid_v.sample_time = self.min_period_S
+            if NUMBA_AVAILABLE:
+                # State and parameters of both controllers for the compiled _pid_update
+                pids = (self.pid_h, self.pid_v)
+                self._pid_state = np.array([[pid._integral, pid._last_time, np.nan, np.nan] for pid in pids])
+                self._pid_params = np.array(
+                    [[pid.kp, pid.ki, pid.kd, pid.lower, pid.upper, pid.sample_time] for pid in pids]
+                )
             self.send_angles(zero)
             self.prev_output_h = zero[0]
             self.prev_output_v = zero[1]
@@ -166,35 +328,27 @@ class LaserShooter:
         if target is None or laser is None:
             return 0
 
-        error = norm(np.array(laser) - np.array(target))
-
         vertical_error = laser[1] - target[1]
         horizontal_error = laser[0] - target[0]
+        error = hypot(horizontal_error, vertical_error)
 
-        up = False
-        down = False
-        left = False
-        right = False
-
-        if vertical_error < -1 * self.deadband:
-            down = True
-        elif vertical_error > self.deadband:
-            up = True
-
-        if horizontal_error < -1 * self.deadband:
-            right = True
-        elif horizontal_error > self.deadband:
-            left = True
+        # Directions outside the deadband, as plain comparisons (at most one per axis is True)
+        up = vertical_error > self.deadband
+        down = vertical_error < -self.deadband
+        left = horizontal_error > self.deadband
+        right = horizontal_error < -self.deadband
 
         step_v = min(max(MIN_STEP_SIZE, abs(vertical_error / self.coeffs[1])), MAX_STEP_SIZE)
         step_h = min(max(MIN_STEP_SIZE, abs(horizontal_error / self.coeffs[0])), MAX_STEP_SIZE)
 
-        logger.debug(f"Laser {laser} Target {target}")
-        logger.debug(f"Up:{up}, Down:{down}, Left:{left}, Right:{right}")
-        logger.debug(f"Step V {step_v}, step H {step_h}")
+        if DEBUG_LASER_SHOOTER:
+            logger.debug(f"Laser {laser} Target {target}")
+            logger.debug(f"Up:{up}, Down:{down}, Left:{left}, Right:{right}")
+            logger.debug(f"Step V {step_v}, step H {step_h}")
 
-        self.send_instructions(up, down, left, right, step_v, step_h)
-        # Send the updated angles to ESP32
+        # Send the updated angles to ESP32 from the background sender: the current angles are read
+        # with a TCP round trip, which must not hold up the tracking loop
+        self.send_instructions_async(up, down, left, right, step_v, step_h)
         return error
 
     def track_target_PID(self, laser: tuple, target: tuple) -> float:
@@ -219,32 +373,34 @@ class LaserShooter:
         if target is None or laser is None:
             return 0
 
-        error = norm(np.array(laser) - np.array(target))
-
-        vertical_error = -1 * (laser[1] - target[1])
-        horizontal_error = -1 * (laser[0] - target[0])
-
-        output_h = self.pid_h(horizontal_error)
-        output_v = self.pid_v(vertical_error)
-
-        if abs(output_h - self.prev_output_h) > RATE_OF_CHANGE:
-            logger.debug(f"Rate limiting H from {output_h} to {RATE_OF_CHANGE}")
-            if output_h > self.prev_output_h:
-                output_h = self.prev_output_h + RATE_OF_CHANGE
-            else:
-                output_h = self.prev_output_h - RATE_OF_CHANGE
-
-        if abs(output_v - self.prev_output_v) > RATE_OF_CHANGE:
-            logger.debug(f"Rate limiting V from {output_v} to {RATE_OF_CHANGE}")
-            if output_v > self.prev_output_v:
-                output_v = self.prev_output_v + RATE_OF_CHANGE
-            else:
-                output_v = self.prev_output_v - RATE_OF_CHANGE
+        vertical_error = target[1] - laser[1]
+        horizontal_error = target[0] - laser[0]
+        error = hypot(horizontal_error, vertical_error)
 
-        if output_h != self.prev_output_h or output_v != self.prev_output_v:
-            if self.send_angles((output_h, output_v)):
-                self.prev_output_h = output_h
-                self.prev_output_v = output_v
+        if NUMBA_AVAILABLE:
+            output_h, output_v = _pid_update(
+                self._pid_state, self._pid_params, horizontal_error, vertical_error, monotonic()
+            )
+        else:
+            output_h = self.pid_h(horizontal_error)
+            output_v = self.pid_v(vertical_error)
+
+        prev_h, prev_v = self.prev_output_h, self.prev_output_v
+        if DEBUG_LASER_SHOOTER:
+            if abs(output_h - prev_h) > RATE_OF_CHANGE:
+                logger.debug(f"Rate limiting H from {output_h} to {RATE_OF_CHANGE}")
+            if abs(output_v - prev_v) > RATE_OF_CHANGE:
+                logger.debug(f"Rate limiting V from {output_v} to {RATE_OF_CHANGE}")
+
+        # Slew-rate limit: one clamp to previous +/- RATE_OF_CHANGE per axis
+        output_h = min(max(output_h, prev_h - RATE_OF_CHANGE), prev_h + RATE_OF_CHANGE)
+        output_v = min(max(output_v, prev_v - RATE_OF_CHANGE), prev_v + RATE_OF_CHANGE)
+
+        if output_h != prev_h or output_v != prev_v:
+            # Queued for the background sender, the tracking loop does not wait for the ESP32
+            self.send_angles_async((output_h, output_v))
+            self.prev_output_h = output_h
+            self.prev_output_v = output_v
 
         return error
 
@@ -263,12 +419,15 @@ class LaserShooter:
         bool: True if the position is successfully reset, False otherwise.
         """
         if self.limits is not None:
-            return self.send_angles(self.__getzeropos())
+            # Over the TCP connection, which is acknowledged by the ESP32 (unlike send_angles)
+            self._last_angles_data = None
+            return self._send_msg(self.__angles_message(self.__getzeropos()))
         return False
 
+    @_with_socket_lock
     def get_angles(self) -> Tuple:
         """Get current servo angles from ESP32.
-        
+
         Returns:
             Tuple of (horizontal_angle, vertical_angle) or None if communication fails
         """
@@ -289,7 +448,7 @@ class LaserShooter:
             response = self.aliensocket.recv(128)
             logger.debug(f"ESP32 response: {response}")
             self._is_online = True
-            return ast.literal_eval(response.decode("utf-8"))
+            return _parse_angle_pair(response.decode("utf-8"))
         except (socket.error, ConnectionError, OSError) as e:
             logger.error(f"get_angles: network failure to contact ESP32: {e}")
         except (ValueError, SyntaxError) as e:
@@ -304,9 +463,10 @@ class LaserShooter:
             self._is_online = False
             return None
 
+    @_with_socket_lock
     def get_limits(self) -> Tuple:
         """Get servo angle limits from ESP32.
-        
+
         Returns:
             Tuple of ((h_min, h_max), (v_min, v_max)) or None if communication fails
         """
@@ -344,31 +504,33 @@ class LaserShooter:
 
     def __checksocket(self) -> bool:
         # ### CHANGED: Implement auto-reconnect with retry logic
-        if self.aliensocket is None:
-            attempt = 0
-            while attempt < 5:
-                try:
-                    logger.debug(f"__checksocket: connecting to {self.ip_address}:{self.port} (attempt {attempt+1})")
-                    self.aliensocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    self.aliensocket.settimeout(0.5)  # ### CHANGED: Slightly longer timeout for reconnection
-                    self.aliensocket.connect((self.ip_address, self.port))
-                    self._is_online = True
-                    return True
-                except (socket.error, ConnectionError, OSError) as e:
-                    logger.debug(f"__checksocket: connection attempt {attempt+1} failed: {e}")
-                except Exception as e:
-                    logger.debug(f"__checksocket: unexpected error on attempt {attempt+1}: {e}")
-                    try:
-                        self.aliensocket.close()
-                    except:
-                        pass
-                    self.aliensocket = None
-                    self._is_online = False
-                    attempt += 1
-                    sleep(1)  # ### CHANGED: Wait a second before retrying
+        if self.aliensocket is not None:
+            return True
+        if monotonic() < self._next_connect_time:
+            # The ESP32 was unreachable moments ago: drop this exchange rather than stall the caller
             return False
-        return True
+        for attempt in range(MAX_CONNECTION_ATTEMPTS):
+            try:
+                logger.debug(f"__checksocket: connecting to {self.ip_address}:{self.port} (attempt {attempt+1})")
+                self.aliensocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.aliensocket.settimeout(SOCKET_TIMEOUT_S)
+                self.aliensocket.connect((self.ip_address, self.port))
+                # Small request/response messages: send them immediately, without Nagle buffering
+                self.aliensocket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._is_online = True
+                return True
+            except Exception as e:
+                logger.debug(f"__checksocket: connection attempt {attempt+1} failed: {e}")
+                try:
+                    self.aliensocket.close()
+                except:
+                    pass
+                self.aliensocket = None
+                self._is_online = False
+        self._next_connect_time = monotonic() + RECONNECT_BACKOFF_S
+        return False
 
+    @_with_socket_lock
     def _send_msg(self, message: str) -> bool:
         logger.debug(f"send_msg: message={message}")
 
@@ -394,7 +556,8 @@ class LaserShooter:
 
     def send_angles(self, angles: tuple) -> bool:
         """
-        Sends new angles (H,V) to ESP32.
+        Sends new angles (H,V) to ESP32, as a single UDP datagram: a lost update is superseded
+        by the next one instead of delaying it (no retransmission, no reply to wait for).
 
         Parameters:
         angles (tuple): The (horizontal_angle, vertical_angle) to send.
@@ -404,27 +567,86 @@ class LaserShooter:
         """
         logger.debug(f"send_angles: target (H,V)=({round(angles[0],2)}, {round(angles[1],2)})")
 
-        if not self.__checksocket():
+        if self._angles_socket is None:
+            try:
+                angles_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                angles_socket.connect((self.ip_address, self.port))
+                self._angles_socket = angles_socket
+            except OSError as e:
+                logger.error(f"send_angles: cannot create the UDP socket to ESP32: {e}")
+                return False
+
+        # Round angles to 2 decimals as the TCP message does, servos will not be able to do better than 0.1° anyways
+        data = self._angles_data
+        ANGLES_DATAGRAM.pack_into(data, 0, round(angles[0], 2), round(angles[1], 2))
+        last_data = self._last_angles_data
+        now = monotonic()
+        if data == last_data and now - self._last_angles_time < ANGLES_RESEND_S:
+            return True  # Same target after rounding, sent moments ago
+        try:
+            self._angles_socket.send(data)
+        except OSError as e:
+            logger.error(f"send_angles: failure sending to ESP32: {e}")
             return False
+        self._last_angles_time = now
+        if last_data is None:
+            self._last_angles_data = bytearray(data)
+        else:
+            last_data[:] = data
+        return True
 
+    @staticmethod
+    def __angles_message(angles: tuple) -> str:
         # Round angles to 2 decimals, servos will not be able to do better than 0.1° anyways
-        target = (round(angles[0], 2), round(angles[1], 2))
-        data = bytes(str(target) + "\n", "utf-8")  # ### CHANGED: Added newline delimiter
-        try:
-            logger.debug(f"Sending to ESP32: {data}")
-            self.aliensocket.sendall(data)
-            self.aliensocket.recv(SOCKET_RECV_BUFFER_SIZE)
-        except (socket.error, ConnectionError, OSError) as e:
-            logger.error(f"send_angles: network failure to contact ESP32: {e}")
-        except Exception as e:
-            logger.error(f"send_angles: unexpected error contacting ESP32: {e}")
-            self.aliensocket.close()
-            self.aliensocket = None
-            self._is_online = False
-            return False
+        return f"({angles[0]:.2f}, {angles[1]:.2f})"
 
-        self._is_online = True
-        return True
+    def send_angles_async(self, angles: tuple) -> None:
+        """
+        Queues new angles (H,V) for a background thread that sends them to the ESP32.
+        Only the latest command is kept: a pending one not sent yet is replaced.
+
+        Parameters:
+        angles (tuple): The (horizontal_angle, vertical_angle) to send.
+        """
+        self.__post_command(self.send_angles, angles)
+
+    def send_instructions_async(
+        self,
+        up: bool,
+        down: bool,
+        left: bool,
+        right: bool,
+        step_v: float,
+        step_h: float,
+    ) -> None:
+        """
+        Queues movement instructions (see send_instructions) for the background sender thread.
+        Only the latest command is kept: a pending one not sent yet is replaced.
+        """
+        self.__post_command(self.send_instructions, up, down, left, right, step_v, step_h)
+
+    def __post_command(self, method, *args) -> None:
+        if self._sender_thread is None:
+            self._sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
+            self._sender_thread.start()
+        try:
+            self._commands_queue.get_nowait()  # Drop the command not sent yet
+        except queue.Empty:
+            pass
+        try:
+            self._commands_queue.put_nowait((method, args))
+        except queue.Full:
+            pass  # The sender is busy with a fresher command from another caller
+
+    def _sender_loop(self) -> None:
+        """Background thread loop running the queued commands."""
+        while True:
+            method, args = self._commands_queue.get()
+            try:
+                method(*args)
+            except Exception:
+                # Keep the thread alive: later commands must still reach the ESP32
+                logger.exception(f"_sender_loop: {method.__name__} failed")
 
     def send_instructions(
         self,
@@ -449,10 +671,10 @@ class LaserShooter:
         Returns:
         bool: True if the instructions are successfully sent, False otherwise.
         """
-        if time() - self.last_sent > self.min_period_S:
-            self.last_sent = time()
-        else:
+        now = monotonic_ns()
+        if now - self.last_sent <= self._min_period_ns:
             return True
+        self.last_sent = now
 
         self.current_pos = self.get_angles()
 
@@ -460,30 +682,23 @@ class LaserShooter:
             logger.error("Failure to get current angles!")
             return False
 
-        target = self.current_pos
-
-        if up:
-            target = (self.current_pos[0], self.current_pos[1] + step_v)
-        if down:
-            target = (self.current_pos[0], self.current_pos[1] - step_v)
-        if left:
-            target = (self.current_pos[0] + step_h, self.current_pos[1])
+        # One axis moves per update, the last flag in up, down, left, right order wins
+        h, v = self.current_pos
         if right:
-            target = (self.current_pos[0] - step_h, self.current_pos[1])
+            h -= step_h
+        elif left:
+            h += step_h
+        elif down:
+            v -= step_v
+        elif up:
+            v += step_v
 
         if self.limits is None:
             self.limits = self.get_limits()
 
         # Enforce limits
-        if target[0] < self.limits[0][0]:
-            target = (self.limits[0][0], target[1])
-        if target[0] > self.limits[0][1]:
-            target = (self.limits[0][1], target[1])
-
-        if target[1] < self.limits[1][0]:
-            target = (target[0], self.limits[1][0])
-        if target[1] > self.limits[1][1]:
-            target = (target[0], self.limits[1][1])
+        (h_min, h_max), (v_min, v_max) = self.limits
+        target = (min(max(h, h_min), h_max), min(max(v, v_min), v_max))
 
         result = self.send_angles(target)
         return result
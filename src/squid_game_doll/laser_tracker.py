@@ -103,8 +103,11 @@ class LaserTracker:
             use_nn = False
             logger.info("Using traditional LaserFinder (LaserFinderNN not available)")
             
+        laser_on = False
         while self.shall_run:
-            self.shooter.set_laser(True)
+            # One ESP32 round trip to switch the laser on, not one per iteration (retried if it failed)
+            if not laser_on:
+                laser_on = self.shooter.set_laser(True)
             
             if self.last_frame is not None:
                 try:
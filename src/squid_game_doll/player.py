@@ -1,3 +1,4 @@
+import math
 import cv2
 import pygame
 import numpy as np
@@ -139,14 +140,31 @@ class Player:
         prev_x1, prev_y1, prev_x2, prev_y2 = self._last_position
 
         # distance between the centers of the two rectangles
-        distance = np.linalg.norm(
-            [
-                (x1 + x2) / 2 - (prev_x1 + prev_x2) / 2,
-                (y1 + y2) / 2 - (prev_y1 + prev_y2) / 2,
-            ]
+        distance = math.hypot(
+            (x1 + x2) / 2 - (prev_x1 + prev_x2) / 2,
+            (y1 + y2) / 2 - (prev_y1 + prev_y2) / 2,
         )
 
         return distance > game_settings.get_param("pixel_tolerance", Player.MOVEMENT_THRESHOLD_PX)
 
+    @staticmethod
+    def moved_mask(players: list["Player"], game_settings: GameSettings) -> np.ndarray:
+        """Returns the movement status of all the players as a boolean array, same rule as has_moved"""
+        if not players:
+            return np.zeros(0, dtype=bool)
+
+        for player in players:
+            if player._last_position is None:
+                player._last_position = player._coords
+
+        coords = np.array([player._coords for player in players], dtype=np.float64)
+        previous = np.array([player._last_position for player in players], dtype=np.float64)
+
+        # distance between the centers of the two rectangles, for all players at once
+        delta = (coords[:, :2] + coords[:, 2:]) * 0.5 - (previous[:, :2] + previous[:, 2:]) * 0.5
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+
+        return distance > game_settings.get_param("pixel_tolerance", Player.MOVEMENT_THRESHOLD_PX)
+
     def __str__(self):
         return f"Player {self._id} at {self._coords} (TTL: {round(Player.MAX_AGE_SECONDS - (time.time() - self._last_seen), 1)} s)"
@@ -10,6 +10,9 @@ from .utils import HailoAsyncInference  # Make sure this is available in your pr
 from .base_player_tracker import BasePlayerTracker
 from .game_settings import GameSettings
 
+# Padding color of the letterboxed model input (YOLO convention)
+LETTERBOX_COLOR = 114
+
 
 class PlayerTrackerHailo(BasePlayerTracker):
     def __init__(self, hef_path: str = "yolov11m.hef", score_thresh: float = 0.4) -> None:
@@ -30,6 +33,9 @@ class PlayerTrackerHailo(BasePlayerTracker):
         # Initialize the Hailo inference engine
         self.hailo_inference = HailoAsyncInference(hef_path, self.input_queue, self.output_queue, 1)
         self.model_h, self.model_w, _ = self.hailo_inference.get_input_shape()
+        # Letterboxed model input, reused each frame: process_nn_frame waits for the inference before returning
+        self._input_buffer = np.full((self.model_h, self.model_w, 3), LETTERBOX_COLOR, dtype=np.uint8)
+        self._letterbox = None  # (scale, x offset, y offset, resized w, resized h) of the last frame
         self.tracker = sv.ByteTrack(frame_rate=5)
 
         # Start the asynchronous inference in a separate thread
@@ -52,9 +58,16 @@ class PlayerTrackerHailo(BasePlayerTracker):
 
             start_time = cv2.getTickCount()
             # Put the preprocessed frame into the Hailo inference queue
-            # Ridimensiona nn_frame a 640 640
-            nn_frame = cv2.resize(nn_frame, (self.model_w, self.model_h))
-            self.input_queue.put([nn_frame])
+            # Letterbox nn_frame into the model input, keeping its aspect ratio as in YOLO training
+            letterbox = self.__letterbox(nn_frame.shape[1], nn_frame.shape[0])
+            scale, dx, dy, new_w, new_h = letterbox
+            cv2.resize(
+                nn_frame,
+                (new_w, new_h),
+                dst=self._input_buffer[dy : dy + new_h, dx : dx + new_w],
+                interpolation=cv2.INTER_LINEAR,
+            )
+            self.input_queue.put([self._input_buffer])
 
             # Retrieve the inference results (blocking call)
             _, results = self.output_queue.get()
@@ -64,7 +77,7 @@ class PlayerTrackerHailo(BasePlayerTracker):
 
             # Convert Hailo inference output into Supervision detections
             self.confidence = gamesettings.get_param("confidence", 40) / 100.0
-            detections_sv = self.__extract_detections(results, (self.nn_rect.w, self.nn_rect.h), self.confidence)
+            detections_sv = self.__extract_detections(results, letterbox, self.confidence)
             detections_sv = self.tracker.update_with_detections(detections_sv)
 
             # Convert detections into Player objects using the base class helper
@@ -82,8 +95,25 @@ class PlayerTrackerHailo(BasePlayerTracker):
             logger.exception("Error in process_frame")
             return self.previous_result
 
+    def __letterbox(self, frame_w: int, frame_h: int) -> tuple[float, int, int, int, int]:
+        """
+        Returns the (scale, x offset, y offset, resized width, resized height) placing a frame_w x frame_h
+        frame in the model input, and clears the input buffer padding when the placement changes.
+        """
+        if self._letterbox is not None and self._letterbox[5:] == (frame_w, frame_h):
+            return self._letterbox[:5]
+
+        scale = min(self.model_w / frame_w, self.model_h / frame_h)
+        new_w = min(self.model_w, max(1, int(round(frame_w * scale))))
+        new_h = min(self.model_h, max(1, int(round(frame_h * scale))))
+        dx = (self.model_w - new_w) // 2
+        dy = (self.model_h - new_h) // 2
+        self._input_buffer[:] = LETTERBOX_COLOR
+        self._letterbox = (scale, dx, dy, new_w, new_h, frame_w, frame_h)
+        return self._letterbox[:5]
+
     def __extract_detections(
-        self, hailo_output: list[np.ndarray], ratios: tuple[float, float], threshold: float
+        self, hailo_output: list[np.ndarray], letterbox: tuple[float, int, int, int, int], threshold: float
     ) -> sv.Detections:
         """
         Converts Hailo asynchronous inference output into a supervision Detections object.
@@ -93,37 +123,32 @@ class PlayerTrackerHailo(BasePlayerTracker):
 
         Args:
             hailo_output (list[np.ndarray]): Raw output from Hailo inference.
-            (video_h (int): Height of the original video frame.
-            video_w (int): Width of the original video frame.)
+            letterbox (tuple): (scale, x offset, y offset, resized width, resized height) of the frame
+                in the model input, as returned by __letterbox.
             threshold (float): Confidence threshold.
 
         Returns:
             sv.Detections: Detections object with absolute pixel coordinates.
         """
-        xyxy = []
-        confidences = []
-
-        # Iterate over all classes, but only process the 'person' class (COCO index 0)
-        for class_id, detections in enumerate(hailo_output):
-            if class_id != 0:
-                continue  # Skip non-person detections
-            for detection in detections:
-                bbox, score = detection[:4], detection[4]
-                if score < threshold:
-                    continue
-                # Convert bbox from normalized [ymin, xmin, ymax, xmax] to absolute [x1, y1, x2, y2]
-                x1 = bbox[1] * ratios[0]
-                y1 = bbox[0] * ratios[1]
-                x2 = bbox[3] * ratios[0]
-                y2 = bbox[2] * ratios[1]
-                xyxy.append([x1, y1, x2, y2])
-                confidences.append(score)
-
-        if not xyxy:
+        scale, dx, dy, _, _ = letterbox
+
+        # Only the 'person' class (COCO index 0) is used: an (N, 5) array of [ymin, xmin, ymax, xmax, score]
+        if not hailo_output:
+            return sv.Detections.empty()
+        persons = np.asarray(hailo_output[0]).reshape(-1, 5)
+        persons = persons[persons[:, 4] >= threshold]
+        if len(persons) == 0:
             return sv.Detections.empty()
 
-        xyxy_np = np.array(xyxy)
-        conf_np = np.array(confidences)
+        # Convert all bboxes at once from normalized [ymin, xmin, ymax, xmax] to absolute [x1, y1, x2, y2]
+        model_size = np.array([self.model_w, self.model_h, self.model_w, self.model_h], dtype=np.float64)
+        offset = np.array([dx, dy, dx, dy], dtype=np.float64)
+        xyxy_np = (persons[:, [1, 0, 3, 2]] * model_size - offset) / scale
+
+        # Boxes reaching into the letterbox padding are clipped to the frame
+        xyxy_np[:, [0, 2]] = np.clip(xyxy_np[:, [0, 2]], 0, self.nn_rect.w)
+        xyxy_np[:, [1, 3]] = np.clip(xyxy_np[:, [1, 3]], 0, self.nn_rect.h)
+        conf_np = persons[:, 4]
         # Hailo output does not provide tracker IDs; we assign a default value (-1)
         tracker_id_np = -1 * np.ones_like(conf_np)
         return sv.Detections(xyxy=xyxy_np, confidence=conf_np, tracker_id=tracker_id_np)
@@ -110,6 +110,10 @@ class PlayerTrackerUL(BasePlayerTracker):
         if os.path.exists(tensorrt_path):
             logger.info(f"✅ Found TensorRT engine: {tensorrt_path}")
             return tensorrt_path, "TensorRT (.engine)"
+
+        # No engine yet: build the FP16 one once on TensorRT platforms, it is reused on next starts
+        if self._export_tensorrt_engine(tensorrt_path):
+            return tensorrt_path, "TensorRT (.engine)"
         
         # Priority 2: ONNX model (good performance with GPU)
         onnx_path = f"{os.path.splitext(self.base_model_path)[0]}.onnx"
@@ -121,6 +125,34 @@ class PlayerTrackerUL(BasePlayerTracker):
         logger.info(f"ℹ️  Using PyTorch model: {self.base_model_path}")
         return self.base_model_path, "PyTorch (.pt)"
     
+    def _export_tensorrt_engine(self, engine_path: str) -> bool:
+        """Export the PyTorch model to a FP16 TensorRT engine next to it, returns True if engine_path was created"""
+        if not (should_use_tensorrt() and torch.cuda.is_available()):
+            return False
+        if not self.base_model_path.endswith(".pt") or not os.path.exists(self.base_model_path):
+            return False
+
+        try:
+            imgsz = get_optimal_input_size()
+            logger.info(f"📦 Exporting {self.base_model_path} to TensorRT FP16 engine (imgsz={imgsz}), this is done once")
+            YOLO(self.base_model_path, task="detect", verbose=False).export(
+                format="engine",
+                imgsz=imgsz,
+                half=True,
+                dynamic=False,  # Static shapes for better performance
+                batch=1,        # One frame per inference, see process_nn_frame
+                device=0,
+                verbose=False,
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  TensorRT export failed, using the PyTorch model: {e}")
+            return False
+
+        if not os.path.exists(engine_path):
+            return False
+        logger.info(f"✅ Exported TensorRT engine: {engine_path}")
+        return True
+
     def _load_optimized_model(self):
         """Load model with optimal format detection and TensorRT handling"""
         # Find optimal model format
@@ -164,6 +196,9 @@ class PlayerTrackerUL(BasePlayerTracker):
         elif torch.cuda.is_available() and model_format == "PyTorch (.pt)":
             self.yolo.to("cuda")
 
+        # FP16 halves weights/activations bandwidth on GPU; CPU inference stays FP32
+        self.use_half = torch.cuda.is_available()
+
         # Get device info after optimization
         device_info = self._get_device_info()
         logger.info(f"🎯 YOLO inference running on: {device_info} ({get_platform_info()})")
@@ -207,7 +242,7 @@ class PlayerTrackerUL(BasePlayerTracker):
         except Exception as e:
             logger.warning(f"Jetson optimization failed: {e}")
     
-    def export_to_tensorrt(self, imgsz: int = 640, half: bool = True, int8: bool = False) -> str:
+    def export_to_tensorrt(self, imgsz: int = 640, half: bool = True, int8: bool = False, data: str = None) -> str:
         """
         Export model to TensorRT for optimal Jetson performance
         
@@ -215,6 +250,7 @@ class PlayerTrackerUL(BasePlayerTracker):
             imgsz: Input image size (smaller = faster)
             half: Use FP16 precision
             int8: Use INT8 precision (fastest but may reduce accuracy)
+            data: Dataset YAML used to calibrate the INT8 quantization
         
         Returns:
             Path to exported TensorRT model
@@ -222,6 +258,10 @@ class PlayerTrackerUL(BasePlayerTracker):
         try:
             logger.info(f"Exporting to TensorRT (imgsz={imgsz}, half={half}, int8={int8})")
             
+            export_kwargs = {}
+            if int8 and data:
+                export_kwargs["data"] = data  # Calibration images for INT8
+
             # Export with optimized settings for Jetson Nano
             exported_path = self.yolo.export(
                 format="engine",
@@ -229,8 +269,10 @@ class PlayerTrackerUL(BasePlayerTracker):
                 half=half,
                 int8=int8,
                 dynamic=False,  # Static shapes for better performance
+                batch=1,        # One frame per inference, see process_nn_frame
                 workspace=4,    # 4GB workspace limit for Jetson Nano
-                verbose=True
+                verbose=True,
+                **export_kwargs
             )
             
             logger.info(f"TensorRT export completed: {exported_path}")
@@ -273,14 +315,14 @@ class PlayerTrackerUL(BasePlayerTracker):
                 "persist": True,
                 "classes": [0],         # Only detect persons
                 "verbose": False,
-                "stream": False,        # Direct results
+                "stream": True,         # Generator: no result list is built for the single frame
                 
                 # Detection optimization parameters
                 "conf": 0.4,            # Higher confidence threshold for speed
                 "iou": 0.7,             # NMS IoU threshold
                 "max_det": 8,           # Limit detections for speed
                 "agnostic_nms": True,   # Faster NMS processing
-                "half": True,           # Enable FP16 precision
+                "half": self.use_half,  # FP16 on GPU, FP32 on CPU
                 "augment": False,       # Disable test-time augmentation
                 
                 # Tracking parameters (correctly formatted)
@@ -296,7 +338,7 @@ class PlayerTrackerUL(BasePlayerTracker):
             if self.is_jetson:
                 inference_kwargs.update({
                     "augment": False,     # Disable augmentation for speed
-                    "half": True,         # Use FP16 if available
+                    "half": self.use_half,  # Use FP16 if available
                 })
                 
                 # For ONNX/TensorRT models, specify device in inference call
@@ -307,8 +349,14 @@ class PlayerTrackerUL(BasePlayerTracker):
             self.frame_count += 1
             
             # Full tracking with optimized parameters
+            # Frames are not batched: Ultralytics gives each image of a batch its own tracker
+            # (one per stream), which would break the ByteTrack IDs across consecutive frames,
+            # and the red light check needs the latest frame without extra latency.
             tracking_start = cv2.getTickCount()
-            results = self.yolo.track(nn_frame, **inference_kwargs)
+            result = None
+            for result in self.yolo.track(nn_frame, **inference_kwargs):
+                pass  # One frame, one Result: running the generator to its end lets Ultralytics finish the prediction
+            results = (result,) if result is not None else ()
             tracking_end = cv2.getTickCount()
             tracking_ms = ((tracking_end - tracking_start) / cv2.getTickFrequency()) * 1000
             
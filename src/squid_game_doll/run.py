@@ -7,13 +7,7 @@ import sys
 # Suppress NumPy subnormal value warnings that occur on some systems during initialization
 warnings.filterwarnings("ignore", message="The value of the smallest subnormal.*is zero", category=UserWarning)
 
-import pygame
 from loguru import logger
-from .game_camera import GameCamera
-from .game_screen import GameScreen
-from .game_settings import GameSettings
-from .squid_game import SquidGame
-from .config_phase import GameConfigPhase
 from .utils.platform import should_use_hailo, get_platform_info
 
 
@@ -179,6 +173,15 @@ def run():
 
     args = command_line_args()
 
+    # Heavy imports (pygame, OpenCV, the game modules) only once the command line is valid,
+    # so that --help and argument errors return immediately
+    import pygame
+    from .game_camera import GameCamera
+    from .game_screen import GameScreen
+    from .game_settings import GameSettings
+    from .squid_game import SquidGame
+    from .config_phase import GameConfigPhase
+
     pygame.init()
     size, monitor = GameScreen.get_desktop(args.monitor)
     logger.info(f"Running on monitor {monitor}, size {size}")
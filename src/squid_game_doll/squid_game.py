@@ -2,10 +2,8 @@ from threading import Thread
 import pygame
 import cv2
 import random
-import time
 from .game_screen import GameScreen
 from .base_player_tracker import BasePlayerTracker
-from .player_tracker_ul import PlayerTrackerUL
 from .player import Player
 from .face_extractor import FaceExtractor
 from .game_camera import GameCamera
@@ -15,12 +13,6 @@ from .laser_tracker import LaserTracker
 from .laser_finder_nn import LaserFinderNN
 from .game_settings import GameSettings
 from .async_screen_saver import AsyncScreenSaver
-from .utils.platform import (
-    is_jetson_orin,
-    is_raspberry_pi,
-    should_use_hailo,
-    get_platform_info
-)
 from .constants import (
     ROOT,
     DARK_GREEN,
@@ -36,7 +28,6 @@ from .constants import (
     VICTORY_ANIMATION,
     WHITE,
 )
-import platform
 from loguru import logger
 
 
@@ -52,11 +43,9 @@ class SquidGame:
         model: str,
         settings: GameSettings,
     ) -> None:
-        self.previous_time: float = time.time()
-        self.previous_positions: list = []  # List of bounding boxes (tuples)
         self.tracker: BasePlayerTracker = None  # Initialize later
         self.FAKE: bool = False
-        self.face_extractor: FaceExtractor = FaceExtractor()  # Initialize later
+        self.face_extractor: FaceExtractor = None  # Initialize later (in load_model)
         self.players: list[Player] = []
         self.green_sound: pygame.mixer.Sound = pygame.mixer.Sound(ROOT + "/media/green_light.mp3")
         # 무궁화 꽃이 피었습니다
@@ -66,21 +55,24 @@ class SquidGame:
         self.victory_sound: pygame.mixer.Sound = pygame.mixer.Sound(ROOT + "/media/success.mp3")
         self.gunshot_sound: pygame.mixer.Sound = pygame.mixer.Sound(ROOT + "/media/gunshot.mp3")
         self.game_state: str = INIT
-        self.last_switch_time: float = time.time()
-        self.delay_s: float = 1.0
+        # Game timings use pygame monotonic ticks (ms)
+        self.last_switch_time_ms: int = pygame.time.get_ticks()
+        self.delay_ms: int = 1000
         self.game_screen = GameScreen(desktop_size, display_idx)
         self.no_tracker: bool = disable_tracker
         self.shooter: LaserShooter = None
         self.laser_tracker: LaserTracker = None
         self.laser_finder: LaserFinderNN = None
         self.joystick: pygame.joystick.JoystickType = joystick
-        self.start_registration = time.time()
+        self.start_registration_ms: int = pygame.time.get_ticks()
         self._init_done = False
         self.intro_sound: pygame.mixer.Sound = pygame.mixer.Sound(ROOT + "/media/flute.mp3")
         self.cam: GameCamera = cam
         self.settings: GameSettings = settings
         self.model: str = model
         self.async_screen_saver = AsyncScreenSaver()
+        self._loading_screen_img: pygame.Surface = None
+        self._logo_img: pygame.Surface = None
         if not self.no_tracker:
             self.shooter = LaserShooter(ip)
             # LaserTracker will get the laser finder after it's loaded in load_model
@@ -95,16 +87,17 @@ class SquidGame:
         self.game_state = INIT
         self.cam.reinit()
         self.players.clear()
-        self.last_switch_time = time.time()
+        self.last_switch_time_ms = pygame.time.get_ticks()
         self.green_sound.stop()
         self.red_sound.stop()
         self.eliminate_sound.stop()
         self.intro_sound.stop()
         self.init_sound.play()
-        self.start_registration = time.time()
+        self.start_registration_ms = pygame.time.get_ticks()
         self.game_screen.reset_active_buttons()
         self.game_screen.set_active_button(0, self.switch_to_init)
-        self.face_extractor.reset_memory()
+        if self.face_extractor is not None:
+            self.face_extractor.reset_memory()
         if not self.no_tracker:
             self.shooter.set_eyes(False)
             self.shooter.rotate_head(False)
@@ -115,11 +108,11 @@ class SquidGame:
         if not self.no_tracker:
             self.shooter.set_eyes(True)
             self.shooter.rotate_head(False)
-        self.last_switch_time = time.time() + GRACE_PERIOD_RED_LIGHT_S
+        self.last_switch_time_ms = pygame.time.get_ticks() + int(GRACE_PERIOD_RED_LIGHT_S * 1000)
         self.game_state = RED_LIGHT
         self.green_sound.stop()
         self.red_sound.play()
-        self.delay_s = random.random() * 6 + MINIMUM_RED_LIGHT_S
+        self.delay_ms = int((random.random() * 6 + MINIMUM_RED_LIGHT_S) * 1000)
         return True
 
     def switch_to_greenlight(self) -> bool:
@@ -127,11 +120,11 @@ class SquidGame:
         if not self.no_tracker:
             self.shooter.set_eyes(False)
             self.shooter.rotate_head(True)
-        self.last_switch_time = time.time()
+        self.last_switch_time_ms = pygame.time.get_ticks()
         self.game_state = GREEN_LIGHT
         self.green_sound.play()
         self.red_sound.stop()
-        self.delay_s = random.random() * 4 + MINIMUM_GREEN_LIGHT_S
+        self.delay_ms = int((random.random() * 4 + MINIMUM_GREEN_LIGHT_S) * 1000)
         return True
 
     def switch_to_game(self) -> bool:
@@ -144,7 +137,7 @@ class SquidGame:
     def switch_to_loading(self) -> bool:
         logger.info("Switch to LOADING")
         self.game_state = LOADING
-        self.last_switch_time = time.time()
+        self.last_switch_time_ms = pygame.time.get_ticks()
         self.game_screen.reset_active_buttons()
         self.game_screen.set_active_button(0, self.switch_to_init)
         return True
@@ -163,8 +156,8 @@ class SquidGame:
             self.game_state = endgame_str
             self.game_screen.reset_active_buttons()
             self.game_screen.set_active_button(0, self.switch_to_loading)
-        
-        self.last_switch_time = time.time()
+
+        self.last_switch_time_ms = pygame.time.get_ticks()
         if not self.no_tracker:
             self.shooter.rotate_head(False)
             self.shooter.set_eyes(False)
@@ -180,6 +173,7 @@ class SquidGame:
         Checks each player to see if they have reached the finish area.
         Then, if every player is either a winner or eliminated, switches the game state to VICTORY.
         """
+        since_switch_ms = pygame.time.get_ticks() - self.last_switch_time_ms
         for player in self.players:
             # Only consider players not already eliminated or marked as winner.
             if not player.is_eliminated() and not player.is_winner():
@@ -190,7 +184,7 @@ class SquidGame:
                 # mark the player as a winner. At least two seconds after last transition.
                 if (
                     GameCamera.intersect(player_rect, self.settings.get_gameplay_areas()["finish"])
-                    and time.time() - self.last_switch_time > 2
+                    and since_switch_ms > 2000
                 ):
                     player.set_winner()
 
@@ -217,6 +211,21 @@ class SquidGame:
         for p in players:
             p.set_visible(False)
 
+        # Faces needed in this frame: known players without a face or just eliminated, and new players
+        known = {p.get_id(): p for p in players}
+        needs_face = []
+        for new_p in visible_players:
+            p = known.get(new_p.get_id())
+            if p is None:
+                if allow_registration:
+                    needs_face.append(new_p)
+            elif p.get_face() is None or (not p.is_eliminated() and new_p.is_eliminated()):
+                needs_face.append(new_p)
+        # One batched face detection for all of them
+        batch = [(new_p.get_coords(), new_p.get_id()) for new_p in needs_face]
+        faces = self.face_extractor.extract_faces(webcam_frame, batch)
+        faces = {new_p.get_id(): face for new_p, face in zip(needs_face, faces)}
+
         for new_p in visible_players:
             # Check if the player is already in the list using track ID from ByteTrack model
             # If not, create a new player object
@@ -225,23 +234,16 @@ class SquidGame:
             if p is not None:
                 p.set_visible(True)
 
-            # Capture once face if player is known
-            if p is not None and p.get_face() is None:
-                face = self.face_extractor.extract_face(webcam_frame, new_p.get_coords(), new_p.get_id())
-                if face is not None:
-                    p.set_face(face)
-            if p is not None and not p.is_eliminated() and new_p.is_eliminated():
-                # Update face on elimination
-                face = self.face_extractor.extract_face(webcam_frame, new_p.get_coords(), new_p.get_id())
-                if face is not None:
-                    p.set_face(face)
+            # Capture once face if player is known, update face on elimination
+            face = faces.get(new_p.get_id())
+            if p is not None and face is not None:
+                p.set_face(face)
 
             # Update player position, or create a new player
             if p is not None:
                 p.set_coords(new_p.get_coords())
             else:
                 if allow_registration:
-                    face = self.face_extractor.extract_face(webcam_frame, new_p.get_coords(), new_p.get_id())
                     if face is not None:
                         new_p.set_face(face)
                     # Add new player only if he is facing the camera
@@ -301,16 +303,22 @@ class SquidGame:
     def loading_screen(self, screen: pygame.Surface) -> None:
         clock = pygame.time.Clock()
 
-        # Add loading screen picture during intro sound
-        loading_screen_img = pygame.image.load(ROOT + "/media/loading_screen.webp")
-        loading_screen_img = pygame.transform.scale(
-            loading_screen_img, (self.game_screen.get_desktop_width(), self.game_screen.get_desktop_height() - 200)
-        )
+        # Add loading screen picture during intro sound (decoded and scaled once)
+        if self._loading_screen_img is None:
+            loading_screen_img = pygame.image.load(ROOT + "/media/loading_screen.webp")
+            loading_screen_img = pygame.transform.scale(
+                loading_screen_img, (self.game_screen.get_desktop_width(), self.game_screen.get_desktop_height() - 200)
+            )
+            self._loading_screen_img = loading_screen_img.convert()
 
-        # Load logo image
-        logo_img = pygame.image.load(ROOT + "/media/logo.png")
-        logo_img = pygame.transform.scale(logo_img, (400, 200))  # Adjust size as needed
-        logo_img.set_colorkey((0, 0, 0))
+            # Load logo image
+            logo_img = pygame.image.load(ROOT + "/media/logo.png")
+            logo_img = pygame.transform.scale(logo_img, (400, 200))  # Adjust size as needed
+            logo_img = logo_img.convert()
+            logo_img.set_colorkey((0, 0, 0))
+            self._logo_img = logo_img
+        loading_screen_img = self._loading_screen_img
+        logo_img = self._logo_img
 
         # Animation parameters
         logo_x = (self.game_screen.get_desktop_width() - logo_img.get_width()) // 2
@@ -427,14 +435,17 @@ class SquidGame:
                 self.loading_screen(screen)
                 self.switch_to_init()
 
+            # Read the clock once per iteration
+            now_ms: int = pygame.time.get_ticks()
+
             # Game Logic
             if self.game_state == INIT:
                 self.players = []
                 self.game_screen.update(screen, nn_frame, self.game_state, self.players, self.shooter, self.settings)
                 pygame.display.flip()
-                REGISTRATION_DELAY_S: int = 15
-                self.start_registration = time.time()
-                while time.time() - self.start_registration < REGISTRATION_DELAY_S:
+                REGISTRATION_DELAY_MS: int = 15_000
+                self.start_registration_ms = pygame.time.get_ticks()
+                while pygame.time.get_ticks() - self.start_registration_ms < REGISTRATION_DELAY_MS:
                     nn_frame, webcam_frame, rect_info = self.cam.read_nn(self.settings, self.tracker.get_max_size())
                     if nn_frame is None:
                         break
@@ -446,7 +457,9 @@ class SquidGame:
                     self.game_screen.update(
                         screen, nn_frame, self.game_state, self.players, self.shooter, self.settings
                     )
-                    time_remaining = int(REGISTRATION_DELAY_S - time.time() + self.start_registration)
+                    time_remaining = (
+                        REGISTRATION_DELAY_MS - pygame.time.get_ticks() + self.start_registration_ms
+                    ) // 1000
                     self.game_screen.draw_text(
                         screen,
                         f"{time_remaining}",
@@ -460,7 +473,7 @@ class SquidGame:
 
                     # Stay there until one player registers
                     if len(self.players) == 0:
-                        self.start_registration = time.time()
+                        self.start_registration_ms = pygame.time.get_ticks()
 
                     clock.tick(frame_rate)
                     logger.debug(f"Reg FPS={round(clock.get_fps(),1)}")
@@ -470,7 +483,7 @@ class SquidGame:
 
             elif self.game_state in [GREEN_LIGHT, RED_LIGHT]:
                 # Has current light delay elapsed?
-                if time.time() - self.last_switch_time > self.delay_s:
+                if now_ms - self.last_switch_time_ms > self.delay_ms:
                     if self.game_state == GREEN_LIGHT:
                         self.save_screen_to_disk(screen, "green_light.png")
                         self.switch_to_redlight()
@@ -498,10 +511,11 @@ class SquidGame:
 
                 # Check for movements during the red light
                 if self.game_state == RED_LIGHT:
-                    if time.time() > self.last_switch_time:
-                        for player in self.players:
+                    if now_ms > self.last_switch_time_ms:
+                        moved = Player.moved_mask(self.players, self.settings)
+                        for player, has_moved in zip(self.players, moved):
                             if (
-                                (player.has_moved(self.settings) or player.has_expired())
+                                (has_moved or player.has_expired())
                                 and not player.is_eliminated()
                                 and not player.is_winner()
                             ):
@@ -512,10 +526,10 @@ class SquidGame:
                                 if not self.no_tracker and self.shooter.is_laser_enabled():
                                     self.laser_tracker.target = player.get_target()
                                     self.laser_tracker.start()
-                                    start_time = time.time()
-                                    KILL_DELAY_S: int = 5
+                                    start_time_ms = pygame.time.get_ticks()
+                                    KILL_DELAY_MS: int = 5000
                                     while (
-                                        time.time() - start_time < KILL_DELAY_S
+                                        pygame.time.get_ticks() - start_time_ms < KILL_DELAY_MS
                                     ) and not self.laser_tracker.shot_complete():
                                         nn_frame, webcam_frame, rect_info = self.cam.read_nn(self.settings, self.tracker.get_max_size())
                                         if webcam_frame is not None:
@@ -537,11 +551,11 @@ class SquidGame:
                     self.game_state = VICTORY
                     self.game_screen.reset_active_buttons()
                     self.game_screen.set_active_button(0, self.switch_to_loading)
-                    self.last_switch_time = time.time()
+                    self.last_switch_time_ms = pygame.time.get_ticks()
 
             elif self.game_state in [GAMEOVER, VICTORY]:
                 # Restart after 10 seconds
-                if time.time() - self.last_switch_time > 20:
+                if now_ms - self.last_switch_time_ms > 20_000:
                     self.switch_to_loading()
                     continue
 
@@ -589,6 +603,10 @@ class SquidGame:
                 logger.info(f"✅ Basic fullscreen mode initialized: {desktop_size}")
         
         pygame.display.set_caption("Squid Games - Green Light, Red Light")
+        self.game_screen.convert_assets()
+
+        # Capture the webcam in the background, the game loop always processes the latest frame
+        self.cam.start_capture()
 
         self.loading_screen(screen)
 
@@ -9,6 +9,7 @@ Usage:
 """
 
 import cv2
+import os
 import sys
 from pathlib import Path
 import time
@@ -30,9 +31,16 @@ def main():
     if not test_image_path.exists():
         print(f"Error: Test image '{test_image_path}' not found!")
         print("Available laser images in pictures/:")
-        laser_images = list(Path("pictures").glob("laser-*.jpg"))
-        laser_images.extend(Path("pictures").glob("laser-*.png"))
-        for img in sorted(laser_images)[:5]:  # Show first 5
+        laser_images = []
+        if os.path.isdir("pictures"):
+            # A single directory pass filtered on the name (instead of one glob pass per extension)
+            with os.scandir("pictures") as entries:
+                laser_images = sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith("laser-") and entry.name.endswith((".jpg", ".png")) and entry.is_file()
+                )
+        for img in laser_images[:5]:  # Show first 5
             print(f"  - {img.name}")
         if laser_images:
             test_image_path = laser_images[0]
@@ -46,7 +54,7 @@ def main():
     
     # Initialize LaserFinderNN
     print("Initializing LaserFinderNN...")
-    laser_finder = LaserFinderNN()
+    laser_finder = LaserFinderNN(debug=True)
     
     # Load test image
     print(f"Loading image: {test_image_path}")
@@ -9,9 +9,13 @@ and saves annotated outputs with detection results.
 Author: Generated for Squid Game Doll Project
 """
 
+import functools
 import os
 import glob
+import queue
+import threading
 import time
+from collections import Counter
 from pathlib import Path
 from typing import List, Tuple, Dict, Any
 
@@ -27,6 +31,10 @@ except ImportError as e:
     print(f"Warning: Ultralytics not available: {e}")
     YOLO_AVAILABLE = False
 
+# Text prompts for red dots/laser detection, registered once as the model classes (or exported in the engine)
+TEXT_PROMPTS = ["red dot", "bright red point", "red laser", "red spot"]
+#TEXT_PROMPTS = ["human"]
+
 
 def main():
     """Main function to run YOLO laser dot detection test."""
@@ -57,17 +65,27 @@ def main():
         print("Failed to initialize YOLO model. Exiting.")
         return
     
+    # Output images are encoded and written by a background thread, while the next image is inferred
+    output_queue = queue.Queue(maxsize=4)
+    writer_thread = threading.Thread(target=write_output_images, args=(output_queue,), daemon=True)
+    writer_thread.start()
+    
     # Process each image
     results = []
-    for image_path in laser_files:
-        print(f"Processing {image_path.name}...")
-        result = process_image(image_path, model)
-        results.append(result)
-        if result.get('success', False):
-            print(f"  -> Saved: {result['output_path']}")
-            print(f"  -> Found {len(result['detections'])} detections")
-        else:
-            print(f"  -> Failed: {result.get('error', 'Unknown error')}")
+    try:
+        for image_path in laser_files:
+            print(f"Processing {image_path.name}...")
+            result = process_image(image_path, model, output_queue)
+            results.append(result)
+            if result.get('success', False):
+                print(f"  -> Saved: {result['output_path']}")
+                print(f"  -> Found {len(result['detections'])} detections")
+            else:
+                print(f"  -> Failed: {result.get('error', 'Unknown error')}")
+    finally:
+        # Wait for the pending output images
+        output_queue.put(None)
+        writer_thread.join()
         
     # Print summary
     print_summary(results)
@@ -85,10 +103,25 @@ def initialize_yoloe_model():
         model_name = "yoloe-v8l-seg.pt"
         
     try:
+        import torch
+        # With CUDA, run the FP16 TensorRT engine of the PyTorch model (exported on first use)
+        engine_name = f"{os.path.splitext(model_name)[0]}.engine"
+        if model_name.endswith(".pt") and torch.cuda.is_available():
+            if not os.path.exists(engine_name):
+                export_yoloe_engine(model_name)
+            if os.path.exists(engine_name):
+                model_name = engine_name
+
         print(f"Loading {model_name}...")
         model = YOLO(model_name)
         print(f"Model loaded successfully!")
-        import torch
+        if model_name.endswith(".engine"):
+            # The prompt classes were set before the export, they are part of the engine
+            print("Using TensorRT engine for inference")
+            return model
+
+        # The prompts are the same for every image: their text embeddings are computed only once
+        model.set_classes(TEXT_PROMPTS, model.get_text_pe(TEXT_PROMPTS))
         if torch.cuda.is_available():
             model.to("cuda")
             print("Using CUDA for inference")
@@ -102,20 +135,50 @@ def initialize_yoloe_model():
         return None
 
 
+def export_yoloe_engine(model_name: str) -> None:
+    """Export the model with the TEXT_PROMPTS classes to a FP16 TensorRT engine next to it.
+
+    The classes cannot be changed in the engine: delete it after editing TEXT_PROMPTS.
+    """
+    try:
+        print(f"Exporting {model_name} to a TensorRT FP16 engine, this is done once...")
+        model = YOLO(model_name)
+        model.set_classes(TEXT_PROMPTS, model.get_text_pe(TEXT_PROMPTS))
+        model.export(format="engine", half=True, device=0, verbose=False)
+    except Exception as e:
+        print(f"TensorRT export failed, using the PyTorch model: {e}")
+
+
 def find_laser_images(pictures_dir: Path) -> List[Path]:
     """Find all laser*.* image files in the pictures directory."""
-    patterns = ["laser*.jpg", "laser*.jpeg", "laser*.png"]
-    laser_files = []
-    
-    for pattern in patterns:
-        files = list(pictures_dir.glob(pattern))
-        laser_files.extend(files)
-        
-    return sorted(laser_files)
+    # A single directory pass filtered on the name (instead of one glob pass per extension)
+    with os.scandir(pictures_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("laser") and entry.name.endswith((".jpg", ".jpeg", ".png")) and entry.is_file()
+        )
 
 
-def process_image(image_path: Path, model) -> Dict[str, Any]:
-    """Process a single image with YOLOE model."""
+@functools.lru_cache(maxsize=1024)
+def get_label_size(label: str) -> Tuple[int, int]:
+    """Size of a detection label drawn with the annotation font (memoized: labels repeat across detections)."""
+    return cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+
+
+def write_output_images(output_queue: queue.Queue) -> None:
+    """Write the (output_path, output_image) pairs queued by process_image, until a None item."""
+    for output_path, output_image in iter(output_queue.get, None):
+        # A failed write must not stop the thread: the main loop would block on the full queue
+        try:
+            if not cv2.imwrite(str(output_path), output_image):
+                print(f"  -> Failed to write {output_path}")
+        except Exception as e:
+            print(f"  -> Failed to write {output_path}: {e}")
+
+
+def process_image(image_path: Path, model, output_queue: queue.Queue = None) -> Dict[str, Any]:
+    """Process a single image with YOLOE model (the output image is queued for writing if output_queue is set)."""
     
     # Load image
     image = cv2.imread(str(image_path))
@@ -133,76 +196,69 @@ def process_image(image_path: Path, model) -> Dict[str, Any]:
         # Run YOLO inference with text prompts for red dots
         print(f"    Running YOLO inference on {original_shape[1]}x{original_shape[0]} image...")
         
-        # Try different text prompts for red dots/laser detection
-        list_text_prompts = [
-            ["red dot", "bright red point", "red laser", "red spot"],
-            #["human"]
-        ]
-
-        output_image = image.copy()
+        # Annotations are drawn in place: the decoded image is not needed once predict() has run
+        output_image = image
 
         start_time = time.time()
 
-        for text_prompts in list_text_prompts:
-            model.set_classes(text_prompts, model.get_text_pe(text_prompts))
-            all_detections = []
-            
-            # Try each prompt and collect results
-            for prompt in text_prompts:
-                try:
-                    results = model.predict(
-                        source=str(image_path),
-                        conf=0.03,    # Very low confidence to catch small/dim objects
-                        iou=0.4,      # Lower IoU for overlapping detections
-                        verbose=True
-                    )
-                    
-                    if results and len(results) > 0 and results[0].boxes is not None:
-                        boxes = results[0].boxes.cpu().numpy()
-                        if len(boxes.data) > 0:
-                            print(f"      Found {len(boxes.data)} detections with prompt: '{prompt}'")
-                            for box in boxes.data:
-                                x1, y1, x2, y2, conf, class_id = box
-                                # Get actual class name from model
-                                actual_class_name = results[0].names[int(class_id)]
-                                detection = {
-                                    'bbox': [float(x1), float(y1), float(x2), float(y2)],
-                                    'confidence': float(conf),
-                                    'class_id': int(class_id),
-                                    'class_name': actual_class_name,  # Use actual class name from model
-                                    'center': [float((x1 + x2) / 2), float((y1 + y2) / 2)],
-                                    'prompt': prompt
-                                }
-                                all_detections.append(detection)
-                                
-                except Exception as prompt_error:
-                    print(f"      Prompt '{prompt}' failed: {prompt_error}")
-                    continue
-            
-            # Process detection results
-            detections = all_detections.copy() if all_detections else []
+        all_detections = []
+        
+        # A single inference covers all the TEXT_PROMPTS classes of the model, each box is tagged with its prompt
+        try:
+            # The image decoded above (BGR, as Ultralytics expects for arrays) is not read again from disk
+            results = model.predict(
+                source=image,
+                conf=0.03,    # Very low confidence to catch small/dim objects
+                iou=0.4,      # Lower IoU for overlapping detections
+                verbose=False
+            )
             
-            # If we used text prompts and got results, use those
-            if all_detections:
-                print(f"      Total detections from text prompts: {len(all_detections)}")
-                sorted_detections = sorted(all_detections, key=lambda d: d['confidence'])
-                for detection in sorted_detections:
-                    x1, y1, x2, y2 = detection['bbox']
-                    conf = detection['confidence']
-                    class_name = detection['class_name']
-                    
-                    # Draw bounding box (use red color for laser dot detections)
-                    cv2.rectangle(output_image, (int(x1), int(y1)), (int(x2), int(y2)), (0, 255, 0), 2)
-                    
-                    # Draw label
-                    label = f"{class_name}: {conf:.2f}"
-                    label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-                    cv2.rectangle(output_image, (int(x1), int(y1) - label_size[1] - 10), 
-                                (int(x1) + label_size[0], int(y1)), (0, 255, 0), -1)
-                    cv2.putText(output_image, label, (int(x1), int(y1) - 5), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-                    
-                    print(f"      Detected: {class_name} (conf: {conf:.3f}) at ({x1:.0f},{y1:.0f},{x2:.0f},{y2:.0f})")
+            if results and len(results) > 0 and results[0].boxes is not None:
+                # predict() already dropped the boxes under conf: only the raw (N, 6) tensor is copied to host
+                boxes_data = results[0].boxes.data.cpu().numpy()
+                if len(boxes_data) > 0:
+                    print(f"      Found {len(boxes_data)} detections with prompts: {TEXT_PROMPTS}")
+                    for box in boxes_data:
+                        x1, y1, x2, y2, conf, class_id = box
+                        # Get actual class name from model
+                        actual_class_name = results[0].names[int(class_id)]
+                        detection = {
+                            'bbox': [float(x1), float(y1), float(x2), float(y2)],
+                            'confidence': float(conf),
+                            'class_id': int(class_id),
+                            'class_name': actual_class_name,  # Use actual class name from model
+                            'center': [float((x1 + x2) / 2), float((y1 + y2) / 2)],
+                            'prompt': actual_class_name
+                        }
+                        all_detections.append(detection)
+                        
+        except Exception as prompt_error:
+            print(f"      Prompts {TEXT_PROMPTS} failed: {prompt_error}")
+        
+        # Process detection results
+        detections = all_detections.copy() if all_detections else []
+        
+        # If we used text prompts and got results, use those
+        if all_detections:
+            print(f"      Total detections from text prompts: {len(all_detections)}")
+            sorted_detections = sorted(all_detections, key=lambda d: d['confidence'])
+            for detection in sorted_detections:
+                x1, y1, x2, y2 = detection['bbox']
+                conf = detection['confidence']
+                class_name = detection['class_name']
+                
+                # Draw bounding box (use red color for laser dot detections)
+                cv2.rectangle(output_image, (int(x1), int(y1)), (int(x2), int(y2)), (0, 255, 0), 2)
+                
+                # Draw label
+                label = f"{class_name}: {conf:.2f}"
+                label_size = get_label_size(label)
+                cv2.rectangle(output_image, (int(x1), int(y1) - label_size[1] - 10), 
+                            (int(x1) + label_size[0], int(y1)), (0, 255, 0), -1)
+                cv2.putText(output_image, label, (int(x1), int(y1) - 5), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                
+                print(f"      Detected: {class_name} (conf: {conf:.3f}) at ({x1:.0f},{y1:.0f},{x2:.0f},{y2:.0f})")
         
         processing_time = time.time() - start_time
 
@@ -210,7 +266,10 @@ def process_image(image_path: Path, model) -> Dict[str, Any]:
         output_path = image_path.parent / f"prompted-output-{image_path.stem}.jpg"
         
         # Save output image
-        cv2.imwrite(str(output_path), output_image)
+        if output_queue is not None:
+            output_queue.put((output_path, output_image))
+        else:
+            cv2.imwrite(str(output_path), output_image)
         
         return {
             'image_path': image_path,
@@ -247,11 +306,11 @@ def print_summary(results: List[Dict[str, Any]]) -> None:
     
     if successful:
         # Processing time statistics
-        times = [r['processing_time'] for r in successful]
-        avg_time = np.mean(times)
-        min_time = np.min(times)
-        max_time = np.max(times)
-        total_time = np.sum(times)
+        times = np.fromiter((r['processing_time'] for r in successful), dtype=np.float64, count=len(successful))
+        avg_time = times.mean()
+        min_time = times.min()
+        max_time = times.max()
+        total_time = times.sum()
         
         print("PERFORMANCE METRICS:")
         print(f"  Total processing time: {total_time:.3f}s")
@@ -280,15 +339,13 @@ def print_summary(results: List[Dict[str, Any]]) -> None:
             print(f"  Max detections in single image: {max(detection_counts)}")
             
             # Class distribution
-            class_counts = {}
-            confidence_scores = []
-            for detection in all_detections:
-                class_name = detection['class_name']
-                class_counts[class_name] = class_counts.get(class_name, 0) + 1
-                confidence_scores.append(detection['confidence'])
+            class_counts = Counter(detection['class_name'] for detection in all_detections)
+            confidence_scores = np.fromiter(
+                (detection['confidence'] for detection in all_detections), dtype=np.float64, count=len(all_detections)
+            )
             
-            print(f"  Average confidence: {np.mean(confidence_scores):.3f}")
-            print(f"  Confidence range: {np.min(confidence_scores):.3f} - {np.max(confidence_scores):.3f}")
+            print(f"  Average confidence: {confidence_scores.mean():.3f}")
+            print(f"  Confidence range: {confidence_scores.min():.3f} - {confidence_scores.max():.3f}")
             print()
             
             print("DETECTED CLASSES:")
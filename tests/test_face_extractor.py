@@ -0,0 +1,130 @@
+"""
+Test the batching of FaceExtractor.extract_faces, with a synthetic face detector and with MediaPipe.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from squid_game_doll import face_extractor
+from squid_game_doll.face_extractor import DETECTION_SIZE, FaceExtractor
+
+
+class WhiteBoxDetector:
+    """Stands for the MediaPipe detector: each white blob of the image is a face, returned in relative coordinates."""
+
+    def __init__(self):
+        self.images = []
+
+    def process(self, rgb_image):
+        self.images.append(rgb_image)
+        gray = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2GRAY)
+        count, _, stats, _ = cv2.connectedComponentsWithStats((gray > 200).astype(np.uint8))
+        img_h, img_w = gray.shape
+        detections = []
+        for x, y, w, h, _ in stats[1:count]:
+            box = SimpleNamespace(xmin=x / img_w, ymin=y / img_h, width=w / img_w, height=h / img_h)
+            detections.append(SimpleNamespace(location_data=SimpleNamespace(relative_bounding_box=box)))
+        return SimpleNamespace(detections=detections)
+
+
+@pytest.fixture
+def extractor():
+    detector = WhiteBoxDetector()
+    with patch("squid_game_doll.face_extractor.mp", MagicMock()):
+        extractor = FaceExtractor()
+    extractor.face_detector = detector
+    return extractor
+
+
+def test_extract_faces_maps_detections_to_player_crops(extractor):
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+    # (player bbox (x1, y1, x2, y2), face (x, y, w, h) in frame coordinates)
+    players = [
+        ((10, 20, 110, 320), (40, 50, 40, 40)),
+        ((150, 20, 210, 260), (160, 40, 40, 40)),
+        ((250, 100, 330, 300), (260, 150, 60, 60)),
+        ((900, 0, 900, 100), None),  # empty crop, left out of the batch
+        ((400, 200, 700, 300), (620, 220, 50, 50)),  # wider than high, detected alone
+        ((50, 400, 150, 700), (70, 600, 50, 60)),
+        ((700, 400, 800, 700), None),  # no face
+        ((900, 300, 1000, 700), (955, 655, 40, 40)),  # face in the bottom right corner of its crop
+    ]
+    for _, face in players:
+        if face is not None:
+            x, y, w, h = face
+            frame[y : y + h, x : x + w] = 255
+
+    results = extractor.extract_faces(frame, [(bbox, id) for id, (bbox, _) in enumerate(players)], return_bbox=True)
+
+    # Crops scaled to DETECTION_SIZE height and grouped side by side while the strip is at most square
+    shapes = [image.shape[:2] for image in extractor.face_detector.images]
+    assert shapes == [(DETECTION_SIZE, 64 + 48 + 76), (64, DETECTION_SIZE), (DETECTION_SIZE, 64 + 64 + 48)]
+
+    assert len(results) == len(players)
+    for (bbox, face), result in zip(players, results):
+        face_crop, face_bbox = result if result is not None else (None, None)
+        if face is None:
+            assert face_crop is None and face_bbox is None
+            continue
+        assert face_crop is not None
+        # Back in frame coordinates, up to the scaling of the crop
+        tolerance = 2 * max(bbox[2] - bbox[0], bbox[3] - bbox[1]) / DETECTION_SIZE
+        assert np.allclose(face_bbox, face, atol=tolerance), (face_bbox, face)
+
+
+def test_extract_faces_single_player_not_batched(extractor):
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame[100:140, 200:240] = 255
+
+    results = extractor.extract_faces(frame, [((150, 50, 350, 400), 1)], return_bbox=True)
+
+    face_crop, face_bbox = results[0]
+    assert face_crop is not None
+    assert np.allclose(face_bbox, (200, 100, 40, 40), atol=2)
+
+
+def players_scene(aspect: float) -> tuple:
+    """Frame of players of growing height, each with the astronaut head of scikit-image on a dark body."""
+    data = pytest.importorskip("skimage.data")
+    head = cv2.cvtColor(data.astronaut(), cv2.COLOR_RGB2BGR)[20:240, 120:310]
+    frame = np.random.default_rng(0).integers(60, 120, (720, 1280, 3), dtype=np.uint8)
+    players = []
+    x1 = 5
+    for id, height in enumerate(range(150, 550, 50)):
+        width = int(height * aspect)
+        y1 = 715 - height
+        frame[y1 : y1 + height, x1 : x1 + width] = (40, 50, 70)
+        head_h = int(height * 0.35)
+        head_w = int(head_h * head.shape[1] / head.shape[0])
+        head_x = x1 + (width - head_w) // 2
+        frame[y1 : y1 + head_h, head_x : head_x + head_w] = cv2.resize(
+            head, (head_w, head_h), interpolation=cv2.INTER_AREA
+        )
+        players.append(((x1, y1, x1 + width, y1 + height), id))
+        x1 += width + 5
+    return frame, players
+
+
+@pytest.mark.skipif(not hasattr(face_extractor.mp, "solutions"), reason="MediaPipe solutions not available")
+@pytest.mark.parametrize("aspect", [0.3, 0.42])
+def test_extract_faces_same_faces_as_extract_face(aspect):
+    """With the real detector, the batch finds the same faces as one detector call per player."""
+    frame, players = players_scene(aspect)
+    extractor = FaceExtractor()
+    detector = extractor.face_detector
+    extractor.face_detector = MagicMock(wraps=detector)
+
+    single = [extractor.extract_face(frame, bbox, id, return_bbox=True) for bbox, id in players]
+    single_calls = extractor.face_detector.process.call_count
+    extractor.reset_memory()
+    extractor.face_detector.process.reset_mock()
+    batched = extractor.extract_faces(frame, players, return_bbox=True)
+
+    assert extractor.face_detector.process.call_count < single_calls
+    for (bbox, _), (_, single_bbox), (_, batched_bbox) in zip(players, single, batched):
+        assert single_bbox is not None and batched_bbox is not None
+        assert np.allclose(batched_bbox, single_bbox, atol=max(2, (bbox[3] - bbox[1]) / DETECTION_SIZE * 2))
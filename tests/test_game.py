@@ -6,6 +6,7 @@ import pygame
 import os
 import time
 import numpy as np
+from unittest.mock import MagicMock, patch
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -130,3 +131,82 @@ def test_get_last_rect():
 def test_get_target():
     player = Player(1, (0, 0, 100, 100))
     assert player.get_target() == (50.0, 33.333333333333336)
+
+
+def test_moved_mask():
+    settings = GameSettings()
+    settings.areas = GameSettings.default_areas(1920, 1080)
+    settings.params = GameSettings.default_params()
+    threshold = settings.get_param("pixel_tolerance")
+
+    assert Player.moved_mask([], settings).shape == (0,)
+
+    # (last position, current coords) pairs, moves around the threshold of the box centers distance
+    moves = [
+        ((0, 0, 100, 100), (0, 0, 100, 100)),
+        ((0, 0, 100, 100), (threshold, 0, 100 + threshold, 100)),
+        ((0, 0, 100, 100), (threshold + 1, 0, 101 + threshold, 100)),
+        ((0, 0, 100, 100), (0, -threshold, 100, 100 - threshold)),
+        ((10, 10, 110, 110), (19, 22, 119, 122)),  # diagonal move of exactly 15 pixels
+        ((10, 10, 110, 110), (20, 22, 120, 122)),
+        ((0, 0, 100, 100), (0, 0, 102 * threshold, 100)),  # box grows to the right
+        (None, (500, 500, 600, 600)),  # no last position yet
+    ]
+    players = []
+    for i, (last_position, coords) in enumerate(moves):
+        player = Player(i, coords)
+        if last_position is not None:
+            player.set_last_position(last_position)
+        players.append(player)
+
+    mask = Player.moved_mask(players, settings)
+
+    # Same result as the per-player check, on fresh players as moved_mask sets the missing last positions
+    expected = []
+    for i, (last_position, coords) in enumerate(moves):
+        player = Player(i, coords)
+        if last_position is not None:
+            player.set_last_position(last_position)
+        expected.append(player.has_moved(settings))
+
+    assert mask.dtype == bool
+    assert mask.tolist() == expected
+    assert expected == [False, False, True, False, False, True, True, False]
+    assert players[-1].get_last_position() == (500, 500, 600, 600)
+
+
+def test_merge_players_lists_batches_faces():
+    game = SquidGame.__new__(SquidGame)
+    game.face_extractor = MagicMock()
+    game.face_extractor.extract_faces.side_effect = lambda frame, players: [f"face{id}" for _, id in players]
+
+    with_face = Player(1, (0, 0, 10, 10))
+    with_face.set_face("old1")
+    without_face = Player(2, (20, 0, 30, 10))
+    eliminated = Player(3, (40, 0, 50, 10))
+    eliminated.set_face("old3")
+    players = [with_face, without_face, eliminated]
+
+    visible = [
+        Player(1, (1, 0, 11, 10)),
+        Player(2, (21, 0, 31, 10)),
+        Player(3, (41, 0, 51, 10)),
+        Player(4, (60, 0, 70, 10)),
+    ]
+    visible[2].set_eliminated(True)
+
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    with (
+        patch("squid_game_doll.squid_game.GameCamera.convert_nn_to_screen_coord"),
+        patch("squid_game_doll.squid_game.GameCamera.intersect", return_value=True),
+    ):
+        merged = game.merge_players_lists(frame, players, visible, True, False, MagicMock(), None)
+
+    # A single detector batch, for the players needing a face only
+    game.face_extractor.extract_faces.assert_called_once()
+    _, batch = game.face_extractor.extract_faces.call_args.args
+    assert batch == [((21, 0, 31, 10), 2), ((41, 0, 51, 10), 3), ((60, 0, 70, 10), 4)]
+
+    assert [p.get_id() for p in merged] == [1, 2, 3, 4]
+    assert [p.get_face() for p in merged] == ["old1", "face2", "face3", "face4"]
+    assert all(p.is_visible() for p in merged[:3])
@@ -0,0 +1,76 @@
+"""
+Test the fused Sobel of drafts/gradient_search.py against cv2.Sobel, borders included.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_draft(name: str):
+    """Imports a module of the drafts folder, which is not part of the package."""
+    path = ROOT / "drafts" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Under its own name, as numba records it in the cache shared with the script
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+gradient_search = load_draft("gradient_search")
+
+
+def cv2_sobel(image):
+    """Reference gradients: cv2.Sobel with its default BORDER_REFLECT_101 border."""
+    return cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize=3), cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize=3)
+
+
+@pytest.mark.skipif(not gradient_search.NUMBA_AVAILABLE, reason="numba not installed")
+class TestSobel:
+    """The numba _sobel must give the same gradients as cv2.Sobel, on the border too."""
+
+    @pytest.mark.parametrize("shape", [(1, 1), (1, 7), (7, 1), (2, 2), (3, 5), (48, 64), (121, 97)])
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_matches_cv2(self, shape, compiled):
+        sobel = gradient_search._sobel if compiled else gradient_search._sobel.py_func
+        image = np.random.default_rng(0).integers(0, 256, shape).astype(np.float32)
+        gx, gy = np.empty_like(image), np.empty_like(image)
+
+        sobel(image, gx, gy)
+
+        expected_gx, expected_gy = cv2_sobel(image)
+        np.testing.assert_array_equal(gx, expected_gx)
+        np.testing.assert_array_equal(gy, expected_gy)
+
+    def test_spot_on_border(self):
+        image = np.zeros((40, 60), dtype=np.float32)
+        image[-1, 30] = 255.0
+        image[15, 0] = 255.0
+
+        gx, gy = gradient_search.compute_gradients(image)
+
+        expected_gx, expected_gy = cv2_sobel(image)
+        np.testing.assert_array_equal(gx, expected_gx)
+        np.testing.assert_array_equal(gy, expected_gy)
+        # Lost when the border was zeroed
+        assert np.any(gx[-1] != 0) and np.any(gy[:, 0] != 0)
+
+    @pytest.mark.parametrize("picture", ["laser-11.jpg", "laser-4.png"])
+    def test_same_candidates_as_cv2(self, picture):
+        image = cv2.imread(str(ROOT / "pictures" / picture), cv2.IMREAD_GRAYSCALE)
+        assert image is not None
+
+        fused = [a.copy() for a in gradient_search.detect_laser_spots(image, R=10, Th=15)[:3]]
+        with patch.object(gradient_search, "NUMBA_AVAILABLE", False):
+            reference = gradient_search.detect_laser_spots(image, R=10, Th=15)[:3]
+
+        for actual, expected in zip(fused, reference):
+            np.testing.assert_array_equal(actual, expected)
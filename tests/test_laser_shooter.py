@@ -0,0 +1,269 @@
+"""
+Tests of the LaserShooter internals that do not need an ESP32: background sender, PID and UDP angles protocol.
+"""
+
+import importlib.util
+import socket
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from squid_game_doll.laser_shooter import ANGLES_RESEND_S, NUMBA_AVAILABLE, LaserShooter, _AxisPID, _pid_update
+
+
+def load_esp32_module(name: str):
+    """Imports a module of the esp32 firmware folder, which is not part of the package."""
+    path = Path(__file__).resolve().parent.parent / "esp32" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"esp32_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def shooter():
+    """LaserShooter without ESP32 connection (no limits, PID not initialized)."""
+    with (
+        patch("squid_game_doll.laser_shooter.LaserShooter.get_limits", return_value=None),
+        patch("squid_game_doll.laser_shooter.LaserShooter.init_PID", return_value=False),
+    ):
+        yield LaserShooter("127.0.0.1", enable_laser=False)
+
+
+class TestSenderLoop:
+    """Test the background sender thread of the *_async methods."""
+
+    def test_sender_survives_failing_command(self, shooter):
+        """A command raising an exception does not stop the sender thread."""
+        done = threading.Event()
+        received = []
+
+        def failing():
+            raise ValueError("boom")
+
+        def working(value):
+            received.append(value)
+            done.set()
+
+        shooter._LaserShooter__post_command(failing)
+        # Wait until the failing command has been taken by the sender, so it is not replaced
+        while not shooter._commands_queue.empty():
+            time.sleep(0.01)
+        shooter._LaserShooter__post_command(working, 42)
+
+        assert done.wait(timeout=2.0)
+        assert received == [42]
+        assert shooter._sender_thread.is_alive()
+
+
+class TestSendInstructions:
+    """Test the target computed by send_instructions from the direction flags."""
+
+    @pytest.mark.parametrize(
+        "flags, expected",
+        [
+            ((True, False, False, False), (90.0, 52.0)),
+            ((False, True, False, False), (90.0, 48.0)),
+            ((False, False, True, False), (93.0, 50.0)),
+            ((False, False, False, True), (87.0, 50.0)),
+            # One axis per update, the last flag wins
+            ((True, False, True, False), (93.0, 50.0)),
+            ((True, True, False, False), (90.0, 48.0)),
+            ((False, False, True, True), (87.0, 50.0)),
+        ],
+    )
+    def test_one_axis_per_update(self, shooter, flags, expected):
+        shooter.limits = ((0.0, 180.0), (0.0, 100.0))
+        with (
+            patch.object(shooter, "get_angles", return_value=(90.0, 50.0)),
+            patch.object(shooter, "send_angles", return_value=True) as send_angles,
+        ):
+            assert shooter.send_instructions(*flags, step_v=2.0, step_h=3.0)
+        send_angles.assert_called_once_with(expected)
+
+    def test_target_clamped_to_limits(self, shooter):
+        shooter.limits = ((0.0, 180.0), (0.0, 100.0))
+        with (
+            patch.object(shooter, "get_angles", return_value=(179.0, 50.0)),
+            patch.object(shooter, "send_angles", return_value=True) as send_angles,
+        ):
+            shooter.send_instructions(False, False, True, False, step_v=2.0, step_h=3.0)
+        send_angles.assert_called_once_with((180.0, 50.0))
+
+
+class FakeClock:
+    """Replaces laser_shooter.monotonic, the time is set by the test."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run_pid(pid, clock, steps):
+    """Feeds the (time, input) steps to the PID and returns its outputs."""
+    outputs = []
+    for now, input_ in steps:
+        clock.now = now
+        outputs.append(pid(input_))
+    return outputs
+
+
+class TestAxisPID:
+    """Test _AxisPID against the outputs of simple_pid 2.0.1 (setpoint 0) with the same clock."""
+
+    STEPS = [(100.5, 10.0), (101.0, 4.0), (101.25, -6.0), (102.0, 0.0)]
+
+    @pytest.fixture
+    def clock(self):
+        clock = FakeClock()
+        with patch("squid_game_doll.laser_shooter.monotonic", clock):
+            yield clock
+
+    def make_pid(self, kp, ki, kd, output_limits=(-100.0, 100.0), sample_time=0.0, starting_output=0.0):
+        return _AxisPID(
+            kp, ki, kd, output_limits=output_limits, sample_time=sample_time, starting_output=starting_output
+        )
+
+    def test_proportional(self, clock):
+        pid = self.make_pid(0.5, 0.0, 0.0)
+        assert run_pid(pid, clock, self.STEPS) == pytest.approx([-5.0, -2.0, 3.0, 0.0])
+
+    def test_integral(self, clock):
+        pid = self.make_pid(0.0, 1.0, 0.0)
+        assert run_pid(pid, clock, self.STEPS) == pytest.approx([-5.0, -7.0, -5.5, -5.5])
+
+    def test_derivative_on_measurement(self, clock):
+        pid = self.make_pid(0.0, 0.0, 0.2)
+        assert run_pid(pid, clock, self.STEPS) == pytest.approx([0.0, 2.4, 8.0, -1.6])
+
+    def test_output_limits(self, clock):
+        pid = self.make_pid(0.1, 0.06, 0.03, output_limits=(0.0, 180.0), starting_output=90.0)
+        steps = [(100.1, -2000.0), (100.2, -2000.0), (100.3, 5000.0)]
+        assert run_pid(pid, clock, steps) == pytest.approx([180.0, 180.0, 0.0])
+
+    def test_starting_output_clamped(self, clock):
+        pid = self.make_pid(0.0, 0.0, 0.0, output_limits=(0.0, 180.0), starting_output=250.0)
+        assert run_pid(pid, clock, [(100.5, 0.0)]) == pytest.approx([180.0])
+
+    def test_sample_time(self, clock):
+        pid = self.make_pid(0.1, 0.06, 0.03, output_limits=(0.0, 180.0), sample_time=0.1, starting_output=90.0)
+        # First call always computes, then the previous output is returned until sample_time has elapsed
+        steps = [(100.05, 20.0), (100.15, 20.0), (100.2, -30.0), (100.26, -30.0)]
+        assert run_pid(pid, clock, steps) == pytest.approx([87.94, 87.82, 87.82, 106.6543636363637])
+
+    def test_reset(self, clock):
+        pid = self.make_pid(0.1, 0.06, 0.03, sample_time=0.1, starting_output=50.0)
+        assert run_pid(pid, clock, [(100.5, 20.0)]) == pytest.approx([47.4])
+        clock.now = 101.0
+        pid.reset()
+        steps = [(101.05, 20.0), (101.5, 10.0)]
+        assert run_pid(pid, clock, steps) == pytest.approx([-2.06, -0.6633333333333359])
+
+
+class TestPIDUpdate:
+    """Test the two-axis _pid_update against two _AxisPID controllers fed with the same inputs."""
+
+    STEPS = [(100.05, 20.0, -5.0), (100.15, 20.0, -5.0), (100.2, -30.0, 8.0), (100.26, -30.0, 8.0), (100.5, 0.0, 400.0)]
+
+    @pytest.mark.parametrize(
+        "compiled",
+        [False, pytest.param(True, marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed"))],
+    )
+    def test_matches_axis_pid(self, compiled):
+        pid_update = _pid_update if compiled else getattr(_pid_update, "py_func", _pid_update)
+        clock = FakeClock()
+        with patch("squid_game_doll.laser_shooter.monotonic", clock):
+            pid_h = _AxisPID(0.1, 0.06, 0.03, output_limits=(0.0, 180.0), sample_time=0.1, starting_output=90.0)
+            pid_v = _AxisPID(0.1, 0.06, 0.03, output_limits=(20.0, 60.0), sample_time=0.1, starting_output=40.0)
+            # Same layout as LaserShooter.init_PID
+            pids = (pid_h, pid_v)
+            state = np.array([[pid._integral, pid._last_time, np.nan, np.nan] for pid in pids])
+            params = np.array([[pid.kp, pid.ki, pid.kd, pid.lower, pid.upper, pid.sample_time] for pid in pids])
+
+            for now, h_input, v_input in self.STEPS:
+                clock.now = now
+                expected = (pid_h(h_input), pid_v(v_input))
+                assert pid_update(state, params, h_input, v_input, now) == pytest.approx(expected)
+
+
+class TestAnglesProtocol:
+    """Test the angles sent by LaserShooter against the parsing of the ESP32 firmware (esp32/angles.py)."""
+
+    @pytest.fixture
+    def esp32_udp(self, shooter):
+        """UDP socket standing for the ESP32 listener, the shooter sends its angles to it."""
+        udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        udp.bind(("127.0.0.1", 0))
+        udp.settimeout(0.2)
+        shooter.port = udp.getsockname()[1]
+        yield udp
+        udp.close()
+
+    @pytest.fixture
+    def angles(self):
+        return load_esp32_module("angles")
+
+    @staticmethod
+    def received(udp) -> list:
+        """All the datagrams received so far."""
+        datagrams = []
+        try:
+            while True:
+                datagrams.append(udp.recv(64))
+        except socket.timeout:
+            return datagrams
+
+    def test_round_trip(self, shooter, esp32_udp, angles):
+        assert shooter.send_angles((91.234, 45.678))
+        (data,) = self.received(esp32_udp)
+        h, v = angles.parse_angles_datagram(data)
+        assert h == pytest.approx(91.23, abs=1e-4)
+        assert v == pytest.approx(45.68, abs=1e-4)
+
+    @pytest.fixture
+    def clock(self):
+        clock = FakeClock()
+        with patch("squid_game_doll.laser_shooter.monotonic", clock):
+            yield clock
+
+    def test_repeated_angles_skipped(self, shooter, esp32_udp, angles, clock):
+        assert shooter.send_angles((90.0, 45.0))
+        # Same datagram after rounding to 2 decimals, within the resend delay: nothing is sent
+        clock.now += ANGLES_RESEND_S / 2
+        assert shooter.send_angles((90.001, 44.999))
+        assert shooter.send_angles((95.0, 45.0))
+        assert shooter.send_angles((90.0, 45.0))
+        datagrams = [angles.parse_angles_datagram(data) for data in self.received(esp32_udp)]
+        assert datagrams == [(90.0, 45.0), (95.0, 45.0), (90.0, 45.0)]
+
+    def test_repeated_angles_resent(self, shooter, esp32_udp, angles, clock):
+        """A lost datagram is recovered: the same angles are sent again once the resend delay has passed."""
+        assert shooter.send_angles((90.0, 45.0))
+        self.received(esp32_udp)  # Lost on the way to the ESP32
+        clock.now += ANGLES_RESEND_S / 2
+        assert shooter.send_angles((90.0, 45.0))
+        assert self.received(esp32_udp) == []
+        clock.now += ANGLES_RESEND_S
+        assert shooter.send_angles((90.0, 45.0))
+        datagrams = [angles.parse_angles_datagram(data) for data in self.received(esp32_udp)]
+        assert datagrams == [(90.0, 45.0)]
+        # The resend restarts the delay
+        assert shooter.send_angles((90.0, 45.0))
+        assert self.received(esp32_udp) == []
+
+    @pytest.mark.parametrize("data", [b"", b"\x00" * 4, b"\x00" * 9, b"(90.0, 45.0)"])
+    def test_malformed_datagram(self, angles, data):
+        with pytest.raises(ValueError):
+            angles.parse_angles_datagram(data)
+
+    def test_tcp_message(self, shooter, angles):
+        message = shooter._LaserShooter__angles_message((91.234, 45.678))
+        assert angles.parse_angles(message) == (91.23, 45.68)
+        with pytest.raises(ValueError):
+            angles.parse_angles("(91.23)")
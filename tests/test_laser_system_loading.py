@@ -9,6 +9,7 @@ import pytest
 import os
 import pygame
 import numpy as np
+import cv2
 from unittest.mock import patch, MagicMock
 
 from squid_game_doll.laser_coordinate_filter import LaserCoordinateFilter
@@ -98,6 +99,55 @@ class TestLaserFinder:
         assert isinstance(result, tuple)
         assert len(result) == 2  # (coordinate, output_image)
 
+    def test_find_laser_peak(self):
+        """Test that a single bright red dot is found at its position."""
+        finder = LaserFinder(debug=True)
+
+        img = np.full((300, 400, 3), 40, dtype=np.uint8)
+        cv2.circle(img, (250, 120), 4, (0, 0, 255), -1)
+
+        coord, output = finder.find_laser(img, rects=[])
+        assert coord is not None
+        assert abs(coord[0] - 250) <= 1 and abs(coord[1] - 120) <= 1
+        assert output is not None
+
+    def test_find_laser_without_debug_output(self):
+        """Test that no output image is drawn unless debug is enabled."""
+        finder = LaserFinder()
+
+        img = np.full((300, 400, 3), 40, dtype=np.uint8)
+        cv2.circle(img, (250, 120), 4, (0, 0, 255), -1)
+
+        coord, output = finder.find_laser(img, rects=[])
+        assert coord is not None
+        assert output is None
+
+    def test_fast_path_miss_runs_each_strategy_once(self):
+        """Test that a missed fast path does not run the previous strategy again in the full sweep."""
+        finder = LaserFinder()
+        finder.laser_coord = (250, 120)
+        finder.prev_strategy = "find_laser_by_red_color"
+        finder.prev_threshold = 150
+
+        calls = []
+
+        def miss(name):
+            def strategy(img, max_tries):
+                calls.append((name, max_tries))
+                return (None, None)
+
+            strategy.__name__ = name
+            return strategy
+
+        with patch.object(finder, "find_laser_by_red_color", miss("find_laser_by_red_color")), patch.object(
+            finder, "find_laser_by_grayscale", miss("find_laser_by_grayscale")
+        ):
+            finder.find_laser(np.zeros((300, 400, 3), dtype=np.uint8), rects=[])
+
+        from squid_game_doll.laser_finder import FAST_PATH_TRIES, MAX_TRIES
+
+        assert calls == [("find_laser_by_red_color", FAST_PATH_TRIES), ("find_laser_by_grayscale", MAX_TRIES)]
+
 
 class TestLaserFinderNN:
     """Test LaserFinderNN class loading and functionality."""